@@ -1,16 +1,21 @@
 # -*- coding: utf-8 -*-
 
 import logging
-import copy
 from collections import OrderedDict
-import json
 
 from aserializer.fields import *
-from aserializer.utils import registry, options
+from aserializer.fields.base import BaseSerializerField
+from aserializer.utils import registry, options, plan, codegen, profiling, identity_map
+from aserializer.utils.cache import LRUCache
+from aserializer.utils.json_codecs import get_backend, iterencode_items, write_chunks
+from aserializer.utils.plan import SerializerPlan, FieldPlan, FieldFilter
 
 
 logger = logging.getLogger(__name__)
 
+FIELD_FILTER_CACHE_SIZE = 512
+_field_filter_cache = LRUCache(maxsize=FIELD_FILTER_CACHE_SIZE)
+
 
 def get_serializer_fields(bases, attrs):
     fields = [(field_name, attrs.pop(field_name)) for field_name, obj in list(py2to3.iteritems(attrs))
@@ -34,14 +39,37 @@ class SerializerBase(type):
             cls.add_field(new_class=new_class, name=field_name, field=field)
         setattr(new_class, '_base_fields', base_fields)
         setattr(new_class, '_meta', cls.get_meta_options_cls()(meta))
+        cls.prepare_class(new_class)
+        cls.compile_plan(new_class)
         if getattr(new_class, 'with_registry', False):
             registry.register_serializer(new_class.__name__, new_class)
         return new_class
 
+    def __setattr__(cls, name, value):
+        super(SerializerBase, cls).__setattr__(name, value)
+        if name in ('_plan', '_fieldnames_cache'):
+            return
+        if '_fieldnames_cache' in cls.__dict__:
+            delattr(cls, '_fieldnames_cache')
+        if '_plan' in cls.__dict__ and (callable(value) or isinstance(value, BaseSerializerField)):
+            type(cls).compile_plan(cls)
+
     @classmethod
     def get_meta_options_cls(cls):
         return options.SerializerMetaOptions
 
+    @classmethod
+    def prepare_class(cls, new_class):
+        """
+        This method is called with the new class before its plan is compiled, fields set on the class here are
+        compiled into the plan once.
+        """
+        pass
+
+    @classmethod
+    def compile_plan(cls, new_class):
+        setattr(new_class, '_plan', SerializerPlan(new_class, new_class._base_fields))
+
     @classmethod
     def add_field(cls, new_class, name, field):
         field.add_name(name)
@@ -58,26 +86,38 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
     }
 
     def __init__(self, source=None, fields=None, exclude=None, unknown_error=False, **extras):
-        self.fields = copy.deepcopy(self._base_fields)
-        self._data = self.fields
+        self._configure(fields=fields, exclude=exclude, unknown_error=unknown_error, extras=extras)
+        self._setup_fields()
+        self.initial(source=source)
+
+    def _configure(self, fields, exclude, unknown_error, extras):
+        """
+        This method sets the configuration of the serializer instance, it is shared by the instances of build_many.
+        """
         fields = fields or self._meta.fields
         exclude = exclude or self._meta.exclude
-        if fields:
-            self.fields = self.filter_fields(only_fields=fields)
-        if exclude:
-            self.fields = self.exclude_fields(exclude=exclude)
+        self._field_filter = self.get_field_filter(fields=fields, exclude=exclude)
         self._extras = extras
         self.__show_field_list = fields or []
         self.__exclude_field_list = exclude or []
         self._handle_unknown_error = unknown_error
+        self._compiled = self.get_compiled(self._field_filter)
+
+    def _setup_fields(self):
+        """
+        This method creates the fields and the parser of the serializer instance.
+        """
+        self._data = self._base_fields.copy()
+        for name, field in self._base_fields.items():
+            self._data[name] = field.clone()
+        self.fields = self._data
+        if self._field_filter.names is not None:
+            self.fields = OrderedDict([(name, self._data[name]) for name in self._field_filter.names])
         # TODO: Check if the exclude field_name also including the map_field_name
-        field_names = []
-        for k, v in self.fields.items():
-            field_names.append(k)
-            if v.map_field:
-                field_names.append(v.map_field)
-        self.parser = self._meta.parser(fields=field_names)
-        self.initial(source=source)
+        self.parser = self._meta.parser(fields=self._field_filter.parser_fields,
+                                        json_backend=self._meta.json_backend)
+        if profiling.is_enabled():
+            profiling.instrument(self)
 
     def __iter__(self):
         self.to_dict()
@@ -89,13 +129,65 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
     def __setitem__(self, key, value):
         setattr(self, key, value)
 
+    @classmethod
+    def get_field_filter(cls, fields=None, exclude=None):
+        """
+        This method returns the resolved field filter for the fields and exclude arguments.
+        The result is cached per serializer class and arguments.
+        """
+        try:
+            key = (cls, tuple(fields or ()), tuple(exclude or ()))
+            field_filter = _field_filter_cache.get(key)
+        except TypeError:
+            return FieldFilter(cls._base_fields, only_fields=fields, exclude=exclude)
+        if field_filter is None:
+            field_filter = FieldFilter(cls._base_fields, only_fields=fields, exclude=exclude)
+            _field_filter_cache.set(key, field_filter)
+        return field_filter
+
+    @classmethod
+    def get_compiled(cls, field_filter):
+        """
+        This method returns the generated functions for the field filter if the compiled mode is enabled by the meta
+        option or the global default, otherwise None. The compiled mode is not used while profiling is enabled.
+        """
+        if profiling.is_enabled():
+            return None
+        compiled = cls._meta.compiled
+        if compiled is None:
+            compiled = codegen.get_compiled_default()
+        if not compiled:
+            return None
+        return codegen.get_compiled(cls, field_filter)
+
     @classmethod
     def get_fieldnames(cls, seen=None):
         """
         This method returns the map field names of the serializer object including nested field names.
+        The result is computed once per class, the returned dictionary should not be modified.
         """
         if seen is None:
-            seen = {}
+            return cls._get_fieldnames_cache()[0]
+        return cls._collect_fieldnames(seen=seen)
+
+    @classmethod
+    def get_fieldname_set(cls):
+        """
+        This method returns the field names of the serializer object including nested field names as a frozenset.
+        """
+        return cls._get_fieldnames_cache()[1]
+
+    @classmethod
+    def _get_fieldnames_cache(cls):
+        fieldnames_cache = cls.__dict__.get('_fieldnames_cache')
+        if fieldnames_cache is None:
+            fieldnames = cls._collect_fieldnames(seen={})
+            fieldnames_cache = (fieldnames, frozenset(fieldnames))
+            cls._fieldnames_cache = fieldnames_cache
+        return fieldnames_cache
+
+    @classmethod
+    def _collect_fieldnames(cls, seen):
         result = []
         for name, field in cls._base_fields.items():
             map_field_name = field.map_field or name
@@ -112,6 +204,83 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
                                    u'{}.{}'.format(map_field_name, nested_map_field_name)))
         return OrderedDict(result)
 
+    @classmethod
+    def _has_own_init(cls):
+        for klass in cls.__mro__:
+            if klass is Serializer:
+                return False
+            if '__init__' in klass.__dict__:
+                return True
+        return False
+
+    @classmethod
+    def build_many(cls, sources, fields=None, exclude=None, unknown_error=False, **extras):
+        """
+        This method returns a list with a new serializer instance initialized with each source.
+        The field filter, the parser configuration and the compiled functions are resolved once for the whole list,
+        every instance gets its own fields and parser. Serializers overriding __init__ are created one by one.
+        """
+        if cls._has_own_init():
+            return [cls(source=source, fields=fields, exclude=exclude, unknown_error=unknown_error, **extras)
+                    for source in sources]
+        prototype = cls.__new__(cls)
+        prototype._configure(fields=fields, exclude=exclude, unknown_error=unknown_error, extras=extras)
+        return [prototype._new_from_prototype(source) for source in sources]
+
+    def _new_from_prototype(self, source):
+        """
+        This method returns a new serializer instance with the configuration of this instance initialized with the
+        source.
+        """
+        serializer = self.__class__.__new__(self.__class__)
+        serializer.__dict__.update(self.__dict__)
+        serializer._setup_fields()
+        serializer.initial(source=source)
+        return serializer
+
+    @classmethod
+    def _iter_many(cls, sources, fields=None, exclude=None, unknown_error=False, **extras):
+        """
+        This method yields one serializer instance initialized with each source in turn.
+        The instance is created once and reset for every source, serializers overriding __init__ are created one by
+        one.
+        """
+        if cls._has_own_init():
+            for source in sources:
+                yield cls(source=source, fields=fields, exclude=exclude, unknown_error=unknown_error, **extras)
+            return
+        serializer = cls(fields=fields, exclude=exclude, unknown_error=unknown_error, **extras)
+        for source in sources:
+            serializer.reset(source)
+            yield serializer
+
+    @classmethod
+    def dump_many(cls, sources, fields=None, exclude=None, unknown_error=False, **extras):
+        """
+        This method returns a list with the dump of every source.
+        The field filter, the parser and the hook lookups are resolved once for the whole batch.
+        """
+        return [serializer.dump() for serializer in cls._iter_many(sources, fields=fields, exclude=exclude,
+                                                                   unknown_error=unknown_error, **extras)]
+
+    @classmethod
+    def to_dict_many(cls, sources, fields=None, exclude=None, unknown_error=False, **extras):
+        """
+        This method returns a list with the python dictionary of every source.
+        """
+        return [serializer.to_dict() for serializer in cls._iter_many(sources, fields=fields, exclude=exclude,
+                                                                      unknown_error=unknown_error, **extras)]
+
+    @classmethod
+    def iter_json_many(cls, sources, indent=None, fields=None, exclude=None, unknown_error=False, **extras):
+        """
+        This method returns an iterator over the chunks of the json list of the source dumps.
+        The sources are serialized and encoded one by one, the joined chunks are the json of dump_many.
+        """
+        dumps = (serializer.dump() for serializer in cls._iter_many(sources, fields=fields, exclude=exclude,
+                                                                    unknown_error=unknown_error, **extras))
+        return iterencode_items(get_backend(cls._meta.json_backend), dumps, indent=indent)
+
     @property
     def obj(self):
         return self.parser.obj
@@ -124,6 +293,8 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
         """
         The initial method is preparing the serializer and is setting the source values to the fields
         """
+        if self._compiled is not None:
+            return self._compiled.initial(self, source)
         self._errors = None
         self._dict_data = None
         self._dump_data = None
@@ -139,46 +310,56 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
             else:
                 continue
             if isinstance(field, SerializerObjectField):
-                only_fields, exclude = self.get_fields_and_exclude_for_nested(field_name)
+                if field_name in self._field_filter.nested:
+                    only_fields, exclude = self._field_filter.nested[field_name]
+                else:
+                    only_fields, exclude = self.get_fields_and_exclude_for_nested(field_name)
                 field.pre_value(fields=only_fields,
                                 exclude=exclude,
                                 unknown_error=self._handle_unknown_error, **self._extras)
+            field_plan = self._field_plan(field_name, field)
+            if field_plan.deferred:
+                field.defer_value(self.parser.get_object_value, self.parser.obj, _name)
+                field.ignore = False
+                continue
             try:
                 value = self.parser.get_value(_name)
-                field.set_value(self.clean_field_value(field_name, value))
+                if field_plan.clean_value is not None:
+                    value = getattr(self, field_plan.clean_value)(value)
+                field.set_value(value)
             except IgnoreField:
                 field.ignore = True
             else:
                 field.ignore = False
 
+    def reset(self, source=None):
+        """
+        This method renews the state of the serializer fields and initials the serializer with a new source.
+        The filtered fields and the parser of the instance are kept.
+        """
+        fields = OrderedDict()
+        for field_name in self.fields:
+            fields[field_name] = self._base_fields[field_name].clone()
+        self._data.update(fields)
+        self.fields = fields
+        if profiling.is_enabled():
+            profiling.instrument(self)
+        self.initial(source=source)
+
     def get_fields_and_exclude_for_nested(self, field_name):
-        field_prefix = '{}.'.format(field_name)
-        only = ['.'.join(field.split('.')[1:]) for field in self.__show_field_list
-                if str(field).startswith(field_prefix)] or None
-        exclude = ['.'.join(field.split('.')[1:]) for field in self.__exclude_field_list
-                   if str(field).startswith(field_prefix)] or None
-        return only, exclude
+        return plan.get_fields_and_exclude_for_nested(field_name, self.__show_field_list, self.__exclude_field_list)
 
     def filter_fields(self, only_fields):
         """
         This method filter the current serializer fields dictionary by the list of field names.
         """
-        field_names = self.fields.keys()
-        only_fields = [str(field_name).split('.')[0] for field_name in only_fields]
-        only_fields = list(filter(lambda x: x in field_names, only_fields))
-        if len(only_fields) <= 0:
-            return self.fields
-        return OrderedDict(filter(lambda x: x[1].identity or x[0] in only_fields, self.fields.items()))
+        return plan.filter_fields(self.fields, only_fields)
 
     def exclude_fields(self, exclude):
         """
         This method excluding the current serializer fields dictionary by the list of field names.
         """
-        field_names = self.fields.keys()
-        exclude = list(filter(lambda field_name: field_name in field_names, exclude))
-        if len(exclude) <= 0:
-            return self.fields
-        return OrderedDict(filter(lambda x: x[1].identity or not x[0] in exclude, self.fields.items()))
+        return plan.exclude_fields(self.fields, exclude)
 
     def has_method(self, method_name):
         _method = getattr(self, method_name, None)
@@ -201,36 +382,34 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
         """
         self._errors = {}
         attributes = self.parser.attributes_for_serializer
-        attributes_for_unknown_error_handling = self.parser.all_attributes if self._handle_unknown_error else []
+        all_attributes = self.parser.all_attributes if self._handle_unknown_error else []
+        all_attribute_set = set(all_attributes)
+        known_attributes = set()
         for field_name, field in self.fields.items():
             if field.identity and field_name not in attributes:
                 continue
             label = field_name
             if field_name in attributes or field.map_field in attributes:
+                field_plan = self._field_plan(field_name, field)
                 try:
                     field.validate()
-                    self._custom_field_validation(field)
+                    for method_name in field_plan.validate:
+                        getattr(self, method_name)(field.to_python())
                 except SerializerFieldValueError as e:
                     self._errors[label] = e.errors
-                if self._handle_unknown_error:
-                    if field_name in attributes_for_unknown_error_handling:
-                        attributes_for_unknown_error_handling.remove(field_name)
-                    elif field.map_field in attributes_for_unknown_error_handling:
-                        attributes_for_unknown_error_handling.remove(field.map_field)
+                if field_name in all_attribute_set:
+                    known_attributes.add(field_name)
+                elif field.map_field in all_attribute_set:
+                    known_attributes.add(field.map_field)
             elif field.required:
                 if field.has_default:
                     continue
                 self._errors[label] = field.error_messages['required']
-        for attr in attributes_for_unknown_error_handling:
-            if attr not in self.get_fieldnames():
-                self._errors[attr] = self.error_messages['unknown']
-
-    def _custom_field_validation(self, field):
-        for name in field.names:
-            method_name = '{}_validate'.format(name)
-            _method = getattr(self, method_name, None)
-            if callable(_method):
-                _method(field.to_python())
+        if all_attribute_set:
+            unknown_attributes = all_attribute_set - known_attributes - self.get_fieldname_set()
+            for attr in all_attributes:
+                if attr in unknown_attributes:
+                    self._errors[attr] = self.error_messages['unknown']
 
     def update_field(self, field):
         """
@@ -261,11 +440,20 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
         """
         This method calls a custom clean_value method if it exists before the value is set to the field object.
         """
-        method_name = '{}_clean_value'.format(field_name)
-        if self.has_method(method_name):
+        method_name = self._plan.clean_value_hooks.get(field_name)
+        if method_name is not None:
             return getattr(self, method_name)(value)
         return value
 
+    def _field_plan(self, field_name, field):
+        """
+        This method returns the compiled plan of a field. Fields unknown to the class plan get a plan on the fly.
+        """
+        field_plan = self._plan.fields.get(field_name)
+        if field_plan is None:
+            field_plan = FieldPlan(self.__class__, field_name, field)
+        return field_plan
+
     @property
     def errors(self):
         """
@@ -276,7 +464,7 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
         return self._errors
 
     def errors_to_json(self, indent=None):
-        return json.dumps(self.errors, indent=indent)
+        return get_backend(self._meta.json_backend).dumps(self.errors, indent=indent)
 
     def is_valid(self):
         """
@@ -292,35 +480,65 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
         Returns a dictionary with the field values for the python env.
         It ignores fields by the IgnoreField exception.
         """
+        if self._compiled is not None:
+            return self._compiled.to_dict(self)
         if self._dict_data is None:
             self._dict_data = dict()
             for field_name, field in self.fields.items():
-                _name = field.map_field or field_name
+                field_plan = self._field_plan(field_name, field)
                 try:
-                    self._dict_data[_name] = self._field_to_python(field_name, field)
+                    if field_plan.to_python is not None:
+                        value = getattr(self, field_plan.to_python)(field)
+                    else:
+                        value = field.to_python()
                 except IgnoreField:
-                    pass
+                    continue
+                self._dict_data[field_plan.python_name] = value
         return self._dict_data
 
     def dump(self):
         """
         This method returns a dictionary with the field values for a serialization (i.e. json.dumps)
         It ignores fields by the IgnoreField exception and if the field is an action filed.
+        With the identity_map option the dump of a nested serializer is reused for repeated nested objects.
         """
+        if self._meta.identity_map and identity_map.get_identities() is None:
+            with identity_map.scope():
+                return self.dump()
+        if self._compiled is not None:
+            return self._compiled.dump(self)
         if self._dump_data is None:
             self._dump_data = dict()
             for field_name, field in self.fields.items():
-                if field.action_field:
+                field_plan = self._field_plan(field_name, field)
+                if field_plan.action_field:
                     continue
                 try:
-                    self._dump_data[field_name] = self._field_to_native(field_name, field)
+                    if field_plan.to_native is not None:
+                        value = getattr(self, field_plan.to_native)(field)
+                    else:
+                        value = field.to_native()
                 except IgnoreField:
-                    pass
+                    continue
+                self._dump_data[field_name] = value
         return self._dump_data
 
     def to_json(self, indent=None):
         dump = self.dump()
-        return json.dumps(dump, indent=indent)
+        return get_backend(self._meta.json_backend).dumps(dump, indent=indent)
+
+    def iter_json(self, indent=None):
+        """
+        This method returns an iterator over the json chunks of the serializer, the joined chunks are the result of
+        to_json.
+        """
+        return iter([self.to_json(indent=indent)])
+
+    def to_json_stream(self, fp, indent=None, encoding=None):
+        """
+        This method writes the json of the serializer to a file-like object.
+        """
+        write_chunks(fp, self.iter_json(indent=indent), encoding=encoding)
 
     def _field_to_python(self, field_name, field):
         """
@@ -328,11 +546,10 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
         otherwise returns the result of the field method.
         i.g. for the field with the key 'name' def name_to_python(field):
         """
-        method_name = '{}_to_python'.format(field_name)
-        if self.has_method(method_name):
-            return self._custom_field_method(method_name, field)
-        else:
-            return field.to_python()
+        field_plan = self._field_plan(field_name, field)
+        if field_plan.to_python is not None:
+            return getattr(self, field_plan.to_python)(field)
+        return field.to_python()
 
     def _field_to_native(self, field_name, field):
         """
@@ -340,11 +557,10 @@ class Serializer(py2to3.with_metaclass(SerializerBase)):
         otherwise returns the result of the field method.
         i.g. for the field with the key 'name' def name_to_native(field):
         """
-        method_name = '{}_to_native'.format(field_name)
-        if self.has_method(method_name):
-            return self._custom_field_method(method_name, field)
-        else:
-            return field.to_native()
+        field_plan = self._field_plan(field_name, field)
+        if field_plan.to_native is not None:
+            return getattr(self, field_plan.to_native)(field)
+        return field.to_native()
 
     def set_value(self, field_name, value):
         setattr(self, field_name, value)
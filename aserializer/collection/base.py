@@ -1,9 +1,128 @@
 # -*- coding: utf-8 -*-
+import heapq
+from functools import cmp_to_key
+from itertools import islice
 
-import json
-
-from aserializer.utils import py2to3, registry, options
+from aserializer.utils import py2to3, registry, options, identity_map
 from aserializer.base import Serializer
+from aserializer.utils.json_codecs import get_backend, iterencode_items, write_chunks
+
+
+# The page of a sorted collection is selected with a heap if it is at most a tenth of the objects, a full sort is
+# faster for larger pages.
+TOP_K_RATIO = 10
+
+
+def get_sort_value(item, name):
+    if isinstance(item, dict):
+        return item.get(name, None)
+    return getattr(item, name, None)
+
+
+def parse_sort(sort):
+    """
+    Returns the list of (name, reverse) tuples of a sort list, a name with a '-' prefix is sorted in descending order.
+    """
+    result = []
+    for name in sort:
+        if name.startswith('-'):
+            result.append((name[1:], True))
+        else:
+            result.append((name, False))
+    return result
+
+
+def compare_sort_values(values, other_values, reverse_flags):
+    for value, other_value, reverse in zip(values, other_values, reverse_flags):
+        if value < other_value:
+            return 1 if reverse else -1
+        if other_value < value:
+            return -1 if reverse else 1
+    return 0
+
+
+def get_descending_ranks(values):
+    """
+    Returns the negated dense rank of every value, the ranks sort ascending like the values sort descending.
+    None is returned for values which are not hashable or not comparable.
+    """
+    try:
+        ranks = dict((value, -rank) for rank, value in enumerate(sorted(set(values))))
+    except TypeError:
+        return None
+    return [ranks[value] for value in values]
+
+
+def get_sort_keys(objects, sort):
+    """
+    Returns the composite sort key of every object and the reverse flag for a list of (name, reverse) tuples. The
+    values of all sort fields are read once. If the directions are mixed the descending values are replaced by their
+    ranks, values without ranks are compared field by field.
+    """
+    columns = [[get_sort_value(item, name) for item in objects] for name, _ in sort]
+    reverse_flags = [reverse for _, reverse in sort]
+    if len(columns) == 1:
+        return columns[0], reverse_flags[0]
+    if len(set(reverse_flags)) == 1:
+        return list(zip(*columns)), reverse_flags[0]
+    for index, reverse in enumerate(reverse_flags):
+        if reverse:
+            ranks = get_descending_ranks(columns[index])
+            if ranks is None:
+                values_key = cmp_to_key(lambda values, other_values: compare_sort_values(values, other_values,
+                                                                                         reverse_flags))
+                return [values_key(values) for values in zip(*columns)], False
+            columns[index] = ranks
+    return list(zip(*columns)), False
+
+
+def sort_objects(objects, sort, count=None):
+    """
+    Returns the objects sorted by a list of (name, reverse) tuples, the sort is stable. If a count is given only the
+    first count objects are returned. A count which is small compared to the objects is selected with a heap on the
+    composite keys in a single pass, otherwise the objects are sorted per key, which is faster for a full sort.
+    """
+    if not isinstance(objects, (list, tuple)):
+        objects = list(objects)
+    if count is not None and 0 <= count and count * TOP_K_RATIO <= len(objects):
+        keys, reverse = get_sort_keys(objects, sort)
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return [objects[index] for index in select(count, range(len(objects)), key=keys.__getitem__)]
+    for name, reverse in reversed(sort):
+        objects = sorted(objects, key=lambda item: get_sort_value(item, name), reverse=reverse)
+    return objects
+
+
+def has_length(objects):
+    return hasattr(objects, '__len__')
+
+
+class CountingIterator(object):
+    """
+    An iterator over an iterable which counts the consumed objects.
+    """
+
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self.consumed = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        obj = next(self._iterator)
+        self.consumed += 1
+        return obj
+
+    next = __next__
+
+    def exhaust(self):
+        """
+        Consumes the remaining objects without keeping them and returns the number of all objects.
+        """
+        for _ in self._iterator:
+            self.consumed += 1
+        return self.consumed
 
 
 class CollectionBase(type):
@@ -32,7 +151,7 @@ class CollectionSerializer(py2to3.with_metaclass(CollectionBase)):
         limit_key = 'limit'
         total_count_key = 'totalCount'
 
-    def __init__(self, objects, fields=None, exclude=None, sort=None, limit=None, offset=None, **extras):
+    def __init__(self, objects, fields=None, exclude=None, sort=None, limit=None, offset=None, count=None, **extras):
         self.pre_initial(objects)
         self.ITEM_SERIALIZER_CLS = self._meta.serializer or self.ITEM_SERIALIZER_CLS
         self._serializer_cls = registry.get_serializer(self.ITEM_SERIALIZER_CLS)
@@ -44,12 +163,17 @@ class CollectionSerializer(py2to3.with_metaclass(CollectionBase)):
         self._sort = sort or self._meta.sort
         self._limit = limit or 10
         self._offset = offset or 0
+        self._count = count
         self.with_metadata = self._meta.with_metadata
         self._extras = extras
+        self._item_serializer = None
         self.handle_extras(extras=self._extras)
 
     def __len__(self):
-        return len(self.objects)
+        total_count = self.get_total_count(self.objects)
+        if total_count is None:
+            raise TypeError('The number of objects of an iterable is known after the dump or by the count argument.')
+        return total_count
 
     def pre_initial(self, objects):
         pass
@@ -57,8 +181,21 @@ class CollectionSerializer(py2to3.with_metaclass(CollectionBase)):
     def handle_extras(self, extras):
         pass
 
+    def get_total_count(self, objects):
+        """
+        This method returns the number of objects. It is the count argument, the result of the count argument if it is
+        callable, or the length of the objects. For an iterable without length and count None is returned.
+        """
+        if self._count is not None:
+            if callable(self._count):
+                self._count = self._count()
+            return self._count
+        if has_length(objects):
+            return len(objects)
+        return None
+
     def metadata(self, objects):
-        total_count = len(objects)
+        total_count = self.get_total_count(objects)
         if self._offset > total_count:
             self._offset = total_count
         if self._offset >= total_count:
@@ -69,8 +206,21 @@ class CollectionSerializer(py2to3.with_metaclass(CollectionBase)):
         _metadata[self._meta.total_count_key] = total_count
         return _metadata
 
+    def get_item_serializer(self, obj):
+        """
+        This method returns the item serializer initialized with the object.
+        The serializer is created with the first item and reset for the following items, serializers overriding
+        __init__ are created for every item.
+        """
+        if self._item_serializer is None or self._serializer_cls._has_own_init():
+            self._item_serializer = self._serializer_cls(source=obj, fields=self._fields, exclude=self._exclude,
+                                                         **self._extras)
+        else:
+            self._item_serializer.reset(obj)
+        return self._item_serializer
+
     def item(self, obj):
-        _serializer = self._serializer_cls(source=obj, fields=self._fields, exclude=self._exclude, **self._extras)
+        _serializer = self.get_item_serializer(obj)
         if self._meta.validation:
             if not _serializer.is_valid():
                 return {}
@@ -85,18 +235,19 @@ class CollectionSerializer(py2to3.with_metaclass(CollectionBase)):
         except Exception:
             limit = None
         if sort:
-            def get_key(item, k):
-                if isinstance(item, dict):
-                    return item.get(k, None)
-                return getattr(item, k, None)
             if not isinstance(sort, list):
                 sort = [py2to3._unicode(sort)]
-            for s in reversed(sort):
-                reverse = False
-                if s.startswith('-'):
-                    reverse = True
-                    s = s[1:]
-                objects = list(sorted(objects, key=lambda item: get_key(item, s), reverse=reverse))
+            count = offset + limit if limit and offset >= 0 else None
+            objects = sort_objects(objects, parse_sort(sort), count=count)
+        elif not has_length(objects):
+            if limit is None:
+                return objects
+            if not limit:
+                # The metadata sets the limit to 0 for an offset after the end of the counted objects.
+                return iter(())
+            if offset >= 0:
+                return islice(objects, offset, offset + limit)
+            objects = list(objects)
         try:
             if limit:
                 objects = objects[offset:(offset + limit)]
@@ -105,14 +256,33 @@ class CollectionSerializer(py2to3.with_metaclass(CollectionBase)):
         else:
             return objects
 
-    def _items(self, objects):
+    def _iter_items(self, objects):
         objects = self._pre(objects=objects, limit=self._limit, offset=self._offset, sort=self._sort)
-        return list(map(lambda o: self.item(obj=o), objects))
+        for obj in objects:
+            yield self.item(obj=obj)
+
+    def _items(self, objects):
+        return list(self._iter_items(objects))
+
+    def _count_items(self, objects):
+        """
+        This method returns the items and the metadata of an iterable without length and count. The objects of the
+        page are serialized first, the remaining objects are counted without keeping them.
+        """
+        objects = CountingIterator(objects)
+        items = self._items(objects)
+        self._count = objects.exhaust()
+        return items, self.metadata(objects)
 
     def _generate(self, objects):
         if hasattr(self, 'result'):
             return self.result
-        if self.with_metadata:
+        if self.with_metadata and self._count is None and not has_length(objects):
+            items, metadata = self._count_items(objects)
+            self.result = dict()
+            self.result[self._meta.metadata_key] = metadata
+            self.result[self._meta.items_key] = items
+        elif self.with_metadata:
             self.result = dict()
             self.result[self._meta.metadata_key] = self.metadata(objects)
             self.result[self._meta.items_key] = self._items(objects)
@@ -120,9 +290,61 @@ class CollectionSerializer(py2to3.with_metaclass(CollectionBase)):
             self.result = self._items(objects)
 
     def dump(self):
-        self._generate(self.objects)
+        if self._meta.identity_map:
+            with identity_map.scope():
+                self._generate(self.objects)
+        else:
+            self._generate(self.objects)
         return self.result
 
     def to_json(self, indent=None):
         dump = self.dump()
-        return json.dumps(dump, indent=indent)
+        return get_backend(self._meta.json_backend).dumps(dump, indent=indent)
+
+    def iter_json(self, indent=None):
+        """
+        This method returns an iterator over the json chunks of the collection. The items are serialized and encoded
+        one by one and are not kept in memory, the joined chunks are the result of to_json.
+        """
+        if self._meta.identity_map:
+            return identity_map.iter_scoped(self._iter_json, indent=indent)
+        return self._iter_json(indent=indent)
+
+    def _iter_json(self, indent=None):
+        metadata = None
+        if hasattr(self, 'result'):
+            if self.with_metadata:
+                metadata = self.result[self._meta.metadata_key]
+                items = self.result[self._meta.items_key]
+            else:
+                items = self.result
+        elif self.with_metadata and self._count is None and not has_length(self.objects):
+            items, metadata = self._count_items(self.objects)
+        else:
+            if self.with_metadata:
+                metadata = self.metadata(self.objects)
+            items = self._iter_items(self.objects)
+        return iterencode_items(get_backend(self._meta.json_backend), items, container=self.get_container(metadata),
+                                indent=indent)
+
+    def get_container(self, metadata):
+        """
+        This method returns the function which puts the items into the dictionary with the metadata, or None if the
+        collection is dumped without metadata.
+        """
+        if not self.with_metadata:
+            return None
+
+        def container(values):
+            envelope = dict()
+            envelope[self._meta.metadata_key] = metadata
+            envelope[self._meta.items_key] = values
+            return envelope
+        return container
+
+    def to_json_stream(self, fp, indent=None, encoding=None):
+        """
+        This method writes the json of the collection to a file-like object, i.e. a file or socket.makefile().
+        The encoding is needed for files opened in binary mode.
+        """
+        write_chunks(fp, self.iter_json(indent=indent), encoding=encoding)
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
+import time
 
 from aserializer.utils import py2to3
+from aserializer.utils.cache import LRUCache
 from aserializer.collection.base import CollectionSerializer
 from aserializer.django.mixins import DjangoRequestMixin
+from aserializer.django import cursor as cursors, related
 from aserializer.django.utils import django_required, get_django_model_field_list
 
 try:
@@ -11,21 +14,114 @@ except ImportError:
     QuerySet = None
 
 
+COUNT_EXACT = 'exact'
+COUNT_NONE = 'none'
+COUNT_CACHED = 'cached'
+COUNT_HAS_MORE = 'has_more'
+COUNT_MODES = (COUNT_EXACT, COUNT_NONE, COUNT_CACHED, COUNT_HAS_MORE)
+
+COUNT_CACHE_SIZE = 256
+count_cache = LRUCache(maxsize=COUNT_CACHE_SIZE)
+
+timer = getattr(time, 'monotonic', time.time)
+
+
+def check_count_mode(count_mode):
+    if count_mode not in COUNT_MODES:
+        raise ValueError('Unknown count mode {}, use one of {}.'.format(count_mode, ', '.join(COUNT_MODES)))
+    return count_mode
+
+
+def get_count_cache_key(objects):
+    sql, params = objects.query.sql_with_params()
+    return objects.db, sql, tuple(params)
+
+
+def get_cached_count(objects, ttl):
+    """
+    Returns the count of a queryset from the count cache. The entries are keyed by the database alias, the SQL and
+    the params of the query and expire after ttl seconds. Queries without SQL (i.e. of an empty queryset) are counted
+    without the cache.
+    """
+    try:
+        key = get_count_cache_key(objects)
+        hash(key)
+    except Exception:
+        return objects.count()
+    now = timer()
+    entry = count_cache.get(key)
+    if entry is not None and entry[1] > now:
+        return entry[0]
+    total_count = objects.count()
+    count_cache.set(key, (total_count, now + ttl))
+    return total_count
+
+
 class DjangoCollectionSerializer(DjangoRequestMixin, CollectionSerializer):
+    COUNT_MODES = COUNT_MODES
+
+    def __init__(self, objects, *args, **kwargs):
+        self._cursor = kwargs.pop('cursor', None)
+        self._cursor_page = None
+        self._count_mode = kwargs.pop('count_mode', None)
+        if self._count_mode is not None:
+            check_count_mode(self._count_mode)
+        self._page = None
+        self._has_more = False
+        super(DjangoCollectionSerializer, self).__init__(objects, *args, **kwargs)
+        if self._meta.project_columns:
+            self.objects = self.with_only(self.objects)
+
     @django_required()
     def pre_initial(self, objects):
         if not isinstance(objects, QuerySet):
             raise ValueError('Can only handle a django queryset.')
 
+    def get_count_mode(self):
+        return check_count_mode(self._count_mode or self._meta.count_mode)
+
+    def get_total_count(self, objects):
+        """
+        This method returns the number of objects by the count mode. It is None for the none and has_more modes, the
+        cached mode reuses the count of the same query for count_cache_ttl seconds.
+        """
+        count_mode = self.get_count_mode()
+        if count_mode in (COUNT_NONE, COUNT_HAS_MORE):
+            return None
+        if self._count is not None:
+            return super(DjangoCollectionSerializer, self).get_total_count(objects)
+        if count_mode == COUNT_CACHED:
+            return get_cached_count(objects, self._meta.count_cache_ttl)
+        return objects.count()
+
+    def has_objects(self, objects):
+        """
+        This method returns False for an empty queryset. The queryset is only evaluated for this in the exact count
+        mode, where it is evaluated for the count anyway.
+        """
+        if self.get_count_mode() == COUNT_EXACT:
+            return bool(objects)
+        return objects is not None
+
     def metadata(self, objects):
-        if objects:
-            total_count = objects.count()
+        if self._meta.cursor_pagination:
+            return self.cursor_metadata(objects)
+        count_mode = self.get_count_mode()
+        if count_mode == COUNT_EXACT and self._count is None:
+            if objects:
+                total_count = objects.count()
+            else:
+                total_count = 0
         else:
-            total_count = 0
+            total_count = self.get_total_count(objects)
         _metadata = {}
         _metadata[self._meta.offset_key] = self._offset or 0
         _metadata[self._meta.limit_key] = self._limit or total_count
         _metadata[self._meta.total_count_key] = total_count
+        if count_mode == COUNT_HAS_MORE:
+            if self._page is None:
+                self._pre(objects, limit=self._limit, offset=self._offset, sort=self._sort)
+            _metadata[self._meta.has_more_key] = self._has_more
         return _metadata
 
     def _pre(self, objects, limit=None, offset=None, sort=None):
@@ -38,9 +134,70 @@ class DjangoCollectionSerializer(DjangoRequestMixin, CollectionSerializer):
             limit = None
         if sort is not None and not isinstance(sort, list):
             sort = [str(sort)]
+        if self._meta.cursor_pagination:
+            return self.get_cursor_page(objects, limit=limit, sort=sort)[0]
+        if self._page is not None:
+            return self._page
+        model = objects.model
+        _sort = []
+        if self.has_objects(objects) and sort and len(sort) > 0:
+            _sort = self.get_order_by(objects.model, sort)
+        try:
+            if self.has_objects(objects) and len(_sort) > 0:
+                objects = objects.order_by(*_sort)
+            if limit and self.get_count_mode() == COUNT_HAS_MORE:
+                rows = list(self.with_related(objects[offset:(offset + limit + 1)], model))
+                self._has_more = len(rows) > limit
+                self._page = rows[:limit]
+                return self._page
+            if limit:
+                objects = objects[offset:(offset + limit)]
+        except Exception:
+            return model.objects.none()
+        else:
+            return self.with_related(objects, model)
+
+    def with_related(self, objects, model):
+        """
+        This method returns the objects with select_related and prefetch_related for the relations of the item
+        serializer fields if the plan_relations option is set. A list of model instances is prefetched.
+        """
+        if not self._meta.plan_relations:
+            return objects
+        select_related, prefetch_related = related.get_related_lookups(self._serializer_cls, model,
+                                                                       fields=self._fields, exclude=self._exclude)
+        if prefetch_related:
+            # The related managers have to use the prefetched objects instead of an only() query.
+            self._extras['use_prefetch'] = True
+        return related.apply_related_lookups(objects, select_related, prefetch_related)
+
+    def with_only(self, objects):
+        """
+        This method returns the queryset with only() for the columns which are read by the item serializer fields, the
+        columns of the relations which are joined by plan_relations included. The primary key, the foreign keys and
+        the sort fields are always loaded.
+        """
+        model = objects.model
+        select_related = None
+        if self._meta.plan_relations:
+            select_related = related.get_related_lookups(self._serializer_cls, model, fields=self._fields,
+                                                         exclude=self._exclude)[0]
+        sort = self._sort
+        if sort is not None and not isinstance(sort, list):
+            sort = [str(sort)]
+        only_fields = related.get_only_fields(self._serializer_cls, model, fields=self._fields, exclude=self._exclude,
+                                              select_related=select_related, order_by=self.get_order_by(model, sort))
+        if only_fields is None:
+            return objects
+        return objects.only(*only_fields)
+
+    def get_order_by(self, model, sort):
+        """
+        This method returns the order_by arguments of the sort items which are serializer fields of model fields.
+        """
         _sort = []
-        if objects and sort and len(sort) > 0:
-            model_fields = get_django_model_field_list(objects.model)
+        if sort and len(sort) > 0:
+            model_fields = get_django_model_field_list(model)
             serializer_fieldnames = self._serializer_cls.get_fieldnames()
             for sort_item in sort:
                 sort_field_name = str(sort_item)
@@ -52,13 +209,64 @@ class DjangoCollectionSerializer(DjangoRequestMixin, CollectionSerializer):
                     sort_field_name = serializer_fieldnames[sort_field_name]
                     if sort_field_name in model_fields:
                         _sort.append('{}{}'.format(sort_prefix, sort_field_name))
+        return [py2to3._unicode(item).replace('.', '__') for item in _sort]
+
+    def cursor_metadata(self, objects):
+        _, next_cursor, previous_cursor = self.get_cursor_page(objects, limit=self._limit, sort=self._sort)
+        _metadata = {}
+        _metadata[self._meta.limit_key] = self._limit
+        _metadata[self._meta.total_count_key] = self.get_total_count(objects)
+        _metadata[self._meta.next_key] = next_cursor
+        _metadata[self._meta.previous_key] = previous_cursor
+        if self.get_count_mode() == COUNT_HAS_MORE:
+            _metadata[self._meta.has_more_key] = next_cursor is not None
+        return _metadata
+
+    def get_cursor_page(self, objects, limit=None, sort=None):
+        """
+        This method returns the objects of the page of the cursor with the next and the previous cursor. The objects
+        are ordered by the sort fields and the primary key. The page is selected by a filter on the order values of
+        the row at the cursor instead of an offset, so the query time does not grow with the depth of the page.
+        A ValueError is raised for an invalid cursor or a cursor of another sort.
+        """
+        if self._cursor_page is None:
+            self._cursor_page = self._get_cursor_page(objects, limit, sort)
+        return self._cursor_page
+
+    def _get_cursor_page(self, objects, limit, sort):
         try:
-            if objects and len(_sort) > 0:
-                _sort = [py2to3._unicode(item).replace('.', '__') for item in _sort]
-                objects = objects.order_by(*_sort)
-            if limit:
-                objects = objects[offset:(offset + limit)]
+            limit = int(limit)
         except Exception:
-            return objects.model.objects.none()
-        else:
-            return objects
+            limit = 10
+        if sort is not None and not isinstance(sort, list):
+            sort = [str(sort)]
+        order_by = self.get_order_by(objects.model, sort)
+        if not any(item.lstrip('-') in ('pk', objects.model._meta.pk.name) for item in order_by):
+            order_by.append('pk')
+        order = cursors.parse_order(order_by)
+        direction, values = cursors.NEXT, None
+        if self._cursor:
+            direction, values = cursors.decode_cursor(self._cursor)
+            if len(values) != len(order):
+                raise ValueError('Invalid cursor.')
+        forward = direction == cursors.NEXT
+        queryset = objects
+        if values is not None:
+            queryset = queryset.filter(cursors.get_seek_filter(order, values, forward=forward,
+                                                               nulls_largest=cursors.get_nulls_largest(objects)))
+        queryset = queryset.order_by(*(order_by if forward else cursors.reverse_order(order_by)))[:limit + 1]
+        rows = list(self.with_related(queryset, objects.model))
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if not forward:
+            rows.reverse()
+        if not rows:
+            return rows, None, None
+        first, last = cursors.get_order_values(objects, [path for path, _ in order], [rows[0], rows[-1]])
+        next_cursor = None
+        if has_more or not forward:
+            next_cursor = cursors.encode_cursor(cursors.NEXT, last)
+        previous_cursor = None
+        if (has_more and not forward) or (forward and values is not None):
+            previous_cursor = cursors.encode_cursor(cursors.PREVIOUS, first)
+        return rows, next_cursor, previous_cursor
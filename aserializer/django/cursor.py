@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+import base64
+import json
+import uuid
+from datetime import datetime, date, time
+from decimal import Decimal
+
+from aserializer.utils import py2to3
+from aserializer.django.utils import django, get_local_fields
+
+if django is not None:
+    from django.db import connections
+    from django.db.models import Q
+else:
+    connections = None
+    Q = None
+
+
+NEXT = 'next'
+PREVIOUS = 'previous'
+
+
+def encode_value(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, uuid.UUID)):
+        return py2to3._unicode(value)
+    return value
+
+
+def encode_cursor(direction, values):
+    """
+    Returns the opaque cursor of a direction and the order values of a row. Dates, times, decimals and UUIDs are
+    encoded as strings, the lookups of their model fields convert them back.
+    """
+    data = json.dumps([direction] + [encode_value(value) for value in values], separators=(',', ':'))
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """
+    Returns the tuple (direction, values) of a cursor. A ValueError is raised for an invalid cursor.
+    """
+    try:
+        cursor = py2to3._unicode(cursor)
+        data = base64.urlsafe_b64decode((cursor + '=' * (-len(cursor) % 4)).encode('ascii'))
+        data = json.loads(data.decode('utf-8'))
+    except (TypeError, ValueError, UnicodeError):
+        raise ValueError('Invalid cursor.')
+    if not isinstance(data, list) or not data or data[0] not in (NEXT, PREVIOUS):
+        raise ValueError('Invalid cursor.')
+    return data[0], data[1:]
+
+
+def parse_order(order_by):
+    """
+    Returns the list of (path, descending) tuples of order_by arguments.
+    """
+    return [(item[1:], True) if item.startswith('-') else (item, False) for item in order_by]
+
+
+def reverse_order(order_by):
+    return [item[1:] if item.startswith('-') else '-{}'.format(item) for item in order_by]
+
+
+def get_nulls_largest(objects):
+    """
+    Returns True if the database of the queryset orders NULL values after all other values in an ascending order.
+    """
+    return getattr(connections[objects.db].features, 'nulls_order_largest', False)
+
+
+def get_seek_filter(order, values, forward=True, nulls_largest=False):
+    """
+    Returns the Q object which selects the rows after (or before if not forward) the row with the order values,
+    i.e. for the order (a, -b, pk): a > x or (a = x and b < y) or (a = x and b = y and pk > z). NULL values are
+    compared by their position in the order of the database, nulls_largest is True if NULL values are ordered last.
+    """
+    result = None
+    equal = Q()
+    for (path, descending), value in zip(order, values):
+        greater = descending != forward
+        if value is None:
+            # Only the non-NULL values are after NULL values if NULL values are ordered first and vice versa.
+            condition = Q(**{'{}__isnull'.format(path): False}) if greater != nulls_largest else None
+        else:
+            condition = Q(**{'{}__{}'.format(path, 'gt' if greater else 'lt'): value})
+            if greater == nulls_largest:
+                condition = condition | Q(**{'{}__isnull'.format(path): True})
+        if condition is not None:
+            condition = equal & condition
+            result = condition if result is None else result | condition
+        equal = equal & (Q(**{'{}__isnull'.format(path): True}) if value is None else Q(**{path: value}))
+    return result
+
+
+def get_order_values(objects, paths, rows):
+    """
+    Returns the order values of the rows. They are read from the rows if all paths are local fields, otherwise
+    with a single query.
+    """
+    model = objects.model
+    attnames = dict((field.name, field.attname) for field in get_local_fields(model))
+    attnames['pk'] = model._meta.pk.attname
+    if all(path in attnames for path in paths):
+        return [[getattr(row, attnames[path]) for path in paths] for row in rows]
+    values = model._default_manager.filter(pk__in=[row.pk for row in rows]).values_list('pk', *paths)
+    values = dict((item[0], list(item[1:])) for item in values)
+    return [values[row.pk] for row in rows]
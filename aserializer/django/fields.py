@@ -47,5 +47,4 @@ class RelatedManagerListSerializerField(ListSerializerField):
         self.items[:] = []
         self._native_items[:] = []
         self._python_items[:] = []
-        for item in values:
-            self.add_item(source=item)
+        self.add_items(sources=values)
@@ -36,3 +36,9 @@ class DjangoRequestMixin(object):
                 self._offset = int(offset)
             except:
                 pass
+        cursor = params.get('cursor', None)
+        if cursor is not None:
+            self._cursor = cursor
+        count_mode = params.get('count_mode', None)
+        if count_mode in getattr(self, 'COUNT_MODES', ()):
+            self._count_mode = count_mode
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+from aserializer.fields import SerializerObjectField
+from aserializer.django import utils as django_utils
+
+try:
+    from django.db import models as django_models
+    from django.db.models.query import QuerySet
+except ImportError:
+    django_models = None
+    QuerySet = None
+
+
+def get_relations(model):
+    """
+    Returns the relation model fields of a model by the attribute name of their instance values and whether they
+    are single-valued. Forward foreign keys and one-to-one relations in both directions are single-valued.
+    """
+    result = {}
+    for model_field in django_utils.get_related_fields(model):
+        if isinstance(model_field, django_models.ForeignKey):
+            result[model_field.name] = (model_field, True)
+        elif isinstance(model_field, django_models.ManyToManyField):
+            result[model_field.name] = (model_field, False)
+    for model_field in django_utils.get_reverse_related_fields(model):
+        single = django_utils.is_reverse_one2one_relation_field(model_field)
+        result[model_field.get_accessor_name()] = (model_field, single)
+    return result
+
+
+def get_model_name(name, field, model_names):
+    """
+    Returns the name of the model attribute which is read by a serializer field, the field name or its map_field.
+    """
+    if name in model_names:
+        return name
+    if field.map_field in model_names:
+        return field.map_field
+    return None
+
+
+def merge_names(names, other_names):
+    result = list(names or [])
+    result.extend(name for name in other_names or [] if name not in result)
+    return result or None
+
+
+def get_related_lookups(serializer_cls, model, fields=None, exclude=None):
+    """
+    Returns the select_related and the prefetch_related lookups for the relations which are read by the serializer
+    fields of the serializer class after the fields and exclude filtering. Single-valued relations are joined,
+    many-valued relations and all relations below them are prefetched.
+    """
+    select_related = []
+    prefetch_related = []
+    _collect_lookups(serializer_cls, model, fields, exclude, '', False, select_related, prefetch_related, ())
+    return select_related, prefetch_related
+
+
+def _collect_lookups(serializer_cls, model, fields, exclude, prefix, prefetch, select_related, prefetch_related,
+                     path):
+    if (serializer_cls, model) in path:
+        return
+    path = path + ((serializer_cls, model),)
+    field_filter = serializer_cls.get_field_filter(fields=fields or serializer_cls._meta.fields,
+                                                   exclude=exclude or serializer_cls._meta.exclude)
+    relations = get_relations(model)
+    for name in field_filter.names or serializer_cls._base_fields.keys():
+        field = serializer_cls._base_fields[name]
+        if not isinstance(field, SerializerObjectField):
+            continue
+        relation_name = get_model_name(name, field, relations)
+        if relation_name is None:
+            continue
+        model_field, single = relations[relation_name]
+        lookup = '{}{}'.format(prefix, relation_name)
+        nested_prefetch = prefetch or not single
+        if nested_prefetch:
+            prefetch_related.append(lookup)
+        else:
+            select_related.append(lookup)
+        nested_fields, nested_exclude = field_filter.nested.get(name, (None, None))
+        _collect_lookups(field.get_serializer_cls(),
+                         django_utils.get_related_model_from_field(model_field),
+                         merge_names(field.only_fields, nested_fields),
+                         merge_names(field.exclude, nested_exclude),
+                         '{}__'.format(lookup), nested_prefetch, select_related, prefetch_related, path)
+
+
+def get_only_fields(serializer_cls, model, fields=None, exclude=None, select_related=None, order_by=None):
+    """
+    Returns the only() arguments for the columns which are read by the serializer fields of the serializer class after
+    the fields and exclude filtering. The primary key, the foreign keys and the local fields of order_by are always
+    loaded, the columns of the select_related relations are added with their lookups. None is returned if a serializer
+    field reads an attribute of the model which is no model field, i.e. a property, then all columns are loaded.
+    """
+    result = []
+    if not _collect_only_fields(serializer_cls, model, fields, exclude, '', set(select_related or []), result):
+        return None
+    local_names = set(field.name for field in django_utils.get_local_fields(model))
+    for item in order_by or []:
+        name = item.lstrip('-')
+        if name in local_names and name not in result:
+            result.append(name)
+    return result
+
+
+def _collect_only_fields(serializer_cls, model, fields, exclude, prefix, select_related, result):
+    field_filter = serializer_cls.get_field_filter(fields=fields or serializer_cls._meta.fields,
+                                                   exclude=exclude or serializer_cls._meta.exclude)
+    local_names = {}
+    for model_field in django_utils.get_local_fields(model):
+        local_names[model_field.name] = model_field.name
+        local_names[model_field.attname] = model_field.name
+    relations = get_relations(model)
+    names = [model._meta.pk.name]
+    for relation_name, (model_field, _) in relations.items():
+        if isinstance(model_field, django_models.ForeignKey):
+            names.append(relation_name)
+            local_names[model_field.attname] = relation_name
+    nested = []
+    for name in field_filter.names or serializer_cls._base_fields.keys():
+        field = serializer_cls._base_fields[name]
+        model_name = get_model_name(name, field, local_names)
+        if model_name is not None:
+            names.append(local_names[model_name])
+            continue
+        relation_name = get_model_name(name, field, relations)
+        if relation_name is None:
+            if hasattr(model, name) or (field.map_field and hasattr(model, field.map_field)):
+                return False
+            continue
+        if '{}{}'.format(prefix, relation_name) in select_related and isinstance(field, SerializerObjectField):
+            nested.append((name, field, relation_name))
+    for name in names:
+        if '{}{}'.format(prefix, name) not in result:
+            result.append('{}{}'.format(prefix, name))
+    for name, field, relation_name in nested:
+        lookup = '{}{}'.format(prefix, relation_name)
+        nested_fields, nested_exclude = field_filter.nested.get(name, (None, None))
+        nested_result = []
+        # Without any column of a joined relation all of its columns are loaded.
+        if _collect_only_fields(field.get_serializer_cls(),
+                                django_utils.get_related_model_from_field(relations[relation_name][0]),
+                                merge_names(field.only_fields, nested_fields),
+                                merge_names(field.exclude, nested_exclude),
+                                '{}__'.format(lookup), select_related, nested_result):
+            result.extend(item for item in nested_result if item not in result)
+    return True
+
+
+def with_related(objects, serializer_cls, fields=None, exclude=None, model=None):
+    """
+    Returns the queryset with select_related and prefetch_related for the relations of the serializer fields. For a
+    list of model instances the relations are prefetched and the list is returned.
+    """
+    if model is None:
+        model = objects.model
+    select_related, prefetch_related = get_related_lookups(serializer_cls, model, fields=fields, exclude=exclude)
+    return apply_related_lookups(objects, select_related, prefetch_related)
+
+
+def apply_related_lookups(objects, select_related, prefetch_related):
+    if isinstance(objects, QuerySet):
+        if select_related:
+            objects = objects.select_related(*select_related)
+        if prefetch_related:
+            objects = objects.prefetch_related(*prefetch_related)
+        return objects
+    objects = list(objects)
+    if select_related or prefetch_related:
+        django_utils.prefetch_related_objects(objects, select_related + prefetch_related)
+    return objects
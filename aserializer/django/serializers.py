@@ -38,12 +38,11 @@ except ImportError:
 
 class DjangoModelSerializerBase(SerializerBase):
 
-    def __new__(cls, name, bases, attrs):
-        new_class = super(DjangoModelSerializerBase, cls).__new__(cls, name, bases, attrs)
+    @classmethod
+    def prepare_class(cls, new_class):
         cls.set_fields_from_model(new_class=new_class,
                                   fields=new_class._base_fields,
                                   meta=new_class._meta)
-        return new_class
 
     @classmethod
     def get_meta_options_cls(cls):
@@ -91,12 +90,13 @@ class DjangoModelSerializerBase(SerializerBase):
         return None
 
     @staticmethod
-    def get_nested_serializer_class(model_field, parent_manager=None, **field_arguments):
+    def get_nested_serializer_class(model_field, parent_manager=None, lazy_relations=False, **field_arguments):
         class NestedModelSerializer(NestedDjangoModelSerializer):
             class Meta:
                 model = model_field
                 parents = parent_manager
                 field_kwargs = field_arguments
+                lazy_nested = lazy_relations
         return NestedModelSerializer
 
     @classmethod
@@ -149,6 +149,7 @@ class DjangoModelSerializerBase(SerializerBase):
             field_kwargs = meta.field_arguments.get_nested_field_kwargs(model_field.name)
             serializer_cls = cls.get_nested_serializer_class(rel_django_model,
                                                              relation_parents_manager,
+                                                             lazy_relations=meta.lazy_nested,
                                                              **field_kwargs)
             if isinstance(model_field, django_models.ManyToManyField):
                 field_class = RelatedManagerListSerializerField
@@ -172,6 +173,7 @@ class DjangoModelSerializerBase(SerializerBase):
             field_kwargs = meta.field_arguments.get_nested_field_kwargs(field_name)
             serializer_cls = cls.get_nested_serializer_class(rel_django_model,
                                                              relation_parents_manager,
+                                                             lazy_relations=meta.lazy_nested,
                                                              **field_kwargs)
             if django_utils.is_reverse_one2one_relation_field(model_field):
                 field_class = serializer_fields.SerializerField
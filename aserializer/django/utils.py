@@ -125,3 +125,11 @@ def get_django_model_field_list(model, parent_name=None, result=None):
                 get_django_model_field_list(get_related_model_from_field(field), item_name, result)
 
     return result
+
+
+def prefetch_related_objects(instances, lookups):
+    from django.db.models.query import prefetch_related_objects as prefetch
+    if django_version >= (1, 10, 0):
+        prefetch(instances, *lookups)
+    else:
+        prefetch(instances, lookups)
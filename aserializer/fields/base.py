@@ -80,10 +80,20 @@ class BaseSerializerField(object):
     def add_name(self, name):
         self.names = list(set(self.names + [name]))
 
+    def clone(self):
+        """
+        Returns a new field object for a serializer instance. The field definition (validators, error messages and
+        the other constructor arguments) is shared with this field, the new field only owns its value state.
+        Fields holding mutable value containers must override this method and copy them.
+        """
+        field = self.__class__.__new__(self.__class__)
+        field.__dict__.update(self.__dict__)
+        return field
+
     def validate(self):
         if self.ignore:
             return
-        is_empty_value = self.value in v.VALIDATORS_EMPTY_VALUES
+        is_empty_value = v.is_empty_value(self.value)
         if is_empty_value and (self.required or self.identity):
             raise SerializerFieldValueError(self._error_messages['required'])
         elif is_empty_value and not (self.required or self.identity):
@@ -121,9 +131,9 @@ class BaseSerializerField(object):
         except:
             raise SerializerFieldValueError(self._error_messages['invalid'], field_names=self.names)
         else:
-            if (self.identity and self.required) and result in v.VALIDATORS_EMPTY_VALUES:
+            if (self.identity and self.required) and v.is_empty_value(result):
                 raise SerializerFieldValueError(self._error_messages['required'], field_names=self.names)
-            elif result in v.VALIDATORS_EMPTY_VALUES and self.on_null_value == HIDE_FIELD:
+            elif v.is_empty_value(result) and self.on_null_value == HIDE_FIELD:
                 raise IgnoreField()
             return result
 
@@ -135,9 +145,9 @@ class BaseSerializerField(object):
         except:
             raise SerializerFieldValueError(self._error_messages['invalid'], field_names=self.names)
         else:
-            if (self.identity and self.required) and result in v.VALIDATORS_EMPTY_VALUES:
+            if (self.identity and self.required) and v.is_empty_value(result):
                 raise SerializerFieldValueError(self._error_messages['required'], field_names=self.names)
-            elif result in v.VALIDATORS_EMPTY_VALUES and self.on_null_value == HIDE_FIELD:
+            elif v.is_empty_value(result) and self.on_null_value == HIDE_FIELD:
                 return None
             return result
 
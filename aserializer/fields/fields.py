@@ -96,6 +96,12 @@ class DecimalField(IntegerField):
         super(DecimalField, self).__init__(max_value=max_value, min_value=min_value, **kwargs)
         self.decimal_places = decimal_places
         self.precision = precision
+        # The quantizer and the context are computed once per field definition and shared by the clones. The context
+        # is a copy of the decimal context at definition time.
+        self._quantizer = decimal.Decimal(".1") ** decimal_places
+        self._context = decimal.getcontext().copy()
+        if precision is not None:
+            self._context.prec = precision
         if self.value and not isinstance(self.value, decimal.Decimal):
             self.set_value(self.value)
         if output is None or output not in (0, 1):
@@ -103,34 +109,53 @@ class DecimalField(IntegerField):
         else:
             self.output = output
 
-    def set_value(self, value):
-        context = decimal.getcontext().copy()
-        if self.precision is not None:
-            context.prec = self.precision
+    def quantize(self, value):
+        """
+        This method returns the value quantized to the decimal places of the field. Strings which are no decimals are
+        returned as they are and values of other types as None.
+        """
         if isinstance(value, decimal.Decimal):
-            self.value = value.quantize(decimal.Decimal(".1") ** self.decimal_places, context=context)
+            return value.quantize(self._quantizer, context=self._context)
         elif isinstance(value, (py2to3.integer, float,)):
-            self.value = decimal.Decimal(value).quantize(decimal.Decimal(".1") ** self.decimal_places, context=context)
+            return decimal.Decimal(value).quantize(self._quantizer, context=self._context)
         elif isinstance(value, py2to3.string):
             try:
-                self.value = decimal.Decimal(value).quantize(decimal.Decimal(".1") ** self.decimal_places,
-                                                             context=context)
+                return decimal.Decimal(value).quantize(self._quantizer, context=self._context)
             except:
-                self.value = value
-        else:
-            self.value = None
+                return value
+        return None
+
+    def quantize_many(self, values):
+        """
+        This method quantizes a list of values in one call and returns the list of the results, like quantize.
+        """
+        quantizer = self._quantizer
+        context = self._context
+        Decimal = decimal.Decimal
+        numbers = (py2to3.integer, float,)
+        result = []
+        append = result.append
+        for value in values:
+            if isinstance(value, Decimal):
+                append(value.quantize(quantizer, context=context))
+            elif isinstance(value, numbers):
+                append(Decimal(value).quantize(quantizer, context=context))
+            else:
+                append(self.quantize(value))
+        return result
+
+    def set_value(self, value):
+        self.value = self.quantize(value)
 
     def _to_native(self):
-        if self.value in v.VALIDATORS_EMPTY_VALUES:
+        if v.is_empty_value(self.value):
             return None
         if self.output == self.OUTPUT_AS_STRING:
-            result = str(self.value)
-        else:
-            result = float(u'{}'.format(self.value))
-        return result
+            return str(self.value)
+        return float(self.value)
 
     def _to_python(self):
-        if self.value in v.VALIDATORS_EMPTY_VALUES:
+        if v.is_empty_value(self.value):
             return None
         return self.value
 
@@ -287,12 +312,24 @@ class ChoiceField(BaseSerializerField):
         self.upper = upper
         self.set_value(self.value)
 
+    @property
+    def choices(self):
+        return self._choices
+
+    @choices.setter
+    def choices(self, choices):
+        self._choices = choices
+        self._choice_index = self._build_choice_index(choices)
+
     def set_value(self, value):
         if self.upper and isinstance(value, py2to3.string):
             value = value.lower()
         self.value = value
-        self.python_value = self._get_value(value, to_python=True)
-        self.native_value = self._get_value(value, to_python=False)
+        choice = self._get_choice(value)
+        if choice is None:
+            self.python_value = self.native_value = None
+        else:
+            self.python_value, self.native_value = choice
 
     def _get_key_value_from_choice_element(self, choice):
         if isinstance(choice, (list, tuple,)):
@@ -304,18 +341,43 @@ class ChoiceField(BaseSerializerField):
             return key, val
         return choice, choice
 
-    def _get_value(self, value, to_python=True):
+    def _build_choice_index(self, choices):
+        """
+        This method returns a dictionary of the keys and values of the choices to the (value, key) tuple of the first
+        choice they appear in, or None if a choice is not hashable. Without an index the choices are scanned.
+        """
+        index = {}
+        try:
+            for choice in choices:
+                key, val = self._get_key_value_from_choice_element(choice)
+                index.setdefault(key, (val, key))
+                index.setdefault(val, (val, key))
+        except TypeError:
+            return None
+        return index
+
+    def _get_choice(self, value):
         if value in v.VALIDATORS_EMPTY_VALUES:
             return None
+        if self._choice_index is not None:
+            try:
+                return self._choice_index.get(value)
+            except TypeError:
+                pass
         for choice in self.choices:
             key, val = self._get_key_value_from_choice_element(choice)
             if value == key or value == val:
-                if to_python:
-                    return val
-                else:
-                    return key
+                return val, key
         return None
 
+    def _get_value(self, value, to_python=True):
+        choice = self._get_choice(value)
+        if choice is None:
+            return None
+        if to_python:
+            return choice[0]
+        return choice[1]
+
     def validate(self):
         super(ChoiceField, self).validate()
         if self.value in v.VALIDATORS_EMPTY_VALUES:
@@ -337,19 +399,98 @@ class ChoiceField(BaseSerializerField):
         return value
 
 
+UNCONVERTED = object()
+
+
+def convert_integer_item(value):
+    if type(value) in py2to3.integer:
+        return value
+    return UNCONVERTED
+
+
+def convert_float_item(value):
+    if type(value) is float:
+        return value
+    if type(value) in py2to3.integer:
+        return float(value)
+    return UNCONVERTED
+
+
+def convert_boolean_item(value):
+    if type(value) is bool:
+        return value
+    return UNCONVERTED
+
+
+def convert_string_item(value):
+    if type(value) is py2to3.text and value not in v.VALIDATORS_EMPTY_VALUES:
+        return value
+    return UNCONVERTED
+
+
+# The item field classes of which a ListField converts the valid values of the listed types without item fields. The
+# converters return the native value, which is the python value as well, or UNCONVERTED for any other value.
+ITEM_CONVERTERS = {
+    IntegerField: convert_integer_item,
+    FloatField: convert_float_item,
+    BooleanField: convert_boolean_item,
+    StringField: convert_string_item,
+}
+
+
 class ListField(BaseSerializerField):
+    """
+    A list of values of an item field class. For the item field classes in ITEM_CONVERTERS the values are converted
+    in a single pass and item fields are only created for the values which are not converted (empty or invalid values
+    and values of other types), the remaining item fields are created when the items are accessed.
+    """
 
     def __init__(self, field, *args, **kwargs):
         super(ListField, self).__init__(*args, **kwargs)
         self._field_cls = field
-        self.items = []
+        self._convert_item = ITEM_CONVERTERS.get(field)
+        self._items = []
+        self._values = None
+        self._converted = None
+        self._item_fields = None
         self._python_items = []
         self._native_items = []
 
+    @property
+    def items(self):
+        if self._items is None:
+            item_fields = self._item_fields
+            self._items = [item_fields[index] if index in item_fields else self._new_item(value)
+                           for index, value in enumerate(self._values)]
+            self._values = self._converted = self._item_fields = None
+        return self._items
+
+    @items.setter
+    def items(self, items):
+        self._items = items
+        self._values = self._converted = self._item_fields = None
+
+    def clone(self):
+        field = super(ListField, self).clone()
+        if self._items is not None:
+            field._items = [item.clone() for item in self._items]
+        else:
+            field._values = list(self._values)
+            field._converted = list(self._converted)
+            field._item_fields = dict((index, item.clone()) for index, item in self._item_fields.items())
+        field._python_items = list(self._python_items)
+        field._native_items = list(self._native_items)
+        return field
+
+    def _get_item_fields(self):
+        if self._items is not None:
+            return self._items
+        return [self._item_fields[index] for index in sorted(self._item_fields)]
+
     def validate(self):
-        if self.items:
+        if len(self):
             _errors = []
-            for field in self.items:
+            for field in self._get_item_fields():
                 try:
                     field.validate()
                 except SerializerFieldValueError as e:
@@ -359,29 +500,66 @@ class ListField(BaseSerializerField):
         elif self.required:
             raise SerializerFieldValueError(self._error_messages['required'], field_names=self.names)
 
-    def add_item(self, value):
+    def _new_item(self, value):
         field = self._field_cls()
         field.set_value(value=value)
-        self.items.append(field)
+        return field
+
+    def add_item(self, value):
+        if self._items is not None:
+            self._items.append(self._new_item(value))
+            return
+        result = self._convert_item(value)
+        if result is UNCONVERTED:
+            self._item_fields[len(self._values)] = self._new_item(value)
+        self._values.append(value)
+        self._converted.append(result)
 
     def set_value(self, value):
-        self.items[:] = []
         self._native_items[:] = []
         self._python_items[:] = []
-        if isinstance(value, Iterable):
-            for item in value:
-                self.add_item(value=item)
+        if self._convert_item is None:
+            self.items[:] = []
+            if isinstance(value, Iterable):
+                for item in value:
+                    self.add_item(value=item)
+            return
+        values = list(value) if isinstance(value, Iterable) else []
+        convert = self._convert_item
+        converted = [convert(item) for item in values]
+        item_fields = {}
+        if UNCONVERTED in converted:
+            for index, result in enumerate(converted):
+                if result is UNCONVERTED:
+                    item_fields[index] = self._new_item(values[index])
+        self._items = None
+        self._values = values
+        self._converted = converted
+        self._item_fields = item_fields
+
+    def _get_converted_items(self, to_native):
+        result = list(self._converted)
+        for index in sorted(self._item_fields):
+            field = self._item_fields[index]
+            result[index] = field.to_native() if to_native else field.to_python()
+        return result
 
     def _to_native(self):
         if not self._native_items:
-            for field in self.items:
-                self._native_items.append(field.to_native())
+            if self._items is None:
+                self._native_items[:] = self._get_converted_items(to_native=True)
+            else:
+                for field in self._items:
+                    self._native_items.append(field.to_native())
         return self._native_items
 
     def _to_python(self):
         if not self._python_items:
-            for field in self.items:
-                self._python_items.append(field.to_python())
+            if self._items is None:
+                self._python_items[:] = self._get_converted_items(to_native=False)
+            else:
+                for field in self._items:
+                    self._python_items.append(field.to_python())
         return self._python_items
 
     def append(self, value):
@@ -422,7 +600,9 @@ class ListField(BaseSerializerField):
         return self.to_python()[y]
 
     def __len__(self):
-        return len(self.items)
+        if self._items is not None:
+            return len(self._items)
+        return len(self._values)
 
     def __contains__(self, value):
         return value in self.to_python()
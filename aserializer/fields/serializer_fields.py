@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 
 from collections import Iterable
+from copy import deepcopy
 
-from aserializer.utils import py2to3, registry
+from aserializer.utils import py2to3, registry, identity_map
 from aserializer.fields.fields import BaseSerializerField, SerializerFieldValueError
 
 
@@ -51,18 +52,47 @@ class SerializerField(SerializerObjectField):
         super(SerializerField, self).__init__(*args, **kwargs)
         self._serializer_cls = serializer
         self._serializer = None
+        self._deferred = None
+        self._source = None
 
     def get_instance(self):
+        if self._deferred is not None:
+            self.resolve_value()
         return self._serializer
 
+    def clone(self):
+        field = super(SerializerField, self).clone()
+        if self._serializer is not None:
+            field._serializer = deepcopy(self._serializer)
+        return field
+
     def validate(self):
+        if self._deferred is not None:
+            self.resolve_value()
         if self._serializer:
             if not self._serializer.is_valid():
                 raise SerializerFieldValueError(self._serializer.errors, field_names=self.names)
         elif self.required:
             raise SerializerFieldValueError(self._error_messages['required'], field_names=self.names)
 
+    def defer_value(self, get_value, source, name):
+        """
+        This method defers the set_value call with the value get_value(source, name) until the nested serializer is
+        needed by validate, to_native, to_python or the instance attribute. The serializer class is resolved at once.
+        """
+        self._serializer_cls = self.normalize_serializer_cls(self._serializer_cls)
+        self._deferred = (get_value, source, name)
+
+    def resolve_value(self):
+        """
+        This method reads the deferred value and sets it.
+        """
+        get_value, source, name = self._deferred
+        self.set_value(get_value(source, name))
+
     def set_value(self, value):
+        self._deferred = None
+        self._source = value
         if value is None:
             self._serializer = None
             return
@@ -76,11 +106,46 @@ class SerializerField(SerializerObjectField):
         else:
             self._serializer.initial(source=value)
 
+    def to_native(self):
+        if self._deferred is not None and identity_map.get_identities() is None:
+            self.resolve_value()
+        return super(SerializerField, self).to_native()
+
+    def to_python(self):
+        if self._deferred is not None:
+            self.resolve_value()
+        return super(SerializerField, self).to_python()
+
     def _to_native(self):
+        identities = identity_map.get_identities()
+        if identities is not None:
+            return self._to_native_with_identities(identities)
         if self._serializer:
             return self._serializer.dump()
         return None
 
+    def _to_native_with_identities(self, identities):
+        """
+        This method returns the dump of the nested serializer from the identity map of the active dump. A deferred
+        value is only set if its dump is not in the identity map yet, the nested serializer is not created otherwise.
+        """
+        if self._deferred is not None:
+            get_value, source, name = self._deferred
+            value = get_value(source, name)
+        else:
+            value = self._source
+        self._serializer_cls = self.normalize_serializer_cls(self._serializer_cls)
+        field_filter = self._serializer_cls.get_field_filter(fields=self.only_fields, exclude=self.exclude)
+        key = identity_map.get_key(self._serializer_cls, field_filter, value)
+        if key is None:
+            return self._dump_value(value)
+        return identity_map.get_or_set(identities, key, value, lambda: self._dump_value(value))
+
+    def _dump_value(self, value):
+        if self._deferred is not None:
+            self.set_value(value)
+        return self._serializer.dump() if self._serializer else None
+
     def _to_python(self):
         if self._serializer:
             return self._serializer.to_dict()
@@ -118,6 +183,13 @@ class ListSerializerField(SerializerObjectField):
     def get_instance(self):
         return self.items
 
+    def clone(self):
+        field = super(ListSerializerField, self).clone()
+        field.items = [deepcopy(item) for item in self.items]
+        field._python_items = list(self._python_items)
+        field._native_items = list(self._native_items)
+        return field
+
     def add_item(self, source):
         self._serializer_cls = self.normalize_serializer_cls(self._serializer_cls)
         _serializer = self._serializer_cls(source=source,
@@ -127,13 +199,24 @@ class ListSerializerField(SerializerObjectField):
                                            **self.extras)
         self.items.append(_serializer)
 
+    def add_items(self, sources):
+        """
+        This method adds an item for every source. The serializer class and its configuration are resolved once for
+        all sources.
+        """
+        self._serializer_cls = self.normalize_serializer_cls(self._serializer_cls)
+        self.items.extend(self._serializer_cls.build_many(sources,
+                                                          fields=self.only_fields,
+                                                          exclude=self.exclude,
+                                                          unknown_error=self.unknown_error,
+                                                          **self.extras))
+
     def set_value(self, value):
         self.items[:] = []
         self._native_items[:] = []
         self._python_items[:] = []
         if isinstance(value, Iterable):
-            for item in value:
-                self.add_item(source=item)
+            self.add_items(sources=value)
 
     def _to_native(self):
         if not self._native_items:
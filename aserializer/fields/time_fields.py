@@ -2,7 +2,7 @@
 
 from datetime import datetime, date, time
 
-from aserializer.utils import py2to3
+from aserializer.utils import py2to3, dateparse
 from aserializer.fields.base import BaseSerializerField, SerializerFieldValueError
 from aserializer.fields import validators as v
 
@@ -14,9 +14,19 @@ class BaseDatetimeField(BaseSerializerField):
         'invalid': 'Invalid date value.',
     }
 
-    def __init__(self, formats=None, serialize_to=None, *args, **kwargs):
+    def __init__(self, formats=None, serialize_to=None, adaptive=None, *args, **kwargs):
+        """
+        The ISO formats of the fields are parsed without strptime. With adaptive formats the last successful format
+        is tried first by strptime, this is the default for lists of ISO formats because they never match the same
+        value. Other format lists can use it if the order of the formats does not matter.
+        Parse and format results are cached in the shared caches of aserializer.utils.dateparse.
+        """
         super(BaseDatetimeField, self).__init__(*args, **kwargs)
         self._date_formats = formats or self.date_formats
+        self._formats_key = tuple(self._date_formats)
+        self._iso_formats = dateparse.is_iso_format_list(self._date_formats)
+        self._adaptive = self._iso_formats if adaptive is None else adaptive
+        self._format_hint = [None]
         self._serialize_format = serialize_to
         self._current_format = None
         self.invalid = False
@@ -46,6 +56,31 @@ class BaseDatetimeField(BaseSerializerField):
         return False
 
     def strptime(self, value, formats):
+        if formats is self._date_formats and isinstance(value, py2to3.string):
+            key = (value, self._formats_key)
+            cached = dateparse.parse_cache.get(key, dateparse.MISSING)
+            if cached is not dateparse.MISSING:
+                result, f = cached
+                if result is not None:
+                    self._current_format = f
+                return result
+            result = self._strptime(value, formats)
+            dateparse.parse_cache.set(key, (result, self._current_format if result is not None else None))
+            return result
+        return self._strptime(value, formats)
+
+    def _strptime(self, value, formats):
+        if formats is self._date_formats:
+            if self._iso_formats and isinstance(value, py2to3.string):
+                parsed = dateparse.parse_iso(value, formats)
+                if parsed is not dateparse.UNDECIDED:
+                    result, f = parsed
+                    if result is not None:
+                        self._current_format = f
+                    return result
+            hint = self._format_hint[0]
+            if self._adaptive and hint is not None and hint != formats[0]:
+                formats = [hint] + [f for f in formats if f != hint]
         for f in formats:
             try:
                 result = datetime.strptime(value, f)
@@ -53,16 +88,27 @@ class BaseDatetimeField(BaseSerializerField):
             except (ValueError, TypeError):
                 continue
             else:
+                if self._adaptive:
+                    self._format_hint[0] = f
                 return result
         return None
 
     def strftime(self, value):
-        if self._serialize_format:
-            return value.strftime(self._serialize_format)
-        elif self._current_format:
-            return value.strftime(self._current_format)
-        else:
-            return py2to3._unicode(value.isoformat())
+        date_format = self._serialize_format or self._current_format
+        try:
+            key = dateparse.format_cache_key(value, date_format)
+            result = dateparse.format_cache.get(key)
+        except TypeError:
+            return self._strftime(value, date_format)
+        if result is None:
+            result = self._strftime(value, date_format)
+            dateparse.format_cache.set(key, result)
+        return result
+
+    def _strftime(self, value, date_format):
+        if date_format:
+            return value.strftime(date_format)
+        return py2to3._unicode(value.isoformat())
 
 
 class DatetimeField(BaseDatetimeField):
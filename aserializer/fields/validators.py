@@ -8,6 +8,16 @@ from aserializer.utils import py2to3
 VALIDATORS_EMPTY_VALUES = (None, 'null', '', u'', [], (), {})
 
 
+def is_empty_value(value):
+    """
+    Returns True if the value is one of the empty values. A decimal is never empty and is not compared, comparing a
+    decimal with the empty values is slow.
+    """
+    if isinstance(value, decimal.Decimal):
+        return False
+    return value in VALIDATORS_EMPTY_VALUES
+
+
 class SerializerValidatorError(Exception):
     error_code = None
     message = ''
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+from aserializer.utils import py2to3
+from aserializer.fields import (IgnoreField, SerializerFieldValueError, SerializerObjectField,
+                                HIDE_FIELD, TypeField, IntegerField, PositiveIntegerField, FloatField, BooleanField,
+                                StringField, EmailField)
+from aserializer.fields import validators as v
+
+
+_compiled_default = False
+
+NUMBER_FIELDS = {IntegerField: 'int', PositiveIntegerField: 'int', FloatField: 'float'}
+STRING_FIELDS = (StringField, EmailField)
+PLAIN_SET_VALUE_FIELDS = (IntegerField, PositiveIntegerField, FloatField, StringField, EmailField)
+
+
+def set_compiled_default(compiled):
+    """
+    Sets if serializers without a compiled meta option use the generated functions.
+    """
+    global _compiled_default
+    _compiled_default = bool(compiled)
+
+
+def get_compiled_default():
+    return _compiled_default
+
+
+class SourceWriter(object):
+
+    def __init__(self):
+        self.lines = []
+        self.level = 0
+
+    def line(self, text=''):
+        self.lines.append('    ' * self.level + text if text else '')
+
+    def indent(self):
+        self.level += 1
+
+    def dedent(self):
+        self.level -= 1
+
+    def __str__(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+class CompiledSerializer(object):
+    """
+    Generated initial, dump and to_dict functions for a serializer class and a list of field names. The functions
+    are unrolled per field and work on the field objects of the instance like the generic methods do. The conversion
+    of the built-in field classes is inlined, fields with custom hook methods and all other fields call the field
+    and hook methods.
+    """
+
+    def __init__(self, serializer_cls, serializer_plan, names):
+        self.serializer_cls = serializer_cls
+        self.names = tuple(names)
+        self.fields = [(name, serializer_cls._base_fields[name], serializer_plan.fields[name]) for name in self.names]
+        self.source = '\n\n'.join([self.initial_source(), self.dump_source(), self.to_dict_source()])
+        namespace = {
+            'EMPTY': v.VALIDATORS_EMPTY_VALUES,
+            'IgnoreField': IgnoreField,
+            'SerializerFieldValueError': SerializerFieldValueError,
+            'string_types': py2to3.string,
+            '_unicode': py2to3._unicode,
+        }
+        code = compile(self.source, '<compiled {}>'.format(serializer_cls.__name__), 'exec')
+        exec(code, namespace)
+        self.initial = namespace['initial']
+        self.dump = namespace['dump']
+        self.to_dict = namespace['to_dict']
+
+    def initial_source(self):
+        writer = SourceWriter()
+        writer.line('def initial(self, source):')
+        writer.indent()
+        writer.line('self._errors = None')
+        writer.line('self._dict_data = None')
+        writer.line('self._dump_data = None')
+        writer.line('parser = self.parser')
+        writer.line('parser.initial(source)')
+        writer.line('if parser.obj is None:')
+        writer.line('    return')
+        writer.line('source_attr = set(parser.attributes_for_serializer)')
+        writer.line('fields = self.fields')
+        for name, field, field_plan in self.fields:
+            writer.line('# {}'.format(type(field).__name__))
+            writer.line('if {!r} in source_attr:'.format(name))
+            writer.line('    _name = {!r}'.format(name))
+            if field.map_field:
+                writer.line('elif {!r} in source_attr:'.format(field.map_field))
+                writer.line('    _name = {!r}'.format(field.map_field))
+            writer.line('else:')
+            writer.line('    _name = None')
+            writer.line('if _name is not None:')
+            writer.indent()
+            writer.line('field = fields[{!r}]'.format(name))
+            if isinstance(field, SerializerObjectField):
+                writer.line('only_fields, exclude = self._field_filter.nested[{!r}]'.format(name))
+                writer.line('field.pre_value(fields=only_fields, exclude=exclude, '
+                            'unknown_error=self._handle_unknown_error, **self._extras)')
+            if field_plan.deferred:
+                writer.line('field.defer_value(parser.get_object_value, parser.obj, _name)')
+                writer.line('field.ignore = False')
+                writer.dedent()
+                continue
+            writer.line('try:')
+            writer.indent()
+            writer.line('value = parser.get_value(_name)')
+            if field_plan.clean_value is not None:
+                writer.line('value = getattr(self, {!r})(value)'.format(field_plan.clean_value))
+            self.write_set_value(writer, field)
+            writer.dedent()
+            writer.line('except IgnoreField:')
+            writer.line('    field.ignore = True')
+            writer.line('else:')
+            writer.line('    field.ignore = False')
+            writer.dedent()
+        return str(writer)
+
+    def write_set_value(self, writer, field):
+        field_cls = type(field)
+        if field_cls in PLAIN_SET_VALUE_FIELDS:
+            writer.line('field.value = value')
+        elif field_cls is BooleanField:
+            writer.line('if value in EMPTY:')
+            writer.line('    field.value = None')
+            writer.line("elif isinstance(value, string_types) and value.lower() in ('false', '0'):")
+            writer.line('    field.value = False')
+            writer.line('else:')
+            writer.line('    field.value = bool(value)')
+        elif field_cls is TypeField:
+            if not field.fixed:
+                writer.line('field.name = value')
+        else:
+            writer.line('field.set_value(value)')
+
+    def dump_source(self):
+        writer = SourceWriter()
+        writer.line('def dump(self):')
+        writer.indent()
+        writer.line('if self._dump_data is not None:')
+        writer.line('    return self._dump_data')
+        writer.line('data = self._dump_data = dict()')
+        writer.line('fields = self.fields')
+        for name, field, field_plan in self.fields:
+            if field_plan.action_field:
+                continue
+            writer.line('# {}'.format(type(field).__name__))
+            writer.line('field = fields[{!r}]'.format(name))
+            target = 'data[{!r}]'.format(name)
+            if field_plan.to_native is not None:
+                self.write_hook_call(writer, target, field_plan.to_native)
+            elif not self.write_inline_value(writer, target, field, native=True):
+                self.write_hook_call(writer, target, None, 'to_native')
+        writer.line('return data')
+        return str(writer)
+
+    def to_dict_source(self):
+        writer = SourceWriter()
+        writer.line('def to_dict(self):')
+        writer.indent()
+        writer.line('if self._dict_data is not None:')
+        writer.line('    return self._dict_data')
+        writer.line('data = self._dict_data = dict()')
+        writer.line('fields = self.fields')
+        for name, field, field_plan in self.fields:
+            writer.line('# {}'.format(type(field).__name__))
+            writer.line('field = fields[{!r}]'.format(name))
+            target = 'data[{!r}]'.format(field_plan.python_name)
+            if field_plan.to_python is not None:
+                self.write_hook_call(writer, target, field_plan.to_python)
+            elif not self.write_inline_value(writer, target, field, native=False):
+                self.write_hook_call(writer, target, None, 'to_python')
+        writer.line('return data')
+        return str(writer)
+
+    def write_hook_call(self, writer, target, hook, field_method=None):
+        writer.line('try:')
+        if hook is not None:
+            writer.line('    {} = getattr(self, {!r})(field)'.format(target, hook))
+        else:
+            writer.line('    {} = field.{}()'.format(target, field_method))
+        writer.line('except IgnoreField:')
+        writer.line('    pass')
+
+    def write_inline_value(self, writer, target, field, native=True):
+        """
+        Writes the inlined to_native or to_python code of a built-in field class, returns False for all other fields.
+        """
+        field_cls = type(field)
+        if field_cls is TypeField:
+            writer.line('{} = _unicode(field.name)'.format(target))
+            return True
+        if field_cls in NUMBER_FIELDS:
+            convert = NUMBER_FIELDS[field_cls]
+            empty_result = 'None'
+        elif field_cls in STRING_FIELDS:
+            convert = '_unicode'
+            empty_result = "u''"
+        elif field_cls is BooleanField:
+            convert = None
+        else:
+            return False
+        if native:
+            writer.line('if not field.ignore:')
+            writer.indent()
+        writer.line('value = field.value')
+        if convert is None:
+            writer.line('result = value')
+        else:
+            writer.line('if value in EMPTY:')
+            writer.line('    result = {}'.format(empty_result))
+            writer.line('else:')
+            writer.line('    try:')
+            writer.line('        result = {}(value)'.format(convert))
+            writer.line('    except:')
+            writer.line("        raise SerializerFieldValueError(field._error_messages['invalid'], "
+                        "field_names=field.names)")
+        empty_check = 'result is None' if field_cls in NUMBER_FIELDS else 'result in EMPTY'
+        value = 'bool(result)' if native and field_cls is BooleanField else 'result'
+        if field.identity and field.required:
+            writer.line('if {}:'.format(empty_check))
+            writer.line("    raise SerializerFieldValueError(field._error_messages['required'], "
+                        "field_names=field.names)")
+            writer.line('{} = {}'.format(target, value))
+        elif field.on_null_value == HIDE_FIELD and native:
+            writer.line('if not {}:'.format(empty_check))
+            writer.line('    {} = {}'.format(target, value))
+        elif field.on_null_value == HIDE_FIELD:
+            writer.line('{} = None if {} else {}'.format(target, empty_check, value))
+        else:
+            writer.line('{} = {}'.format(target, value))
+        if native:
+            writer.dedent()
+        return True
+
+
+def get_compiled(serializer_cls, field_filter):
+    """
+    Returns the compiled functions of a serializer class for a field filter. The functions are generated once per
+    class plan and field names.
+    """
+    serializer_plan = serializer_cls._plan
+    names = field_filter.names
+    try:
+        return serializer_plan.compiled[names]
+    except KeyError:
+        pass
+    compiled = CompiledSerializer(serializer_cls, serializer_plan,
+                                  names if names is not None else serializer_plan.fields.keys())
+    serializer_plan.compiled[names] = compiled
+    return compiled
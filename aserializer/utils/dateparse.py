@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+import re
+from datetime import datetime, timedelta
+
+from aserializer.utils.cache import LRUCache
+
+try:
+    from datetime import timezone
+except ImportError:
+    timezone = None
+
+
+DATETIME_TZ_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+DATETIME_FRACTION_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
+DATE_FORMAT = '%Y-%m-%d'
+TIME_FORMAT = '%H:%M:%S'
+
+ISO_FORMATS = frozenset([DATETIME_TZ_FORMAT, DATETIME_FRACTION_FORMAT, DATETIME_FORMAT, DATE_FORMAT, TIME_FORMAT])
+
+# The patterns only accept the fixed width form of the formats, strptime accepts more (i.e. '2016-1-1'). Every value
+# matching a pattern is parsed by exactly one of the ISO formats, the ISO formats never match the same value.
+DATETIME_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})'
+                         r'(?:\.(\d{1,6}))?(?:([+-])(\d{2})([0-5]\d))?\Z', re.IGNORECASE)
+DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})\Z')
+TIME_RE = re.compile(r'(\d{2}):(\d{2}):(\d{2})\Z')
+
+UNDECIDED = object()
+MISSING = object()
+
+PARSE_CACHE_SIZE = 1024
+FORMAT_CACHE_SIZE = 1024
+parse_cache = LRUCache(maxsize=PARSE_CACHE_SIZE)
+format_cache = LRUCache(maxsize=FORMAT_CACHE_SIZE)
+
+
+def cache_info():
+    """
+    Returns the counters of the parse and format caches shared by the time fields.
+    """
+    return {'parse': parse_cache.info(), 'format': format_cache.info()}
+
+
+def clear_caches():
+    parse_cache.clear()
+    format_cache.clear()
+
+
+def format_cache_key(value, date_format):
+    """
+    Returns the format cache key of a date, time or datetime value. Aware values are equal if they are the same point
+    in time, so the key holds the timezone, the offset and the timezone name as well.
+    """
+    tzinfo = getattr(value, 'tzinfo', None)
+    if tzinfo is None:
+        return value, type(value), date_format
+    return value, type(value), date_format, tzinfo, value.utcoffset(), value.tzname()
+
+
+def is_iso_format_list(formats):
+    """
+    Returns True if every format is one of the ISO formats handled by parse_iso.
+    """
+    return bool(formats) and all(f in ISO_FORMATS for f in formats)
+
+
+def parse_iso(value, formats):
+    """
+    Parses a string like datetime.strptime with the first matching format of a list of ISO formats and returns the
+    tuple (datetime, format), or (None, None) if no format matches. UNDECIDED is returned for values which are not
+    in the fixed width form, these are left to strptime.
+    """
+    match = DATETIME_RE.match(value)
+    if match is not None:
+        year, month, day, hour, minute, second, fraction, sign, tz_hours, tz_minutes = match.groups()
+        if sign is not None:
+            if fraction is None or timezone is None:
+                return UNDECIDED
+            date_format = DATETIME_TZ_FORMAT
+        elif fraction is not None:
+            date_format = DATETIME_FRACTION_FORMAT
+        else:
+            date_format = DATETIME_FORMAT
+        if date_format not in formats:
+            return None, None
+        try:
+            tzinfo = None
+            if sign is not None:
+                offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+                tzinfo = timezone(-offset if sign == '-' else offset)
+            microsecond = int(fraction + '0' * (6 - len(fraction))) if fraction is not None else 0
+            result = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), microsecond,
+                              tzinfo)
+        except ValueError:
+            return UNDECIDED
+        return result, date_format
+    match = DATE_RE.match(value)
+    if match is not None:
+        if DATE_FORMAT not in formats:
+            return None, None
+        year, month, day = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day)), DATE_FORMAT
+        except ValueError:
+            return UNDECIDED
+    match = TIME_RE.match(value)
+    if match is not None:
+        if TIME_FORMAT not in formats:
+            return None, None
+        hour, minute, second = match.groups()
+        try:
+            return datetime(1900, 1, 1, int(hour), int(minute), int(second)), TIME_FORMAT
+        except ValueError:
+            return UNDECIDED
+    return UNDECIDED
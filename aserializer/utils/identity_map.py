@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import threading
+from contextlib import contextmanager
+
+
+_local = threading.local()
+
+
+def get_identities():
+    """
+    Returns the identity map of the active dump scope of the current thread, or None outside of a scope.
+    """
+    return getattr(_local, 'identities', None)
+
+
+@contextmanager
+def scope(identities=None):
+    """
+    Activates an identity map for the current thread, a new one or the given identities. A scope inside of an active
+    scope uses the outer identity map, the map is dropped when the outermost scope is left.
+    """
+    if get_identities() is not None:
+        yield
+        return
+    _local.identities = {} if identities is None else identities
+    try:
+        yield
+    finally:
+        _local.identities = None
+
+
+def iter_scoped(func, *args, **kwargs):
+    """
+    Yields the items of the iterator returned by func with one identity map for all of them. The scope is only active
+    while the iterator is called, not while the generator is suspended.
+    """
+    identities = {}
+    with scope(identities):
+        iterator = iter(func(*args, **kwargs))
+    while True:
+        with scope(identities):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def get_source_key(source):
+    """
+    Returns the identity of a source object. Objects with a primary key (i.e. Django model instances) are identified
+    by their class and primary key, all other objects by their id. None has no identity.
+    """
+    if source is None:
+        return None
+    if not isinstance(source, dict):
+        pk = getattr(source, 'pk', None)
+        if pk is not None:
+            return type(source), pk
+    return id(source)
+
+
+def get_key(serializer_cls, field_filter, source):
+    source_key = get_source_key(source)
+    if source_key is None:
+        return None
+    return serializer_cls, field_filter, source_key
+
+
+def get_or_set(identities, key, source, func):
+    """
+    Returns the stored result of the key or stores and returns the result of func. The source is kept with the
+    result, so the id of a source object is not reused while the identity map is alive.
+    """
+    entry = identities.get(key)
+    if entry is None:
+        entry = identities[key] = (source, func())
+    return entry[1]
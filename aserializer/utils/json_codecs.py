@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+import json
+import sys
+from collections import OrderedDict
+
+from aserializer.utils import py2to3
+
+
+AUTO = 'auto'
+AUTO_ORDER = ('orjson', 'ujson', 'simplejson', 'json')
+
+_backends = OrderedDict()
+_instances = {}
+_default_backend = 'json'
+
+
+class JSONBackend(object):
+    """
+    The json backend of the standard library, it is the fallback if another backend is not installed.
+    Other backends fall back to it as well, if they can not encode or decode a value.
+    """
+    name = 'json'
+
+    def __init__(self):
+        self.module = self.load_module()
+
+    def load_module(self):
+        return json
+
+    def loads(self, s):
+        if isinstance(s, py2to3.binary) and py2to3.PYTHON3 and sys.version_info < (3, 6):
+            s = s.decode('utf-8')
+        return json.loads(s)
+
+    def dumps(self, obj, indent=None):
+        return json.dumps(obj, indent=indent)
+
+
+class SimpleJSONBackend(JSONBackend):
+    name = 'simplejson'
+
+    def load_module(self):
+        import simplejson
+        return simplejson
+
+    def loads(self, s):
+        return self.module.loads(s)
+
+    def dumps(self, obj, indent=None):
+        return self.module.dumps(obj, indent=indent)
+
+
+class UJSONBackend(JSONBackend):
+    """
+    The output of ujson is compact, i.e. without a space after the separators.
+    """
+    name = 'ujson'
+
+    def load_module(self):
+        import ujson
+        return ujson
+
+    def loads(self, s):
+        try:
+            return self.module.loads(s)
+        except (ValueError, OverflowError):
+            return super(UJSONBackend, self).loads(s)
+
+    def dumps(self, obj, indent=None):
+        try:
+            return self.module.dumps(obj, indent=indent or 0, escape_forward_slashes=False)
+        except (TypeError, ValueError, OverflowError):
+            return super(UJSONBackend, self).dumps(obj, indent=indent)
+
+
+class OrJSONBackend(JSONBackend):
+    """
+    The output of orjson is compact, i.e. without a space after the separators. orjson only indents with two
+    spaces, the json backend is used for any other indent.
+    """
+    name = 'orjson'
+
+    def load_module(self):
+        import orjson
+        return orjson
+
+    def loads(self, s):
+        try:
+            return self.module.loads(s)
+        except ValueError:
+            return super(OrJSONBackend, self).loads(s)
+
+    def dumps(self, obj, indent=None):
+        if indent not in (None, 2):
+            return super(OrJSONBackend, self).dumps(obj, indent=indent)
+        option = self.module.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= self.module.OPT_INDENT_2
+        try:
+            return self.module.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            return super(OrJSONBackend, self).dumps(obj, indent=indent)
+
+
+def register_backend(backend_cls):
+    """
+    Registers a backend class by its name, a registered backend with the same name is replaced.
+    """
+    _backends[backend_cls.name] = backend_cls
+    _instances.clear()
+    return backend_cls
+
+
+def set_default_backend(name):
+    """
+    Sets the name of the backend used by serializers, collections and parsers without a json_backend meta option.
+    """
+    global _default_backend
+    if name != AUTO and name not in _backends:
+        raise ValueError('Unknown json backend "{}".'.format(name))
+    _default_backend = name
+
+
+def get_default_backend():
+    return _default_backend
+
+
+def available_backends():
+    """
+    Returns the names of the registered backends which are installed.
+    """
+    names = []
+    for name, backend_cls in _backends.items():
+        try:
+            backend_cls()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _create_backend(name):
+    if name == AUTO:
+        names = AUTO_ORDER
+    elif name in _backends:
+        names = (name, JSONBackend.name)
+    else:
+        raise ValueError('Unknown json backend "{}".'.format(name))
+    for backend_name in names:
+        backend_cls = _backends.get(backend_name)
+        if backend_cls is None:
+            continue
+        try:
+            return backend_cls()
+        except ImportError:
+            continue
+    return JSONBackend()
+
+
+def get_backend(backend=None):
+    """
+    Returns the backend instance for a backend name or the default backend if the name is None. A backend which is
+    not installed falls back to the json backend. Every object with loads and dumps methods is returned as it is.
+    """
+    if backend is None:
+        backend = _default_backend
+    if not isinstance(backend, py2to3.string):
+        return backend
+    try:
+        return _instances[backend]
+    except KeyError:
+        pass
+    instance = _create_backend(backend)
+    _instances[backend] = instance
+    return instance
+
+
+def iterencode_items(backend, items, container=None, indent=None, marker='__aserializer_stream_item_{}__'):
+    """
+    Yields the json of container(list(items)) in chunks, every item is encoded on its own. The container function
+    returns the object which holds the list of items. The joined chunks are the same as the json of the whole object,
+    because the layout around the items is taken from the json of the container with two marker items.
+    """
+    items = iter(items)
+    try:
+        item = next(items)
+    except StopIteration:
+        yield backend.dumps(container([]) if container else [], indent=indent)
+        return
+    markers = [marker.format(0), marker.format(1)]
+    encoded = backend.dumps(container(markers) if container else markers, indent=indent)
+    first_marker = backend.dumps(markers[0])
+    second_marker = backend.dumps(markers[1])
+    start = encoded.index(first_marker)
+    end = encoded.index(second_marker, start)
+    prefix = encoded[:start]
+    separator = encoded[start + len(first_marker):end]
+    suffix = encoded[end + len(second_marker):]
+    newline = '\n' + prefix[prefix.rfind('\n') + 1:] if '\n' in prefix else None
+    yield prefix
+    while True:
+        chunk = backend.dumps(item, indent=indent)
+        if newline is not None:
+            chunk = chunk.replace('\n', newline)
+        yield chunk
+        try:
+            item = next(items)
+        except StopIteration:
+            break
+        yield separator
+    yield suffix
+
+
+def write_chunks(fp, chunks, encoding=None, buffer_size=65536):
+    """
+    Writes the chunks to a file-like object, the chunks are joined until buffer_size characters are collected.
+    The chunks are encoded if an encoding is given, i.e. for files opened in binary mode.
+    """
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            data = ''.join(buffer)
+            fp.write(data.encode(encoding) if encoding else data)
+            buffer = []
+            size = 0
+    if buffer:
+        data = ''.join(buffer)
+        fp.write(data.encode(encoding) if encoding else data)
+
+
+register_backend(JSONBackend)
+register_backend(SimpleJSONBackend)
+register_backend(UJSONBackend)
+register_backend(OrJSONBackend)
@@ -9,6 +9,7 @@ class MetaOptions(object):
     def __init__(self, meta):
         self.fields = getattr(meta, 'fields', [])
         self.exclude = getattr(meta, 'exclude', [])
+        self.json_backend = getattr(meta, 'json_backend', None)
 
 
 class SerializerMetaOptions(MetaOptions):
@@ -16,6 +17,9 @@ class SerializerMetaOptions(MetaOptions):
     def __init__(self, meta):
         super(SerializerMetaOptions, self).__init__(meta)
         self.parser = getattr(meta, 'parser', Parser)
+        self.compiled = getattr(meta, 'compiled', None)
+        self.lazy_nested = getattr(meta, 'lazy_nested', False)
+        self.identity_map = getattr(meta, 'identity_map', False)
 
 
 class ModelSerializerMetaOptions(SerializerMetaOptions):
@@ -40,6 +44,15 @@ class CollectionMetaOptions(MetaOptions):
         self.total_count_key = getattr(meta, 'total_count_key', 'totalCount')
         self.sort = getattr(meta, 'sort', [])
         self.validation = getattr(meta, 'validation', False)
+        self.identity_map = getattr(meta, 'identity_map', False)
+        self.cursor_pagination = getattr(meta, 'cursor_pagination', False)
+        self.next_key = getattr(meta, 'next_key', 'next')
+        self.previous_key = getattr(meta, 'previous_key', 'previous')
+        self.count_mode = getattr(meta, 'count_mode', 'exact')
+        self.count_cache_ttl = getattr(meta, 'count_cache_ttl', 60)
+        self.has_more_key = getattr(meta, 'has_more_key', 'hasMore')
+        self.plan_relations = getattr(meta, 'plan_relations', False)
+        self.project_columns = getattr(meta, 'project_columns', False)
 
 
 class RelatedParentManager(object):
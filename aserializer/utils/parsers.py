@@ -1,29 +1,78 @@
 # -*- coding: utf-8 -*-
 
-import json
 import inspect
 from aserializer.utils import py2to3
+from aserializer.utils.cache import LRUCache
+from aserializer.utils.json_codecs import get_backend
+
+TYPE_ATTRIBUTES_CACHE_SIZE = 256
+_type_attributes_cache = LRUCache(maxsize=TYPE_ATTRIBUTES_CACHE_SIZE)
+_object_dir = getattr(object, '__dir__', None)
+
+
+class TypeAttributes(object):
+    """
+    The attribute names a type contributes to dir() of its instances. The names are split up by the kind of
+    the class attribute, to know which names are methods without an attribute access on every instance.
+    """
+    __slots__ = ('names', 'methods', 'descriptors', 'data_descriptors')
+
+    def __init__(self, source_type):
+        class_attributes = {}
+        for klass in reversed(inspect.getmro(source_type)):
+            class_attributes.update(klass.__dict__)
+        names = set()
+        methods = set()
+        descriptors = set()
+        data_descriptors = set()
+        for name, attribute in class_attributes.items():
+            if not isinstance(name, py2to3.string) or name.startswith('__'):
+                continue
+            names.add(name)
+            if isinstance(attribute, staticmethod):
+                continue
+            if inspect.isfunction(attribute) or isinstance(attribute, classmethod) or inspect.ismethod(attribute):
+                methods.add(name)
+            elif hasattr(attribute, '__get__'):
+                descriptors.add(name)
+                if hasattr(attribute, '__set__') or hasattr(attribute, '__delete__'):
+                    data_descriptors.add(name)
+        self.names = frozenset(names)
+        self.methods = frozenset(methods)
+        self.descriptors = frozenset(descriptors)
+        self.data_descriptors = frozenset(data_descriptors)
+
+
+def get_type_attributes(source_type):
+    """
+    Returns the cached TypeAttributes of a type.
+    """
+    type_attributes = _type_attributes_cache.get(source_type)
+    if type_attributes is None:
+        type_attributes = TypeAttributes(source_type)
+        _type_attributes_cache.set(source_type, type_attributes)
+    return type_attributes
 
 
 class Parser(object):
 
-    def __init__(self, fields=None):
+    def __init__(self, fields=None, json_backend=None):
         self.obj = None
+        self.json_backend = json_backend
         self._attribute_names = None
         self._all_attributes_names = None
         self.field_list = fields or []
 
     def initial(self, source):
-        if isinstance(source, py2to3.string):
-            if not isinstance(source, py2to3.text):
-                source = py2to3._unicode(source, 'utf-8')
+        if isinstance(source, py2to3.string) or isinstance(source, py2to3.binary):
             try:
-                self.obj = json.loads(source)
+                self.obj = get_backend(self.json_backend).loads(source)
             except ValueError:
                 self.obj = object()
         else:
             self.obj = source
         self._attribute_names = None
+        self._all_attributes_names = None
 
     def _attribute_name_predicate(self, name, with_filter=False):
         if name.startswith('__'):
@@ -47,8 +96,55 @@ class Parser(object):
             return []
         if isinstance(self.obj, dict):
             return [name for name in self.obj.keys() if self._attribute_name_predicate(name, with_filter)]
+        instance_dict = self._get_instance_dict()
+        if instance_dict is not None:
+            return self._get_object_attribute_names(instance_dict, with_filter)
         return [name for name in dir(self.obj) if self._attribute_name_predicate(name, with_filter)]
 
+    def _get_instance_dict(self):
+        """
+        This method returns the instance dictionary of a plain object source, for which dir() lists the instance
+        dictionary and the class attributes. For all other sources it returns None.
+        """
+        obj = self.obj
+        source_type = type(obj)
+        if isinstance(obj, (tuple, list, set, py2to3._class)) or getattr(obj, '__class__', None) is not source_type:
+            return None
+        if getattr(source_type, '__dir__', None) != _object_dir:
+            return None
+        instance_dict = getattr(obj, '__dict__', {})
+        if not isinstance(instance_dict, dict):
+            return None
+        return instance_dict
+
+    def _get_object_attribute_names(self, instance_dict, with_filter=False):
+        """
+        This method returns the same names as filtering dir() of the object, only the serializer field names
+        are probed if with_filter is True. The names of the class attributes are cached per type.
+        """
+        type_attributes = get_type_attributes(type(self.obj))
+        if with_filter:
+            return [name for name in self.field_list if not name.startswith('__') and
+                    (name in instance_dict or name in type_attributes.names)]
+        names = set(type_attributes.names)
+        names.update(name for name in instance_dict if isinstance(name, py2to3.string) and not name.startswith('__'))
+        result = []
+        for name in names:
+            if name in instance_dict and name not in type_attributes.data_descriptors:
+                if inspect.ismethod(instance_dict[name]):
+                    continue
+            elif name in type_attributes.methods:
+                continue
+            elif name in type_attributes.descriptors:
+                try:
+                    value = getattr(self.obj, name)
+                except AttributeError:
+                    continue
+                if inspect.ismethod(value):
+                    continue
+            result.append(name)
+        return sorted(result)
+
     @property
     def attributes_for_serializer(self):
         """
@@ -87,3 +183,13 @@ class Parser(object):
         else:
             value = getattr(self.obj, name, None)
         return value
+
+    @staticmethod
+    def get_object_value(obj, name):
+        """
+        This method returns the value for one field from a given source object. It is used to read deferred values,
+        which are read after the parser got another source object.
+        """
+        if isinstance(obj, dict):
+            return obj.get(name, None)
+        return getattr(obj, name, None)
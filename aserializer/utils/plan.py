@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+from aserializer.fields import SerializerObjectField, SerializerField
+from aserializer.utils.parsers import Parser
+
+
+def filter_fields(fields, only_fields):
+    """
+    This function filters a fields dictionary by a list of field names. Identity fields are always kept.
+    """
+    only_fields = [str(field_name).split('.')[0] for field_name in only_fields]
+    only_fields = [field_name for field_name in only_fields if field_name in fields]
+    if len(only_fields) <= 0:
+        return fields
+    return OrderedDict([(name, field) for name, field in fields.items() if field.identity or name in only_fields])
+
+
+def exclude_fields(fields, exclude):
+    """
+    This function excludes a list of field names from a fields dictionary. Identity fields are always kept.
+    """
+    exclude = [field_name for field_name in exclude if field_name in fields]
+    if len(exclude) <= 0:
+        return fields
+    return OrderedDict([(name, field) for name, field in fields.items() if field.identity or name not in exclude])
+
+
+def get_fields_and_exclude_for_nested(field_name, only_fields, exclude):
+    """
+    This function returns the fields and exclude arguments for a nested field (i.e. 'nest.name' -> 'name').
+    """
+    field_prefix = '{}.'.format(field_name)
+    only = ['.'.join(field.split('.')[1:]) for field in only_fields if str(field).startswith(field_prefix)] or None
+    exclude = ['.'.join(field.split('.')[1:]) for field in exclude if str(field).startswith(field_prefix)] or None
+    return only, exclude
+
+
+def resolve_hook(serializer_cls, method_name):
+    """
+    Returns the method name if the serializer class implements a callable with this name, otherwise None.
+    """
+    if callable(getattr(serializer_cls, method_name, None)):
+        return method_name
+    return None
+
+
+def is_deferred_field(serializer_cls, field, clean_value):
+    """
+    Returns True if the nested serializer of a field is created when it is needed. This is the case for serializer
+    fields without clean value hook of serializers with the lazy_nested option and the default parser.
+    """
+    meta = getattr(serializer_cls, '_meta', None)
+    if meta is None or not getattr(meta, 'lazy_nested', False) or getattr(meta, 'parser', None) is not Parser:
+        return False
+    return type(field) is SerializerField and clean_value is None
+
+
+class FieldPlan(object):
+    """
+    The resolved facts of one serializer field, the custom hook methods are stored by name and None if not implemented.
+    The value of a deferred field is read and set when the field is needed, see is_deferred_field.
+    """
+    __slots__ = ('name', 'python_name', 'action_field', 'to_native', 'to_python', 'clean_value', 'validate',
+                 'deferred')
+
+    def __init__(self, serializer_cls, name, field):
+        self.name = name
+        self.python_name = field.map_field or name
+        self.action_field = field.action_field
+        self.to_native = resolve_hook(serializer_cls, '{}_to_native'.format(name))
+        self.to_python = resolve_hook(serializer_cls, '{}_to_python'.format(name))
+        self.clean_value = resolve_hook(serializer_cls, '{}_clean_value'.format(name))
+        validate_hooks = [resolve_hook(serializer_cls, '{}_validate'.format(n)) for n in field.names]
+        self.validate = tuple(hook for hook in validate_hooks if hook is not None)
+        self.deferred = is_deferred_field(serializer_cls, field, self.clean_value)
+
+
+class SerializerPlan(object):
+    """
+    The plan is compiled once per serializer class by the SerializerBase and holds the field plans in field order.
+    The generated functions of the compiled mode are cached on the plan per field names.
+    """
+
+    def __init__(self, serializer_cls, fields):
+        self.fields = OrderedDict()
+        self.clean_value_hooks = {}
+        self.compiled = {}
+        for name, field in fields.items():
+            field_plan = FieldPlan(serializer_cls, name, field)
+            self.fields[name] = field_plan
+            for field_name in set(field.names + [name]):
+                hook = resolve_hook(serializer_cls, '{}_clean_value'.format(field_name))
+                if hook is not None:
+                    self.clean_value_hooks[field_name] = hook
+
+
+class FieldFilter(object):
+    """
+    The resolved fields and exclude arguments of a serializer class. The names are None if all fields are used,
+    nested holds the fields and exclude arguments for every nested serializer field.
+    """
+    __slots__ = ('names', 'parser_fields', 'nested')
+
+    def __init__(self, base_fields, only_fields=None, exclude=None):
+        only_fields = only_fields or []
+        exclude = exclude or []
+        fields = base_fields
+        if only_fields:
+            fields = filter_fields(fields, only_fields)
+        if exclude:
+            fields = exclude_fields(fields, exclude)
+        self.names = None if fields is base_fields else tuple(fields)
+        parser_fields = []
+        self.nested = {}
+        for name, field in fields.items():
+            if name not in parser_fields:
+                parser_fields.append(name)
+            if field.map_field and field.map_field not in parser_fields:
+                parser_fields.append(field.map_field)
+            if isinstance(field, SerializerObjectField):
+                self.nested[name] = get_fields_and_exclude_for_nested(name, only_fields, exclude)
+        self.parser_fields = tuple(parser_fields)
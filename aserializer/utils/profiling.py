@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+from collections import OrderedDict
+
+from aserializer.fields import IgnoreField, SerializerFieldValueError
+
+
+# defer_value and resolve_value are only implemented by the serializer fields, the difference of their calls is the
+# number of nested serializers which were never created.
+PROFILED_METHODS = ('set_value', 'validate', 'to_native', 'to_python', 'defer_value', 'resolve_value')
+
+timer = getattr(time, 'perf_counter', time.time)
+
+_enabled = False
+_stats = {}
+_lock = threading.Lock()
+
+
+def enable():
+    """
+    Enables the profiling of the field methods for serializer instances created from now on.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    global _enabled
+    _enabled = False
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """
+    Drops all recorded stats.
+    """
+    with _lock:
+        _stats.clear()
+
+
+def get_serializer_key(serializer_cls):
+    return '{}.{}'.format(serializer_cls.__module__, serializer_cls.__name__)
+
+
+def record(serializer_key, field_name, method_name, duration, exception=None):
+    key = (serializer_key, field_name, method_name)
+    with _lock:
+        entry = _stats.get(key)
+        if entry is None:
+            entry = _stats[key] = {'calls': 0, 'time': 0.0, 'IgnoreField': 0, 'SerializerFieldValueError': 0}
+        entry['calls'] += 1
+        entry['time'] += duration
+        if exception is not None:
+            entry[exception] += 1
+
+
+def snapshot():
+    """
+    Returns a copy of the recorded stats as {serializer: {field: {method: stats}}}. The stats of a method are the
+    number of calls, the total time in seconds and the number of raised IgnoreField and SerializerFieldValueError
+    exceptions.
+    """
+    result = OrderedDict()
+    with _lock:
+        for (serializer_key, field_name, method_name), entry in sorted(_stats.items()):
+            fields = result.setdefault(serializer_key, OrderedDict())
+            fields.setdefault(field_name, OrderedDict())[method_name] = dict(entry)
+    return result
+
+
+def _profiled_method(serializer_key, field_name, method_name, method):
+    def profiled(*args, **kwargs):
+        if not _enabled:
+            return method(*args, **kwargs)
+        exception = None
+        start = timer()
+        try:
+            return method(*args, **kwargs)
+        except IgnoreField:
+            exception = 'IgnoreField'
+            raise
+        except SerializerFieldValueError:
+            exception = 'SerializerFieldValueError'
+            raise
+        finally:
+            record(serializer_key, field_name, method_name, timer() - start, exception)
+    return profiled
+
+
+def instrument(serializer):
+    """
+    Replaces the profiled methods of the serializer instance fields by recording wrappers. The wrappers are set on
+    the field objects of the instance, the field classes and the fields of the serializer class are not changed.
+    """
+    serializer_key = get_serializer_key(serializer.__class__)
+    for field_name, field in serializer.fields.items():
+        for method_name in PROFILED_METHODS:
+            method = getattr(field, method_name, None)
+            if method is None:
+                continue
+            field.__dict__[method_name] = _profiled_method(serializer_key, field_name, method_name, method)
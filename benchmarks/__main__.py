@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""
+Runs the benchmark suite.
+
+Run with: python -m benchmarks [-k NAME ...] [--min-time SECONDS] [--save FILE] [--compare FILE] [--threshold PCT]
+"""
+import argparse
+import sys
+
+from benchmarks import runner
+from benchmarks import workloads  # noqa: registers the benchmarks
+try:
+    import django  # noqa
+except ImportError:
+    django = None
+else:
+    from benchmarks import django_workloads  # noqa: registers the benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Runs the aserializer benchmarks.')
+    parser.add_argument('-k', dest='filters', action='append', help='only run benchmarks containing this name')
+    parser.add_argument('--list', action='store_true', help='list the benchmark names')
+    parser.add_argument('--min-time', type=float, default=0.5, help='minimum measured time per benchmark')
+    parser.add_argument('--save', help='save the results as json baseline')
+    parser.add_argument('--compare', help='compare the results with a saved baseline')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='exit with status 1 if a benchmark is slower than the baseline by this percentage')
+    args = parser.parse_args(argv)
+    if args.list:
+        for bench in runner.select(args.filters):
+            print(bench.name)
+        return 0
+    baseline = runner.load_baseline(args.compare) if args.compare else None
+    results, regressions = runner.run(name_filters=args.filters, min_time=args.min_time, baseline=baseline,
+                                      threshold=args.threshold)
+    if args.save:
+        runner.save_results(results, args.save)
+    if regressions:
+        print('Slower than the baseline: {}'.format(', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Generic versus compiled serializer mode for initial + dump and initial + to_dict.
+
+Run with: python -m benchmarks.compiled
+"""
+import timeit
+
+from aserializer import Serializer, IntegerField, StringField, BooleanField, FloatField
+from aserializer.utils import codegen
+
+
+FIELD_COUNTS = (5, 25, 100)
+NUMBER = 2000
+
+
+def make_serializer_class(field_count):
+    attrs = {}
+    field_types = (IntegerField, StringField, BooleanField, FloatField)
+    for i in range(field_count):
+        attrs['field_{}'.format(i)] = field_types[i % len(field_types)](required=False)
+    return type('Bench{}Serializer'.format(field_count), (Serializer,), attrs)
+
+
+def make_source(field_count):
+    values = (1, 'value', True, 1.5)
+    return dict(('field_{}'.format(i), values[i % len(values)]) for i in range(field_count))
+
+
+def per_call_us(func, number=NUMBER):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def measure(serializer_cls, sources):
+    serializer = serializer_cls()
+
+    def dump():
+        serializer.reset(sources)
+        return serializer.dump()
+
+    def to_dict():
+        serializer.reset(sources)
+        return serializer.to_dict()
+    return per_call_us(dump), per_call_us(to_dict)
+
+
+def run():
+    print('{:>7} {:>16} {:>16} {:>18} {:>18}'.format('fields', 'dump (us)', 'dump comp. (us)', 'to_dict (us)',
+                                                     'to_dict comp. (us)'))
+    for field_count in FIELD_COUNTS:
+        serializer_cls = make_serializer_class(field_count)
+        source = make_source(field_count)
+        codegen.set_compiled_default(False)
+        dump_time, dict_time = measure(serializer_cls, source)
+        codegen.set_compiled_default(True)
+        compiled_dump_time, compiled_dict_time = measure(serializer_cls, source)
+        codegen.set_compiled_default(False)
+        print('{:>7} {:>16.1f} {:>16.1f} {:>18.1f} {:>18.1f}'.format(field_count, dump_time, compiled_dump_time,
+                                                                     dict_time, compiled_dict_time))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+from django.db import models
+
+
+class BenchAuthor(models.Model):
+    name = models.CharField(max_length=50)
+    email = models.EmailField()
+
+
+class BenchBook(models.Model):
+    title = models.CharField(max_length=100)
+    number = models.IntegerField()
+    price = models.DecimalField(decimal_places=2, max_digits=8)
+    published = models.DateTimeField()
+    available = models.BooleanField(default=True)
+    author = models.ForeignKey(BenchAuthor, related_name='books', on_delete=models.CASCADE)
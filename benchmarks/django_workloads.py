@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Django workloads against an in-memory SQLite database. The database is created and filled on the first use.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+from benchmarks.runner import benchmark
+
+
+BOOK_COUNT = 2000
+AUTHOR_COUNT = 50
+
+_models = None
+_serializers = None
+
+
+def setup_django():
+    """
+    Configures Django with the benchmark app, creates the tables and returns the models module.
+    """
+    global _models
+    if _models is not None:
+        return _models
+    import django
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure(
+            DEBUG=False,
+            DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+            INSTALLED_APPS=['benchmarks.django_app'],
+            USE_TZ=False,
+        )
+    if hasattr(django, 'setup'):
+        django.setup()
+    from django.db import connection
+    from benchmarks.django_app import models
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(models.BenchAuthor)
+        schema_editor.create_model(models.BenchBook)
+    authors = [models.BenchAuthor(name='Author {}'.format(i), email='author{}@example.com'.format(i))
+               for i in range(AUTHOR_COUNT)]
+    models.BenchAuthor.objects.bulk_create(authors)
+    authors = list(models.BenchAuthor.objects.all())
+    books = [models.BenchBook(title='Book {}'.format(i), number=i, price=Decimal('9.99'),
+                              published=datetime(2016, 1, 1, 12, 0, 0), author=authors[i % AUTHOR_COUNT])
+             for i in range(BOOK_COUNT)]
+    models.BenchBook.objects.bulk_create(books)
+    _models = models
+    return _models
+
+
+def book_serializers(models):
+    """
+    Returns the collection classes for the book model, the serializer classes are created once.
+    """
+    global _serializers
+    if _serializers is not None:
+        return _serializers
+    from aserializer import Serializer, IntegerField, StringField, DecimalField, DatetimeField, BooleanField
+    from aserializer.fields import SerializerField
+    from aserializer.django.collection import DjangoCollectionSerializer
+    from aserializer.django.serializers import DjangoModelSerializer
+
+    class BenchAuthorSerializer(Serializer):
+        id = IntegerField(required=True, identity=True)
+        name = StringField(required=True)
+        email = StringField(required=True)
+
+    class BenchBookSerializer(Serializer):
+        id = IntegerField(required=True, identity=True)
+        title = StringField(required=True)
+        number = IntegerField(required=True)
+        price = DecimalField(decimal_places=2)
+        published = DatetimeField(required=True)
+        available = BooleanField()
+        author = SerializerField(BenchAuthorSerializer)
+
+    class BenchBookModelSerializer(DjangoModelSerializer):
+
+        class Meta:
+            model = models.BenchBook
+
+    class BookCollection(DjangoCollectionSerializer):
+        class Meta:
+            serializer = BenchBookSerializer
+
+    class BookModelCollection(DjangoCollectionSerializer):
+        class Meta:
+            serializer = BenchBookModelSerializer
+
+    class BookCursorCollection(DjangoCollectionSerializer):
+        class Meta:
+            serializer = BenchBookSerializer
+            cursor_pagination = True
+
+    class BookPlannedCollection(DjangoCollectionSerializer):
+        class Meta:
+            serializer = BenchBookSerializer
+            plan_relations = True
+
+    class BookProjectedCollection(DjangoCollectionSerializer):
+        class Meta:
+            serializer = BenchBookSerializer
+            plan_relations = True
+            project_columns = True
+
+    _serializers = (BookCollection, BookModelCollection, BookCursorCollection, BookPlannedCollection,
+                    BookProjectedCollection)
+    return _serializers
+
+
+@benchmark('django.collection.dump', items=100)
+def django_collection_dump():
+    models = setup_django()
+    book_collection = book_serializers(models)[0]
+    return lambda: book_collection(models.BenchBook.objects.all(), limit=100, offset=500).dump()
+
+
+@benchmark('django.collection.sort_paginate', items=100)
+def django_collection_sort_paginate():
+    models = setup_django()
+    book_collection = book_serializers(models)[0]
+    return lambda: book_collection(models.BenchBook.objects.all(), sort=['-number'], limit=100, offset=500).dump()
+
+
+@benchmark('django.collection.has_more', items=100)
+def django_collection_has_more():
+    models = setup_django()
+    book_collection = book_serializers(models)[0]
+    return lambda: book_collection(models.BenchBook.objects.all(), limit=100, offset=500, count_mode='has_more').dump()
+
+
+@benchmark('django.collection.plan_relations', items=100)
+def django_collection_plan_relations():
+    models = setup_django()
+    book_planned_collection = book_serializers(models)[3]
+    return lambda: book_planned_collection(models.BenchBook.objects.all(), limit=100, offset=500,
+                                           count_mode='has_more').dump()
+
+
+@benchmark('django.collection.project_columns', items=100)
+def django_collection_project_columns():
+    models = setup_django()
+    book_projected_collection = book_serializers(models)[4]
+    return lambda: book_projected_collection(models.BenchBook.objects.all(), fields=['title', 'author.name'], limit=100,
+                                             offset=500, count_mode='has_more').dump()
+
+
+@benchmark('django.model_serializer.collection.dump', items=100)
+def django_model_collection_dump():
+    models = setup_django()
+    book_model_collection = book_serializers(models)[1]
+    return lambda: book_model_collection(models.BenchBook.objects.all(), limit=100, offset=500).dump()
+
+
+@benchmark('django.collection.cursor_paginate', items=100)
+def django_collection_cursor_paginate():
+    from aserializer.django.cursor import encode_cursor, NEXT
+    models = setup_django()
+    book_cursor_collection = book_serializers(models)[2]
+    row = models.BenchBook.objects.order_by('-number', 'pk')[499]
+    cursor = encode_cursor(NEXT, [row.number, row.pk])
+    return lambda: book_cursor_collection(models.BenchBook.objects.all(), sort=['-number'], limit=100,
+                                          cursor=cursor).dump()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Serializer instantiation time versus the number of fields.
+
+Run with: python -m benchmarks.instantiation
+"""
+import copy
+import timeit
+
+from aserializer import Serializer, IntegerField, StringField, DatetimeField, ListField
+
+
+FIELD_COUNTS = (5, 10, 25, 50, 100)
+NUMBER = 2000
+
+
+def make_serializer_class(field_count):
+    attrs = {}
+    field_types = (IntegerField, StringField, DatetimeField)
+    for i in range(field_count):
+        field_cls = field_types[i % len(field_types)]
+        attrs['field_{}'.format(i)] = field_cls(required=False)
+    attrs['tags'] = ListField(StringField, required=False)
+    return type('Bench{}Serializer'.format(field_count), (Serializer,), attrs)
+
+
+def make_source(field_count):
+    source = {}
+    for i in range(field_count):
+        if i % 3 == 0:
+            source['field_{}'.format(i)] = i
+        elif i % 3 == 1:
+            source['field_{}'.format(i)] = 'value {}'.format(i)
+        else:
+            source['field_{}'.format(i)] = '2016-01-01T12:00:00'
+    source['tags'] = ['a', 'b']
+    return source
+
+
+def per_call_us(func, number=NUMBER):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def run():
+    print('{:>7} {:>18} {:>18} {:>18}'.format('fields', 'deepcopy (us)', 'empty init (us)', 'init+source (us)'))
+    for field_count in FIELD_COUNTS:
+        serializer_cls = make_serializer_class(field_count)
+        source = make_source(field_count)
+        deepcopy_time = per_call_us(lambda: copy.deepcopy(serializer_cls._base_fields))
+        empty_time = per_call_us(lambda: serializer_cls())
+        source_time = per_call_us(lambda: serializer_cls(source))
+        print('{:>7} {:>18.1f} {:>18.1f} {:>18.1f}'.format(field_count, deepcopy_time, empty_time, source_time))
+
+
+if __name__ == '__main__':
+    run()
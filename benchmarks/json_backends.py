@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Decoding and encoding time of the installed json backends on typical serializer payloads.
+
+Run with: python -m benchmarks.json_backends
+"""
+import timeit
+
+from aserializer import Serializer, IntegerField, StringField, DatetimeField, ListField
+from aserializer.collection import CollectionSerializer
+from aserializer.fields import SerializerField
+from aserializer.utils.json_codecs import available_backends, get_backend
+
+
+NUMBER = 500
+
+
+class AddressSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    street = StringField(required=True)
+    city = StringField(required=True)
+    country = StringField(required=True)
+
+
+class UserSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True)
+    email = StringField(required=True)
+    created = DatetimeField(required=True)
+    tags = ListField(StringField, required=False)
+    address = SerializerField(AddressSerializer, required=True)
+
+
+class UserCollection(CollectionSerializer):
+    class Meta:
+        serializer = UserSerializer
+
+
+def make_user(i):
+    return dict(id=i, name='User {}'.format(i), email='user{}@example.com'.format(i),
+                created='2016-01-01T12:00:00', tags=['a', 'b', 'c'],
+                address=dict(id=i, street='Street {}'.format(i), city='Berlin', country='Germany'))
+
+
+def per_call_us(func, number=NUMBER):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def run():
+    user = UserSerializer(make_user(1)).dump()
+    collection = UserCollection([make_user(i) for i in range(100)], limit=100).dump()
+    payloads = (('user', user), ('collection', collection))
+    print('{:>12} {:>12} {:>14} {:>14} {:>18}'.format('backend', 'payload', 'loads (us)', 'dumps (us)',
+                                                      'serializer (us)'))
+    for name in available_backends():
+        backend = get_backend(name)
+        meta = type('Meta', (object,), {'json_backend': name, 'serializer': UserSerializer})
+        serializer_cls = type('User{}Serializer'.format(name), (UserSerializer,), {'Meta': meta})
+        collection_cls = type('User{}Collection'.format(name), (UserCollection,), {'Meta': meta})
+        for payload_name, payload in payloads:
+            encoded = backend.dumps(payload)
+            loads_time = per_call_us(lambda: backend.loads(encoded))
+            dumps_time = per_call_us(lambda: backend.dumps(payload))
+            if payload_name == 'user':
+                serializer_time = per_call_us(lambda: serializer_cls(encoded).to_json())
+            else:
+                items = backend.loads(encoded)['items']
+                serializer_time = per_call_us(lambda: collection_cls(items, limit=100).to_json(), number=20)
+            print('{:>12} {:>12} {:>14.1f} {:>14.1f} {:>18.1f}'.format(name, payload_name, loads_time,
+                                                                       dumps_time, serializer_time))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+A small benchmark runner. A benchmark is a setup function which returns the callable to measure, it is registered
+with the benchmark decorator. The runner reports ops/sec, per item latency percentiles and the peak memory of one
+call and compares the results against a saved baseline.
+"""
+import gc
+import json
+import time
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+timer = getattr(time, 'perf_counter', time.time)
+
+BENCHMARKS = []
+
+
+class Benchmark(object):
+
+    def __init__(self, name, setup, items=1):
+        self.name = name
+        self.setup = setup
+        self.items = items
+
+
+def benchmark(name, items=1):
+    """
+    Registers a setup function as benchmark. The items are the number of objects handled by one call, the latency
+    percentiles are reported per item.
+    """
+    def decorator(setup):
+        BENCHMARKS.append(Benchmark(name, setup, items=items))
+        return setup
+    return decorator
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def peak_memory(func):
+    """
+    Returns the peak of the memory allocated by one call in bytes, or None if tracemalloc is not available.
+    """
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(bench, min_time=0.5, max_calls=100000):
+    func = bench.setup()
+    func()
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        total = 0.0
+        while total < min_time and len(samples) < max_calls:
+            start = timer()
+            func()
+            duration = timer() - start
+            samples.append(duration)
+            total += duration
+    finally:
+        if gc_enabled:
+            gc.enable()
+    samples.sort()
+    per_item = [sample / bench.items for sample in samples]
+    return {
+        'name': bench.name,
+        'items': bench.items,
+        'calls': len(samples),
+        'ops_per_sec': len(samples) / total if total else 0.0,
+        'items_per_sec': len(samples) * bench.items / total if total else 0.0,
+        'p50_us': percentile(per_item, 0.50) * 1e6,
+        'p95_us': percentile(per_item, 0.95) * 1e6,
+        'p99_us': percentile(per_item, 0.99) * 1e6,
+        'peak_memory_kb': None if tracemalloc is None else peak_memory(func) / 1024.0,
+    }
+
+
+def select(name_filters=None):
+    if not name_filters:
+        return list(BENCHMARKS)
+    return [bench for bench in BENCHMARKS if any(name_filter in bench.name for name_filter in name_filters)]
+
+
+def format_result(result, baseline=None):
+    memory = result['peak_memory_kb']
+    line = '{:<40} {:>12.1f} {:>10.2f} {:>10.2f} {:>10.2f} {:>12}'.format(
+        result['name'], result['ops_per_sec'], result['p50_us'], result['p95_us'], result['p99_us'],
+        '-' if memory is None else '{:.1f}'.format(memory))
+    if baseline is not None and baseline.get('ops_per_sec'):
+        change = (result['ops_per_sec'] / baseline['ops_per_sec'] - 1.0) * 100.0
+        line += ' {:>+9.1f}%'.format(change)
+    return line
+
+
+def run(name_filters=None, min_time=0.5, baseline=None, threshold=None, out=None):
+    """
+    Runs the selected benchmarks and prints a line per benchmark. The baseline is a dictionary of results by name,
+    if a threshold in percent is given the names of the benchmarks slower than the baseline by more than the
+    threshold are returned as regressions.
+    """
+    write = out or print_line
+    header = '{:<40} {:>12} {:>10} {:>10} {:>10} {:>12}'.format('benchmark', 'ops/sec', 'p50 (us)', 'p95 (us)',
+                                                                'p99 (us)', 'peak (KiB)')
+    if baseline is not None:
+        header += ' {:>10}'.format('vs base')
+    write(header)
+    results = []
+    regressions = []
+    for bench in select(name_filters):
+        result = measure(bench, min_time=min_time)
+        base = baseline.get(bench.name) if baseline is not None else None
+        write(format_result(result, base))
+        results.append(result)
+        if threshold is not None and base is not None and base.get('ops_per_sec'):
+            if result['ops_per_sec'] < base['ops_per_sec'] * (1.0 - threshold / 100.0):
+                regressions.append(bench.name)
+    return results, regressions
+
+
+def print_line(line):
+    print(line)
+
+
+def save_results(results, path):
+    with open(path, 'w') as fp:
+        json.dump(dict((result['name'], result) for result in results), fp, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    with open(path) as fp:
+        return json.load(fp)
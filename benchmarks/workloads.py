@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Serializer, field and collection workloads.
+"""
+import uuid
+from datetime import datetime, date, time
+from decimal import Decimal
+
+from aserializer import (Serializer, IntegerField, PositiveIntegerField, FloatField, DecimalField, BooleanField,
+                         StringField, EmailField, UUIDField, UrlField, ChoiceField, DatetimeField, DateField,
+                         TimeField, ListField, ListSerializerField, TypeField)
+from aserializer.collection import CollectionSerializer
+from aserializer.fields import SerializerField
+
+from benchmarks.runner import benchmark
+
+
+LIST_SIZES = (1000, 5000)
+COLLECTION_SIZE = 1000
+
+
+class FlatSerializer(Serializer):
+    _type = TypeField('flat')
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True, max_length=50)
+    email = EmailField(required=True)
+    score = FloatField(required=False)
+    price = DecimalField(required=False, decimal_places=2)
+    active = BooleanField()
+    created = DatetimeField(required=True)
+    uuid = UUIDField(required=False)
+    tags = ListField(StringField, required=False)
+
+
+class FlatObject(object):
+
+    def __init__(self, i):
+        self.id = i
+        self.name = 'Name {}'.format(i)
+        self.email = 'user{}@example.com'.format(i)
+        self.score = i * 1.5
+        self.price = Decimal('12.50')
+        self.active = bool(i % 2)
+        self.created = datetime(2016, 1, 1, 12, 0, 0)
+        self.uuid = uuid.UUID('00000000-0000-0000-0000-{:012d}'.format(i))
+        self.tags = ['a', 'b']
+
+
+def flat_source(i):
+    return dict(id=i, name='Name {}'.format(i), email='user{}@example.com'.format(i), score=i * 1.5, price='12.50',
+                active=bool(i % 2), created='2016-01-01T12:00:00', uuid='00000000-0000-0000-0000-{:012d}'.format(i),
+                tags=['a', 'b'])
+
+
+class LevelFourSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True)
+
+
+class LevelThreeSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True)
+    child = SerializerField(LevelFourSerializer)
+
+
+class LevelTwoSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True)
+    child = SerializerField(LevelThreeSerializer)
+
+
+class LevelOneSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True)
+    child = SerializerField(LevelTwoSerializer)
+    children = ListSerializerField(LevelTwoSerializer, required=False)
+
+
+def nested_source(depth=4):
+    source = dict(id=depth, name='level {}'.format(depth))
+    if depth > 1:
+        source['child'] = nested_source(depth - 1)
+    return source
+
+
+class ItemSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True)
+    number = IntegerField(required=False)
+
+
+class ItemListSerializer(Serializer):
+    items = ListSerializerField(ItemSerializer, required=True)
+
+
+class IntegerListSerializer(Serializer):
+    numbers = ListField(IntegerField, required=True)
+
+
+class ItemCollection(CollectionSerializer):
+
+    class Meta:
+        serializer = ItemSerializer
+
+
+class OwnedItemSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    owner = SerializerField(FlatSerializer)
+
+    class Meta:
+        lazy_nested = True
+
+
+class OwnedItemCollection(CollectionSerializer):
+
+    class Meta:
+        serializer = OwnedItemSerializer
+        identity_map = True
+
+
+def item_source(i):
+    return dict(id=i, name='Item {}'.format(i % 97), number=i % 13)
+
+
+@benchmark('serializer.flat.dump.dict')
+def flat_dump_dict():
+    source = flat_source(1)
+    return lambda: FlatSerializer(source).dump()
+
+
+@benchmark('serializer.flat.dump.object')
+def flat_dump_object():
+    source = FlatObject(1)
+    return lambda: FlatSerializer(source).dump()
+
+
+@benchmark('serializer.flat.validate')
+def flat_validate():
+    source = flat_source(1)
+    return lambda: FlatSerializer(source).is_valid()
+
+
+@benchmark('serializer.flat.to_json')
+def flat_to_json():
+    source = flat_source(1)
+    return lambda: FlatSerializer(source).to_json()
+
+
+@benchmark('serializer.flat.dump_many', items=100)
+def flat_dump_many():
+    sources = [flat_source(i) for i in range(100)]
+    return lambda: FlatSerializer.dump_many(sources)
+
+
+@benchmark('serializer.nested.dump')
+def nested_dump():
+    source = nested_source()
+    source['children'] = [nested_source(3) for _ in range(5)]
+    return lambda: LevelOneSerializer(source).dump()
+
+
+def list_serializer_benchmark(size):
+    @benchmark('list_serializer_field.dump.{}'.format(size), items=size)
+    def setup():
+        source = dict(items=[item_source(i) for i in range(size)])
+        return lambda: ItemListSerializer(source).dump()
+
+
+def list_field_benchmark(size):
+    @benchmark('list_field.integer.dump.{}'.format(size), items=size)
+    def setup():
+        source = dict(numbers=list(range(size)))
+        return lambda: IntegerListSerializer(source).dump()
+
+
+for _size in LIST_SIZES:
+    list_serializer_benchmark(_size)
+    list_field_benchmark(_size)
+
+
+@benchmark('collection.dump', items=100)
+def collection_dump():
+    objects = [item_source(i) for i in range(COLLECTION_SIZE)]
+    return lambda: ItemCollection(objects, limit=100, offset=200).dump()
+
+
+@benchmark('collection.sort_paginate', items=50)
+def collection_sort_paginate():
+    objects = [item_source(i) for i in range(COLLECTION_SIZE)]
+    return lambda: ItemCollection(objects, sort=['-number', 'name'], limit=50, offset=100).dump()
+
+
+@benchmark('collection.identity_map', items=100)
+def collection_identity_map():
+    owners = [FlatObject(i) for i in range(5)]
+    objects = [dict(id=i, owner=owners[i % 5]) for i in range(COLLECTION_SIZE)]
+    return lambda: OwnedItemCollection(objects, limit=100).dump()
+
+
+FIELD_CASES = (
+    ('integer', lambda: IntegerField(max_value=1000, min_value=0), '42'),
+    ('positive_integer', lambda: PositiveIntegerField(), 42),
+    ('float', lambda: FloatField(), '4.2'),
+    ('decimal', lambda: DecimalField(decimal_places=2), '12.345'),
+    ('boolean', lambda: BooleanField(), 'false'),
+    ('string', lambda: StringField(max_length=50, min_length=2), 'the name'),
+    ('email', lambda: EmailField(), 'user@example.com'),
+    ('uuid', lambda: UUIDField(), '4b3a4f7d-3f6c-4bd6-a1f5-1c0c7e4c2a11'),
+    ('url', lambda: UrlField(base='http://www.example.com'), 'api/items/1'),
+    ('choice', lambda: ChoiceField(choices=[(str(i), 'choice {}'.format(i)) for i in range(20)]), 'choice 15'),
+    ('datetime', lambda: DatetimeField(), '2016-01-01T12:00:00'),
+    ('datetime.instance', lambda: DatetimeField(), datetime(2016, 1, 1, 12, 0, 0)),
+    ('date', lambda: DateField(), '2016-01-01'),
+    ('date.instance', lambda: DateField(), date(2016, 1, 1)),
+    ('time', lambda: TimeField(), '12:00:00'),
+    ('time.instance', lambda: TimeField(), time(12, 0, 0)),
+    ('list.integer', lambda: ListField(IntegerField), [1, 2, 3, 4, 5]),
+)
+
+
+def field_benchmark(name, field_factory, value):
+    @benchmark('field.{}'.format(name))
+    def setup():
+        field = field_factory()
+
+        def run():
+            field.set_value(value)
+            field.validate()
+            field.to_python()
+            return field.to_native()
+        return run
+
+
+for _name, _field_factory, _value in FIELD_CASES:
+    field_benchmark(_name, _field_factory, _value)
@@ -49,7 +49,7 @@ basic_setup = dict(
     description='An object serializer inspired by the django forms.',
     long_description=long_description,
     url='https://github.com/onyg/aserializer',
-    packages=find_packages(exclude=('tests', 'tests.*')),
+    packages=find_packages(exclude=('tests', 'tests.*', 'benchmarks', 'benchmarks.*')),
     platforms=['any'],
     classifiers=CLASSIFIERS,
     test_suite='nose.collector',
@@ -1,11 +1,15 @@
 # -*- coding: utf-8 -*-
 
+import io
+import json
 import unittest
 
 from aserializer.collection.base import CollectionSerializer
+from aserializer.utils.json_codecs import available_backends
+from aserializer.utils import identity_map
 from aserializer.utils.options import CollectionMetaOptions
 from aserializer import Serializer
-from aserializer.fields import StringField, IntegerField
+from aserializer.fields import StringField, IntegerField, SerializerField
 
 
 class TestSerializer(Serializer):
@@ -84,6 +88,39 @@ class CollectionTestCase(unittest.TestCase):
         dump = collection.item(dict(name='The Name', number=15))
         self.assertDictEqual(dump, dict(name='The Name', number=15))
 
+    def test_item_serializer_reuse(self):
+        collection = TestCollectionSerializer([])
+        self.assertDictEqual(collection.item(dict(name='The Name', number=9)), {'name': 'The Name', 'number': 9})
+        serializer = collection.get_item_serializer(dict(name='The Name 2', number=6))
+        self.assertIs(serializer, collection.get_item_serializer(dict(number=7)))
+        self.assertDictEqual(collection.item(dict(name='The Name 3')), {})
+        self.assertDictEqual(collection.item(dict(number=8, name='The Name 4')), {'name': 'The Name 4', 'number': 8})
+
+    def test_items_unknown_error(self):
+        objects = [dict(name='The Name', number=9), dict(name='The Name 2', number=6, unknown='value'),
+                   dict(name='The Name 3', number=7)]
+        dump = TestCollectionSerializer(objects, unknown_error=True).dump()
+        self.assertListEqual(dump['items'], [{'name': 'The Name', 'number': 9}, {},
+                                             {'name': 'The Name 3', 'number': 7}])
+        dump = TestCollectionSerializer(objects[1:] + objects[:1], unknown_error=True).dump()
+        self.assertListEqual(dump['items'], [{}, {'name': 'The Name 3', 'number': 7},
+                                             {'name': 'The Name', 'number': 9}])
+
+    def test_item_serializer_own_init(self):
+        class TagSerializer(TestSerializer):
+            def __init__(self, source=None, *args, **kwargs):
+                super(TagSerializer, self).__init__(source, *args, **kwargs)
+                if source is not None:
+                    self.name = source['tag']
+
+        class TagCollectionSerializer(CollectionSerializer):
+            class Meta:
+                serializer = TagSerializer
+
+        objects = [dict(tag='A', number=5), dict(tag='B', number=6), dict(tag='C', number=7)]
+        dump = TagCollectionSerializer(objects).dump()
+        self.assertListEqual([item['name'] for item in dump['items']], ['A', 'B', 'C'])
+
     def test_items(self):
         collection = TestCollectionSerializer([])
         objects = [
@@ -171,6 +208,20 @@ class CollectionTestCase(unittest.TestCase):
         self.assertEqual(olist[3]['name'], '3')
         self.assertEqual(olist[3]['number'], 5)
 
+    def test_pre_sort_page(self):
+        collection = TestCollectionSerializer([])
+        objects = [dict(name=str(i % 7), number=i % 5, position=i) for i in range(200)]
+        for sort in (['name'], ['-name'], ['name', 'number'], ['-name', '-number'], ['name', '-number'],
+                     ['-number', 'name']):
+            expected = objects
+            for s in reversed(sort):
+                name = s.lstrip('-')
+                expected = sorted(expected, key=lambda item: item[name], reverse=s.startswith('-'))
+            for offset, limit in ((0, 5), (10, 5), (190, 20), (0, 200), (-1, 5)):
+                olist = collection._pre(objects, limit=limit, offset=offset, sort=sort)
+                self.assertListEqual(olist, expected[offset:offset + limit])
+            self.assertListEqual(collection._pre(objects, sort=sort), expected)
+            self.assertListEqual(collection._pre(iter(objects), limit=5, offset=5, sort=sort), expected[5:10])
 
     def test_metadata(self):
         collection = TestCollectionSerializer([])
@@ -203,6 +254,212 @@ class CollectionTestCase(unittest.TestCase):
         self.assertEqual(metadata['offset'], 1)
 
 
+class ChunkWriter(object):
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+
+class CollectionJSONStreamTests(unittest.TestCase):
+
+    def get_objects(self, count=25):
+        return [dict(name=u'The Name \xe4 {}'.format(i), number=5 + i % 5) for i in range(count)]
+
+    def test_iter_json(self):
+        for backend in available_backends():
+            meta = type('Meta', (object,), dict(serializer=TestSerializer, json_backend=backend))
+            collection_cls = type('StreamCollectionSerializer', (CollectionSerializer,), dict(Meta=meta))
+            for indent in (None, 2, 4):
+                for objects in (self.get_objects(), self.get_objects(1), []):
+                    to_json = collection_cls(objects, limit=20, offset=2).to_json(indent=indent)
+                    chunks = list(collection_cls(objects, limit=20, offset=2).iter_json(indent=indent))
+                    self.assertEqual(''.join(chunks), to_json)
+
+    def test_iter_json_without_metadata(self):
+        class NoMetadataCollectionSerializer(CollectionSerializer):
+            class Meta:
+                serializer = TestSerializer
+                with_metadata = False
+
+        objects = self.get_objects()
+        for indent in (None, 2):
+            collection = NoMetadataCollectionSerializer(objects, limit=30)
+            self.assertEqual(''.join(collection.iter_json(indent=indent)),
+                             NoMetadataCollectionSerializer(objects, limit=30).to_json(indent=indent))
+
+    def test_iter_json_after_dump(self):
+        collection = TestCollectionSerializer(self.get_objects(), limit=5)
+        dump = collection.dump()
+        self.assertEqual(''.join(collection.iter_json(indent=2)), collection.to_json(indent=2))
+        self.assertIs(collection.dump(), dump)
+
+    def test_iter_json_does_not_keep_items(self):
+        collection = TestCollectionSerializer(self.get_objects(), limit=5)
+        ''.join(collection.iter_json())
+        self.assertFalse(hasattr(collection, 'result'))
+
+    def test_to_json_stream(self):
+        objects = self.get_objects(100)
+        to_json = TestCollectionSerializer(objects, limit=100).to_json()
+        writer = ChunkWriter()
+        TestCollectionSerializer(objects, limit=100).to_json_stream(writer)
+        self.assertEqual(''.join(writer.chunks), to_json)
+        fp = io.BytesIO()
+        TestCollectionSerializer(objects, limit=100).to_json_stream(fp, encoding='utf-8')
+        self.assertEqual(fp.getvalue(), to_json.encode('utf-8'))
+
+
+class ObjectSource(object):
+
+    def __init__(self, size):
+        self.size = size
+        self.consumed = 0
+
+    def __iter__(self):
+        for i in range(self.size):
+            self.consumed += 1
+            yield dict(name='Name {}'.format(i % 3), number=5 + i % 6)
+
+
+class CollectionIterableTests(unittest.TestCase):
+
+    def test_same_output(self):
+        objects = list(ObjectSource(25))
+        for kwargs in (dict(), dict(limit=5, offset=10), dict(limit=5, offset=20), dict(limit=5, offset=-2),
+                       dict(sort=['-number', 'name'], limit=5, offset=3)):
+            expected = TestCollectionSerializer(objects, **kwargs).dump()
+            self.assertEqual(TestCollectionSerializer(iter(ObjectSource(25)), **kwargs).dump(), expected)
+            to_json = TestCollectionSerializer(objects, **kwargs).to_json()
+            self.assertEqual(''.join(TestCollectionSerializer(iter(ObjectSource(25)), **kwargs).iter_json()), to_json)
+
+    def test_counted_after_page(self):
+        source = ObjectSource(25)
+        collection = TestCollectionSerializer(iter(source), limit=5, offset=5)
+        self.assertRaises(TypeError, len, collection)
+        dump = collection.dump()
+        self.assertEqual(dump['_metadata']['totalCount'], 25)
+        self.assertEqual(len(dump['items']), 5)
+        self.assertEqual(source.consumed, 25)
+        self.assertEqual(len(collection), 25)
+
+    def test_offset_after_end(self):
+        dump = TestCollectionSerializer(iter(ObjectSource(5)), limit=5, offset=10).dump()
+        self.assertEqual(dump, {'_metadata': dict(offset=5, limit=5, totalCount=5), 'items': []})
+
+    def test_offset_after_count(self):
+        source = ObjectSource(5)
+        dump = TestCollectionSerializer(iter(source), limit=2, offset=10, count=5).dump()
+        self.assertEqual(dump, {'_metadata': dict(offset=5, limit=5, totalCount=5), 'items': []})
+        self.assertEqual(source.consumed, 0)
+        source = ObjectSource(5)
+        chunks = TestCollectionSerializer(iter(source), limit=2, offset=10, count=5).iter_json()
+        self.assertEqual(json.loads(''.join(chunks))['items'], [])
+        self.assertEqual(source.consumed, 0)
+
+    def test_count_argument(self):
+        for count in (25, lambda: 25):
+            source = ObjectSource(25)
+            dump = TestCollectionSerializer(iter(source), limit=5, offset=5, count=count).dump()
+            self.assertEqual(dump['_metadata'], dict(offset=5, limit=5, totalCount=25))
+            self.assertEqual(len(dump['items']), 5)
+            self.assertEqual(source.consumed, 10)
+
+    def test_without_metadata(self):
+        source = ObjectSource(25)
+        collection = TestCollectionSerializer(iter(source), limit=5)
+        collection.with_metadata = False
+        self.assertEqual(len(collection.dump()), 5)
+        self.assertEqual(source.consumed, 5)
+
+
+class ReadCountingObject(object):
+
+    def __init__(self, pk, name):
+        self.pk = pk
+        self._name = name
+        self.reads = 0
+
+    @property
+    def name(self):
+        self.reads += 1
+        return self._name
+
+
+class OwnerSerializer(Serializer):
+    pk = IntegerField(required=True)
+    name = StringField(required=True)
+
+
+class OwnedSerializer(Serializer):
+    name = StringField(required=True)
+    owner = SerializerField(OwnerSerializer)
+
+    class Meta:
+        lazy_nested = True
+
+
+class OwnedCollectionSerializer(CollectionSerializer):
+
+    class Meta:
+        serializer = OwnedSerializer
+        identity_map = True
+
+
+class PlainOwnedCollectionSerializer(CollectionSerializer):
+
+    class Meta:
+        serializer = OwnedSerializer
+
+
+class CollectionIdentityMapTests(unittest.TestCase):
+
+    def get_objects(self):
+        owner = ReadCountingObject(1, 'owner')
+        same_owner = ReadCountingObject(1, 'owner')
+        other_owner = ReadCountingObject(2, 'other')
+        objects = [dict(name='a', owner=owner), dict(name='b', owner=other_owner), dict(name='c', owner=owner),
+                   dict(name='d', owner=same_owner), dict(name='e', owner=None)]
+        return objects, [owner, same_owner, other_owner]
+
+    def test_same_output(self):
+        objects, _ = self.get_objects()
+        plain = PlainOwnedCollectionSerializer(objects).dump()
+        self.assertEqual(OwnedCollectionSerializer(objects).dump(), plain)
+        self.assertEqual(plain['items'][4], dict(name='e', owner=None))
+
+    def test_repeated_objects_are_serialized_once(self):
+        objects, (owner, same_owner, other_owner) = self.get_objects()
+        items = OwnedCollectionSerializer(objects).dump()['items']
+        self.assertIs(items[0]['owner'], items[2]['owner'])
+        self.assertIs(items[0]['owner'], items[3]['owner'])
+        self.assertIsNot(items[0]['owner'], items[1]['owner'])
+        self.assertEqual((owner.reads, same_owner.reads, other_owner.reads), (1, 0, 1))
+
+    def test_scope_of_one_dump(self):
+        objects, (owner, _, _) = self.get_objects()
+        items = PlainOwnedCollectionSerializer(objects).dump()['items']
+        self.assertIsNot(items[0]['owner'], items[2]['owner'])
+        self.assertEqual(owner.reads, 2)
+        first = OwnedCollectionSerializer(objects).dump()['items']
+        second = OwnedCollectionSerializer(objects).dump()['items']
+        self.assertIsNot(first[0]['owner'], second[0]['owner'])
+
+    def test_streaming(self):
+        objects, (owner, same_owner, other_owner) = self.get_objects()
+        chunks = OwnedCollectionSerializer(objects).iter_json()
+        first = next(chunks)
+        self.assertIsNone(identity_map.get_identities())
+        to_json = first + ''.join(chunks)
+        self.assertEqual((owner.reads, same_owner.reads, other_owner.reads), (1, 0, 1))
+        self.assertEqual(json.loads(to_json), json.loads(PlainOwnedCollectionSerializer(objects).to_json()))
+        self.assertIsNone(identity_map.get_identities())
+        objects, (owner, _, _) = self.get_objects()
+        OwnedCollectionSerializer(objects).to_json_stream(ChunkWriter())
+        self.assertEqual(owner.reads, 1)
+
+
 class CollectionMetaOptionsTests(unittest.TestCase):
 
     def check_hasattr(self, meta):
@@ -217,6 +474,7 @@ class CollectionMetaOptionsTests(unittest.TestCase):
         self.assertTrue(hasattr(meta,'exclude'))
         self.assertTrue(hasattr(meta,'sort'))
         self.assertTrue(hasattr(meta,'validation'))
+        self.assertTrue(hasattr(meta, 'identity_map'))
 
     def check_defaults(self, meta):
         self.assertIsNone(meta.serializer)
@@ -230,6 +488,7 @@ class CollectionMetaOptionsTests(unittest.TestCase):
         self.assertEqual(meta.exclude, [])
         self.assertEqual(meta.sort, [])
         self.assertFalse(meta.validation)
+        self.assertFalse(meta.identity_map)
 
     def test_meta_options_class_defaults(self):
         meta = CollectionMetaOptions(None)
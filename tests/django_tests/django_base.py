@@ -104,17 +104,46 @@ class TheDjangoModelSerializer(DjangoModelSerializer):
         model = SimpleModelForSerializer if django else None
 
 
+class CursorTheDjangoModelCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = TheDjangoModelSerializer
+        cursor_pagination = True
+
+
 class SimpleDjangoModelCollectionSerializer(DjangoCollectionSerializer):
     class Meta:
         serializer = SimpleDjangoSerializer
 
 
+class CursorDjangoModelCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = SimpleDjangoSerializer
+        cursor_pagination = True
+
+
+class ProjectedSimpleDjangoModelCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = SimpleDjangoSerializer
+        project_columns = True
+
+
+class PkSimpleDjangoSerializer(SimpleDjangoSerializer):
+    pk = fields.IntegerField()
+
+
 class RelDjangoModelSerializer(DjangoModelSerializer):
 
     class Meta:
         model = RelThreeDjangoModel if django else None
 
 
+class LazyRelDjangoModelSerializer(DjangoModelSerializer):
+
+    class Meta:
+        model = RelThreeDjangoModel if django else None
+        lazy_nested = True
+
+
 class RelReverseDjangoModelSerializer(DjangoModelSerializer):
 
     class Meta:
@@ -135,6 +164,41 @@ class M2MTwoDjangoModelSerializer(DjangoModelSerializer):
         exclude = ['ones.simple_model']
 
 
+class RelThreeCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = RelDjangoModelSerializer
+
+
+class PlannedRelThreeCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = RelDjangoModelSerializer
+        plan_relations = True
+
+
+class ProjectedRelThreeCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = RelDjangoModelSerializer
+        plan_relations = True
+        project_columns = True
+
+
+class RelOneCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = RelReverseDjangoModelSerializer
+
+
+class PlannedRelOneCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = RelReverseDjangoModelSerializer
+        plan_relations = True
+
+
+class PlannedM2MTwoCollectionSerializer(DjangoCollectionSerializer):
+    class Meta:
+        serializer = M2MTwoDjangoModelSerializer
+        plan_relations = True
+
+
 class One2One1DjangoModelSerializer(DjangoModelSerializer):
 
     class Meta:
@@ -1,9 +1,26 @@
 # -*- coding: utf-8 -*-
 import unittest
+from datetime import date, datetime, time
+from decimal import Decimal
 
 from tests.django_tests import django, SKIPTEST_TEXT, TestCase
-from tests.django_tests.django_base import (SimpleDjangoModel, RelatedDjangoModel,
-                                            SimpleDjangoModelCollectionSerializer, )
+
+if django is not None:
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+from tests.django_tests.django_base import (SimpleDjangoModel, RelatedDjangoModel, SimpleModelForSerializer,
+                                            SimpleDjangoModelCollectionSerializer,
+                                            CursorTheDjangoModelCollectionSerializer,
+                                            CursorDjangoModelCollectionSerializer, RelOneDjangoModel,
+                                            RelTwoDjangoModel, RelThreeDjangoModel, M2MOneDjangoModel,
+                                            M2MTwoDjangoModel, RelDjangoModelSerializer,
+                                            RelThreeCollectionSerializer, PlannedRelThreeCollectionSerializer,
+                                            RelOneCollectionSerializer, PlannedRelOneCollectionSerializer,
+                                            PlannedM2MTwoCollectionSerializer, SimpleDjangoSerializer,
+                                            PkSimpleDjangoSerializer, ProjectedSimpleDjangoModelCollectionSerializer,
+                                            ProjectedRelThreeCollectionSerializer, )
+from aserializer.django.collection import count_cache
+from aserializer.django.related import get_related_lookups, get_only_fields
 
 
 @unittest.skipIf(django is None, SKIPTEST_TEXT)
@@ -187,4 +204,282 @@ class DjangoCollectionSerializerTests(TestCase):
             },
             "items": []
         }
-        self.assertDictEqual(collection.dump(), test_value)
\ No newline at end of file
+        self.assertDictEqual(collection.dump(), test_value)
+
+
+@unittest.skipIf(django is None, SKIPTEST_TEXT)
+class DjangoCursorCollectionSerializerTests(TestCase):
+
+    def setUp(self):
+        for number, code in ((1, 'DDDD'), (1, 'FFFF'), (2, 'CCCC'), (3, 'BBBB'), (3, 'EEEE'), (4, 'AAAA'),
+                             (1, 'FFFF')):
+            SimpleDjangoModel.objects.create(name='Name {}'.format(number), code=code, number=number)
+
+    def tearDown(self):
+        SimpleDjangoModel.objects.all().delete()
+        SimpleModelForSerializer.objects.all().delete()
+
+    def get_pages(self, sort, cursor_key='next', cursor=None):
+        pages = []
+        while True:
+            collection = CursorDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), limit=2, sort=sort,
+                                                               cursor=cursor)
+            with self.assertNumQueries(2):
+                dump = collection.dump()
+            pages.append(dump)
+            cursor = dump['_metadata'][cursor_key]
+            if cursor is None:
+                return pages
+
+    def test_pages(self):
+        for sort in (['number', '-code'], ['-number'], ['code'], None):
+            expected = SimpleDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), limit=10,
+                                                             sort=sort).dump()['items']
+            pages = self.get_pages(sort)
+            self.assertEqual([len(page['items']) for page in pages], [2, 2, 2, 1])
+            self.assertEqual([item for page in pages for item in page['items']], expected)
+            self.assertIsNone(pages[0]['_metadata']['previous'])
+            self.assertEqual(pages[0]['_metadata']['totalCount'], 7)
+            self.assertEqual(pages[0]['_metadata']['limit'], 2)
+            self.assertNotIn('offset', pages[0]['_metadata'])
+            previous_pages = self.get_pages(sort, cursor_key='previous', cursor=pages[-1]['_metadata']['previous'])
+            self.assertEqual([page['items'] for page in reversed(previous_pages)],
+                             [page['items'] for page in pages[:-1]])
+            self.assertIsNotNone(previous_pages[-1]['_metadata']['next'])
+
+    def test_seek_filter(self):
+        first = CursorDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), limit=2).dump()
+        queryset = SimpleDjangoModel.objects.all()
+        collection = CursorDjangoModelCollectionSerializer(queryset, limit=2, cursor=first['_metadata']['next'])
+        with CaptureQueriesContext(connection) as context:
+            rows, _, _ = collection.get_cursor_page(queryset, limit=2)
+        self.assertEqual([row.code for row in rows], ['CCCC', 'BBBB'])
+        self.assertEqual(len(context.captured_queries), 1)
+        sql = context.captured_queries[0]['sql'].upper()
+        self.assertNotIn('OFFSET', sql)
+        self.assertIn('LIMIT 3', sql)
+
+    def test_invalid_cursor(self):
+        for cursor in ('foo', 'eyJmb28iOjF9', CursorDjangoModelCollectionSerializer(
+                SimpleDjangoModel.objects.all(), limit=2, sort=['number']).dump()['_metadata']['next']):
+            collection = CursorDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), limit=2, cursor=cursor)
+            self.assertRaises(ValueError, collection.dump)
+
+    def test_nullable_sort_field(self):
+        for number, integer in enumerate((3, None, 1, None, 3, 2, None)):
+            SimpleModelForSerializer.objects.create(
+                char_field='Char {}'.format(number), integer_field=integer, integer_field2=number,
+                positiveinteger_field=number, float_field=1.0, date_field=date(2016, 1, 1),
+                datetime_field=datetime(2016, 1, 1, 12, 0, 0), time_field=time(12, 0, 0),
+                decimal_field=Decimal('1.5'), text_field='Text', commaseparatedinteger_field='1,2',
+                choice_field='Zero', url_field='http://example.com')
+        for sort in (['integer_field'], ['-integer_field']):
+            expected = [item.pk for item in SimpleModelForSerializer.objects.order_by(*(sort + ['pk']))]
+            pages = []
+            cursor = None
+            while True:
+                dump = CursorTheDjangoModelCollectionSerializer(SimpleModelForSerializer.objects.all(), limit=2,
+                                                                sort=sort, cursor=cursor).dump()
+                pages.append([item['id'] for item in dump['items']])
+                cursor = dump['_metadata']['next']
+                if cursor is None:
+                    break
+            self.assertEqual([pk for page in pages for pk in page], expected)
+            previous_pages = []
+            cursor = dump['_metadata']['previous']
+            while cursor is not None:
+                dump = CursorTheDjangoModelCollectionSerializer(SimpleModelForSerializer.objects.all(), limit=2,
+                                                                sort=sort, cursor=cursor).dump()
+                previous_pages.insert(0, [item['id'] for item in dump['items']])
+                cursor = dump['_metadata']['previous']
+            self.assertEqual(previous_pages, pages[:-1])
+
+    def test_cursor_from_request(self):
+        first = CursorDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), limit=2).dump()
+
+        class Request(object):
+            GET = dict(cursor=first['_metadata']['next'], limit='2')
+
+        dump = CursorDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), request=Request()).dump()
+        self.assertEqual([item['code'] for item in dump['items']], ['CCCC', 'BBBB'])
+
+
+@unittest.skipIf(django is None, SKIPTEST_TEXT)
+class DjangoCountModeTests(TestCase):
+
+    def setUp(self):
+        for number in range(5):
+            SimpleDjangoModel.objects.create(name='Name {}'.format(number), code='CODE', number=number)
+        count_cache.clear()
+
+    def tearDown(self):
+        SimpleDjangoModel.objects.all().delete()
+        count_cache.clear()
+
+    def dump(self, queries, **kwargs):
+        collection = SimpleDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), **kwargs)
+        with self.assertNumQueries(queries):
+            return collection.dump()
+
+    def test_none(self):
+        dump = self.dump(1, limit=2, offset=1, sort=['-number'], count_mode='none')
+        self.assertEqual(dump['_metadata'], dict(offset=1, limit=2, totalCount=None))
+        self.assertEqual([item['number'] for item in dump['items']], [3, 2])
+
+    def test_has_more(self):
+        dump = self.dump(1, limit=2, offset=2, count_mode='has_more')
+        self.assertEqual(dump['_metadata'], dict(offset=2, limit=2, totalCount=None, hasMore=True))
+        self.assertEqual([item['number'] for item in dump['items']], [2, 3])
+        dump = self.dump(1, limit=2, offset=3, count_mode='has_more')
+        self.assertFalse(dump['_metadata']['hasMore'])
+        self.assertEqual([item['number'] for item in dump['items']], [3, 4])
+
+    def test_cached(self):
+        dump = self.dump(2, limit=2, count_mode='cached')
+        self.assertEqual(dump['_metadata'], dict(offset=0, limit=2, totalCount=5))
+        SimpleDjangoModel.objects.create(name='Name 5', code='CODE', number=5)
+        self.assertEqual(self.dump(1, limit=2, count_mode='cached')['_metadata']['totalCount'], 5)
+        self.assertEqual(self.dump(1, limit=2, count_mode='exact')['_metadata']['totalCount'], 6)
+        collection = SimpleDjangoModelCollectionSerializer(SimpleDjangoModel.objects.filter(number__gt=2), limit=2,
+                                                           count_mode='cached')
+        self.assertEqual(collection.dump()['_metadata']['totalCount'], 3)
+        self.assertEqual(len(count_cache), 2)
+
+    def test_cached_ttl(self):
+        class ShortCacheCollectionSerializer(SimpleDjangoModelCollectionSerializer):
+            class Meta:
+                serializer = SimpleDjangoModelCollectionSerializer._meta.serializer
+                count_mode = 'cached'
+                count_cache_ttl = 0
+
+        for _ in range(2):
+            with self.assertNumQueries(2):
+                ShortCacheCollectionSerializer(SimpleDjangoModel.objects.all(), limit=2).dump()
+
+    def test_cursor_has_more(self):
+        collection = CursorDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), limit=3,
+                                                           count_mode='has_more')
+        with self.assertNumQueries(1):
+            metadata = collection.dump()['_metadata']
+        self.assertTrue(metadata['hasMore'])
+        self.assertIsNone(metadata['totalCount'])
+        dump = CursorDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), limit=3,
+                                                     count_mode='has_more', cursor=metadata['next']).dump()
+        self.assertFalse(dump['_metadata']['hasMore'])
+
+    def test_count_mode_argument(self):
+        self.assertRaises(ValueError, SimpleDjangoModelCollectionSerializer, SimpleDjangoModel,
+                          count_mode='foo')
+
+        class Request(object):
+            GET = dict(count_mode='none', limit='2')
+
+        self.assertIsNone(self.dump(1, request=Request())['_metadata']['totalCount'])
+        Request.GET['count_mode'] = 'foo'
+        self.assertEqual(self.dump(1, request=Request())['_metadata']['totalCount'], 5)
+
+
+@unittest.skipIf(django is None, SKIPTEST_TEXT)
+class DjangoRelationPlanningTests(TestCase):
+
+    def setUp(self):
+        for i in range(6):
+            one = RelOneDjangoModel.objects.create(name='One {}'.format(i))
+            two = RelTwoDjangoModel.objects.create(name='Two {}'.format(i), rel_one=one)
+            RelThreeDjangoModel.objects.create(name='Three {}'.format(i), rel_two=two, rel_one=one if i % 2 else None)
+            m2m_two = M2MTwoDjangoModel.objects.create(name='M2M {}'.format(i))
+            for j in range(i % 3):
+                m2m_two.ones.add(M2MOneDjangoModel.objects.create(name='M2M {} {}'.format(i, j)))
+
+    def tearDown(self):
+        for model in (RelThreeDjangoModel, RelTwoDjangoModel, RelOneDjangoModel, M2MTwoDjangoModel,
+                      M2MOneDjangoModel):
+            model.objects.all().delete()
+
+    def assert_constant_queries(self, collection_cls, model, plain_collection_cls=None, **kwargs):
+        counts = []
+        for limit in (2, 4):
+            collection = collection_cls(model.objects.all(), limit=limit, **kwargs)
+            with CaptureQueriesContext(connection) as context:
+                dump = collection.dump()
+            counts.append(len(context.captured_queries))
+            if plain_collection_cls is not None:
+                self.assertEqual(dump, plain_collection_cls(model.objects.all(), limit=limit, **kwargs).dump())
+        self.assertEqual(counts[0], counts[1])
+        return counts[0]
+
+    def test_lookups(self):
+        self.assertEqual(get_related_lookups(RelDjangoModelSerializer, RelThreeDjangoModel),
+                         (['rel_two', 'rel_two__rel_one', 'rel_one'], ['rel_one__rel_twos']))
+        self.assertEqual(get_related_lookups(RelDjangoModelSerializer, RelThreeDjangoModel,
+                                             fields=['name', 'rel_two.name']), (['rel_two'], []))
+        self.assertEqual(get_related_lookups(RelDjangoModelSerializer, RelThreeDjangoModel,
+                                             exclude=['rel_two.rel_one', 'rel_one']), (['rel_two'], []))
+
+    def test_forward_relations(self):
+        queries = self.assert_constant_queries(PlannedRelThreeCollectionSerializer, RelThreeDjangoModel,
+                                               RelThreeCollectionSerializer)
+        # The exact count mode evaluates the queryset, the relations of the page are prefetched then.
+        self.assertEqual(queries, 5)
+        queries = self.assert_constant_queries(PlannedRelThreeCollectionSerializer, RelThreeDjangoModel,
+                                               RelThreeCollectionSerializer, count_mode='none')
+        self.assertEqual(queries, 2)
+
+    def test_reverse_relations(self):
+        self.assert_constant_queries(PlannedRelOneCollectionSerializer, RelOneDjangoModel,
+                                     RelOneCollectionSerializer)
+        self.assert_constant_queries(PlannedRelOneCollectionSerializer, RelOneDjangoModel,
+                                     RelOneCollectionSerializer, fields=['name', 'rel_twos.name'])
+
+    def test_many_to_many(self):
+        queries = self.assert_constant_queries(PlannedM2MTwoCollectionSerializer, M2MTwoDjangoModel,
+                                               count_mode='has_more')
+        self.assertEqual(queries, 2)
+
+
+@unittest.skipIf(django is None, SKIPTEST_TEXT)
+class DjangoColumnProjectionTests(TestCase):
+
+    def setUp(self):
+        for i in range(4):
+            SimpleDjangoModel.objects.create(name='Name {}'.format(i), code='C{}'.format(i), number=i)
+            one = RelOneDjangoModel.objects.create(name='One {}'.format(i))
+            two = RelTwoDjangoModel.objects.create(name='Two {}'.format(i), rel_one=one)
+            RelThreeDjangoModel.objects.create(name='Three {}'.format(i), rel_two=two, rel_one=one)
+
+    def tearDown(self):
+        for model in (SimpleDjangoModel, RelThreeDjangoModel, RelTwoDjangoModel, RelOneDjangoModel):
+            model.objects.all().delete()
+
+    def test_only_fields(self):
+        self.assertEqual(get_only_fields(SimpleDjangoSerializer, SimpleDjangoModel, fields=['name']), ['id', 'name'])
+        self.assertEqual(get_only_fields(SimpleDjangoSerializer, SimpleDjangoModel, exclude=['code'],
+                                         order_by=['-code']), ['id', 'name', 'number', 'code'])
+        self.assertEqual(get_only_fields(RelDjangoModelSerializer, RelThreeDjangoModel, fields=['rel_two.name'],
+                                         select_related=['rel_two']),
+                         ['id', 'rel_two', 'rel_one', 'rel_two__id', 'rel_two__rel_one', 'rel_two__name'])
+        self.assertIsNone(get_only_fields(PkSimpleDjangoSerializer, SimpleDjangoModel))
+
+    def test_projection(self):
+        collection = ProjectedSimpleDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), fields=['name'],
+                                                                    sort=['-number'], limit=2)
+        with CaptureQueriesContext(connection) as context:
+            dump = collection.dump()
+        sql = context.captured_queries[0]['sql']
+        self.assertIn('"name"', sql)
+        self.assertIn('"number"', sql)
+        self.assertNotIn('"code"', sql)
+        self.assertEqual(dump, SimpleDjangoModelCollectionSerializer(SimpleDjangoModel.objects.all(), fields=['name'],
+                                                                     sort=['-number'], limit=2).dump())
+
+    def test_joined_relations(self):
+        for count_mode in ('exact', 'none'):
+            collection = ProjectedRelThreeCollectionSerializer(RelThreeDjangoModel.objects.all(),
+                                                               fields=['name', 'rel_two.name'], limit=2,
+                                                               count_mode=count_mode)
+            with CaptureQueriesContext(connection) as context:
+                dump = collection.dump()
+            self.assertNotIn('"django_app_relonedjangomodel"."name"', context.captured_queries[0]['sql'])
+            self.assertEqual(dump, RelThreeCollectionSerializer(RelThreeDjangoModel.objects.all(),
+                                                                fields=['name', 'rel_two.name'], limit=2,
+                                                                count_mode=count_mode).dump())
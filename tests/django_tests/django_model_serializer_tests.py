@@ -5,6 +5,8 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 
+from aserializer.base import SerializerBase
+from aserializer.django.serializers import DjangoModelSerializer, DjangoModelSerializerBase
 from tests.django_tests import django, SKIPTEST_TEXT, TestCase, SKIPTEST_TEXT_VERSION_18
 from tests.django_tests.django_app.models import (One2One1DjangoModel,
                                                   One2One2DjangoModel,
@@ -17,6 +19,7 @@ from tests.django_tests.django_base import (TheDjangoModelSerializer,
                                             RelTwoDjangoModel,
                                             RelThreeDjangoModel,
                                             RelDjangoModelSerializer,
+                                            LazyRelDjangoModelSerializer,
                                             RelReverseDjangoModelSerializer,
                                             M2MOneDjangoModel,
                                             M2MOneDjangoModelSerializer,
@@ -103,6 +106,19 @@ class RelDjangoSerializerTests(TestCase):
         self.assertDictEqual(obj_dump, test_value)
         self.assertDictEqual(qs_obj_dump, test_value)
 
+    def test_three_level_relations_lazy(self):
+        one = RelOneDjangoModel.objects.create(name='Level1')
+        two = RelTwoDjangoModel.objects.create(name='Level2', rel_one=one)
+        RelThreeDjangoModel.objects.create(name='Level3', rel_two=two)
+        with self.assertNumQueries(1):
+            serializer = LazyRelDjangoModelSerializer(RelThreeDjangoModel.objects.first())
+        with self.assertNumQueries(0):
+            self.assertEqual(serializer.name, 'Level3')
+        with self.assertNumQueries(2):
+            model_dump = serializer.dump()
+        self.assertDictEqual(model_dump, RelDjangoModelSerializer(RelThreeDjangoModel.objects.first()).dump())
+        self.assertEqual(model_dump['rel_two']['rel_one']['name'], 'Level1')
+
     def test_three_level_relations_with_exclude(self):
         one = RelOneDjangoModel.objects.create(name='Level1')
         two = RelTwoDjangoModel.objects.create(name='Level2', rel_one=one)
@@ -130,6 +146,24 @@ class FlatSerializerTests(TestCase):
     def tearDown(self):
         SimpleModelForSerializer.objects.all().delete()
 
+    def test_plan_compiled_once(self):
+        compiled = []
+        compile_plan = SerializerBase.__dict__['compile_plan']
+
+        def counting_compile_plan(cls, new_class):
+            compiled.append(new_class.__name__)
+            compile_plan.__func__(cls, new_class)
+
+        DjangoModelSerializerBase.compile_plan = classmethod(counting_compile_plan)
+        try:
+            class WideDjangoModelSerializer(DjangoModelSerializer):
+                class Meta:
+                    model = SimpleModelForSerializer
+        finally:
+            del DjangoModelSerializerBase.compile_plan
+        self.assertEqual(compiled.count('WideDjangoModelSerializer'), 1)
+        self.assertIn('url_field', WideDjangoModelSerializer._plan.fields)
+
     def test_serialize(self):
         values = dict(
             char_field='test',
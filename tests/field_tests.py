@@ -4,7 +4,7 @@ import unittest
 import uuid
 import decimal
 from datetime import datetime, date, time
-from aserializer.utils import py2to3
+from aserializer.utils import py2to3, dateparse
 from aserializer.fields import (IntegerField,
                                 PositiveIntegerField,
                                 FloatField,
@@ -284,6 +284,38 @@ class DecimalFieldTests(unittest.TestCase):
         self.assertRaises(IgnoreField, field.to_native)
         self.assertIsNone(field.to_python())
 
+    def test_quantizer_and_context_shared_by_clones(self):
+        field = DecimalField(decimal_places=2, precision=4)
+        clone = field.clone()
+        self.assertIs(clone._quantizer, field._quantizer)
+        self.assertIs(clone._context, field._context)
+        self.assertEqual(field._quantizer, decimal.Decimal('0.01'))
+        self.assertEqual(field._context.prec, 4)
+        clone.set_value('12.345')
+        self.assertEqual(clone.to_python(), decimal.Decimal('12.34'))
+        self.assertRaises(decimal.InvalidOperation, clone.set_value, decimal.Decimal('123.45'))
+
+    def test_native_output(self):
+        field = DecimalField(decimal_places=2)
+        for value in ('0.1', '23.225', '-1e3', 7, 0.3):
+            field.output = DecimalField.OUTPUT_AS_FLOAT
+            field.set_value(value)
+            self.assertEqual(field.to_native(), float(u'{}'.format(field.value)))
+            field.output = DecimalField.OUTPUT_AS_STRING
+            self.assertEqual(field.to_native(), u'{}'.format(field.value))
+
+    def test_quantize_many(self):
+        field = DecimalField(decimal_places=2)
+        values = [decimal.Decimal('1.005'), 2, 2.5, '3.456', 'abc', None, [1]]
+        expected = []
+        for value in values:
+            field.set_value(value)
+            expected.append(field.value)
+        self.assertEqual(field.quantize_many(values), expected)
+        self.assertEqual(field.quantize_many(values)[:4], [decimal.Decimal('1.00'), decimal.Decimal('2.00'),
+                                                           decimal.Decimal('2.50'), decimal.Decimal('3.46')])
+        self.assertEqual(field.quantize_many([]), [])
+
 
 class StringFieldTests(unittest.TestCase):
 
@@ -436,6 +468,111 @@ class DatetimeFieldTests(unittest.TestCase):
         self.assertIsNone(field.to_python())
 
 
+def strptime_formats(value, formats):
+    for f in formats:
+        try:
+            return datetime.strptime(value, f), f
+        except (ValueError, TypeError):
+            continue
+    return None, None
+
+
+class DatetimeParsingTests(unittest.TestCase):
+    values = [
+        '2013-10-07T22:58:40', '2013-10-07t22:58:40', '2013-10-07T22:58:40.123', '2013-10-07T22:58:40.123456',
+        '2013-10-07T22:58:40.1234567', '2013-10-07T22:58:40.123+0200', '2013-10-07T22:58:40.5-0130',
+        '2013-10-07T22:58:40.5+2500', '2013-10-07T22:58:40.5+01:30', '2013-10-07T22:58:40.5Z',
+        '2013-10-07T22:58:40+0200', '2013-1-7T2:58:40', '2013-13-07T22:58:40', '2013-02-30T22:58:40',
+        '2013-10-07T22:58:60', '2013-10-07T24:00:00', '0000-10-07T22:58:40', ' 2013-10-07T22:58:40',
+        '2013-10-07T22:58:40 ', '2013-10-07', '2013-1-7', '2013-10-32', '22:58:40', '2:5:4', '25:58:40',
+        'datetime', '',
+    ]
+
+    def test_same_result_as_strptime(self):
+        for field_cls in (DatetimeField, DateField, TimeField):
+            formats = field_cls.date_formats
+            for value in self.values:
+                expected, expected_format = strptime_formats(value, formats)
+                for _ in range(2):
+                    field = field_cls()
+                    self.assertEqual(field.strptime(value, field._date_formats), expected)
+                    if expected is not None:
+                        self.assertEqual(field._current_format, expected_format)
+                        self.assertEqual(getattr(field.strptime(value, field._date_formats), 'tzinfo', None),
+                                         expected.tzinfo)
+
+    def test_mixed_iso_formats(self):
+        formats = ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%H:%M:%S']
+        field = DatetimeField(formats=formats)
+        for value in self.values:
+            self.assertEqual(field.strptime(value, field._date_formats), strptime_formats(value, formats)[0])
+
+    def test_adaptive_formats(self):
+        dateparse.clear_caches()
+        field = DatetimeField()
+        self.assertTrue(field._adaptive)
+        field.strptime('2013-1-7T2:58:40', field._date_formats)
+        self.assertEqual(field._format_hint[0], '%Y-%m-%dT%H:%M:%S')
+        self.assertIs(field.clone()._format_hint, field._format_hint)
+        self.assertFalse(DatetimeField(formats=['%d.%m.%Y %H:%M:%S'])._adaptive)
+        field = DatetimeField(formats=['%d.%m.%Y', '%Y/%m/%d'], adaptive=True)
+        field.set_value('2013/10/07')
+        field.set_value('2013/10/08')
+        self.assertEqual(field._format_hint[0], '%Y/%m/%d')
+        self.assertEqual(field.to_python(), datetime(2013, 10, 8))
+        self.assertEqual(field.to_native(), '2013/10/08')
+
+
+class DatetimeCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        dateparse.clear_caches()
+
+    def test_parse_cache(self):
+        field = DatetimeField(formats=['%d.%m.%Y %H:%M:%S'])
+        field.set_value('07.10.2013 20:15:23')
+        self.assertEqual(dateparse.cache_info()['parse']['misses'], 1)
+        other = DatetimeField(formats=['%d.%m.%Y %H:%M:%S'])
+        other.set_value('07.10.2013 20:15:23')
+        self.assertEqual(other.to_python(), datetime(2013, 10, 7, 20, 15, 23))
+        self.assertEqual(other.to_native(), '07.10.2013 20:15:23')
+        info = dateparse.cache_info()['parse']
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['hit_rate'], 0.5)
+        field = DatetimeField(formats=['%d.%m.%Y %H:%M:%S', '%Y-%m-%d'])
+        field.set_value('07.10.2013 20:15:23')
+        self.assertEqual(dateparse.cache_info()['parse']['misses'], 2)
+        field.set_value('invalid')
+        field.set_value('invalid')
+        self.assertTrue(field.invalid)
+        self.assertEqual(dateparse.cache_info()['parse']['hits'], 2)
+
+    def test_format_cache(self):
+        field = DateField(serialize_to='%d.%m.%Y')
+        field.set_value(date(2013, 10, 7))
+        self.assertEqual(field.to_native(), '07.10.2013')
+        field = DateField(serialize_to='%d.%m.%Y')
+        field.set_value(date(2013, 10, 7))
+        self.assertEqual(field.to_native(), '07.10.2013')
+        self.assertEqual(dateparse.cache_info()['format']['hits'], 1)
+        field = DatetimeField(serialize_to='%d.%m.%Y')
+        field.set_value(datetime(2013, 10, 7))
+        self.assertEqual(field.to_native(), '07.10.2013')
+        self.assertEqual(dateparse.cache_info()['format']['hits'], 1)
+
+    @unittest.skipIf(py2to3.PYTHON2, 'datetime.timezone is not available.')
+    def test_format_cache_timezones(self):
+        from datetime import timezone, timedelta
+        utc_value = datetime(2013, 10, 7, 20, 0, tzinfo=timezone.utc)
+        local_value = datetime(2013, 10, 7, 22, 0, tzinfo=timezone(timedelta(hours=2), 'CEST'))
+        self.assertEqual(utc_value, local_value)
+        field = DatetimeField(serialize_to='%H:%M %Z')
+        field.set_value(utc_value)
+        self.assertEqual(field.to_native(), '20:00 UTC')
+        field.set_value(local_value)
+        self.assertEqual(field.to_native(), '22:00 CEST')
+
+
 class DateFieldTests(unittest.TestCase):
 
     def test_set_value(self):
@@ -641,6 +778,52 @@ class ChoiceFieldTests(unittest.TestCase):
         self.assertEqual(field.to_python(), 2)
         self.assertEqual(field.to_native(), 'TWO')
 
+    def test_first_choice_wins(self):
+        field = ChoiceField(choices=((1, 'two'), (2, 'one'), (True, 'yes')))
+        field.set_value('one')
+        self.assertEqual(field.to_python(), 2)
+        field.set_value(2)
+        self.assertEqual(field.to_python(), 2)
+        self.assertEqual(field.to_native(), 'one')
+        field.set_value(True)
+        self.assertEqual(field.to_native(), 'two')
+        field.set_value(2.0)
+        self.assertEqual(field.to_native(), 'one')
+
+    def test_unhashable_choices(self):
+        field = ChoiceField(choices=(([1, 2], 'list'), (3, 'three')))
+        self.assertIsNone(field._choice_index)
+        field.set_value([1, 2])
+        field.validate()
+        self.assertEqual(field.to_python(), [1, 2])
+        self.assertEqual(field.to_native(), 'list')
+        field.set_value('three')
+        self.assertEqual(field.to_python(), 3)
+
+        field = ChoiceField(choices=self.TUPLE_CHOICES)
+        self.assertIsNotNone(field._choice_index)
+        field.set_value(['one'])
+        self.assertRaises(SerializerFieldValueError, field.validate)
+
+    def test_set_choices(self):
+        field = ChoiceField(choices=self.TUPLE_CHOICES)
+        field.choices = ((4, 'four'),)
+        field.set_value('four')
+        field.validate()
+        self.assertEqual(field.to_python(), 4)
+        field.set_value('one')
+        self.assertRaises(SerializerFieldValueError, field.validate)
+        self.assertIs(field.clone()._choice_index, field._choice_index)
+
+    def test_many_choices(self):
+        choices = [(i, 'choice {}'.format(i)) for i in range(1000)]
+        field = ChoiceField(choices=choices)
+        field.set_value('choice 999')
+        field.validate()
+        self.assertEqual(field.to_python(), 999)
+        field.set_value(500)
+        self.assertEqual(field.to_native(), 'choice 500')
+
 
 class BooleanFieldTests(unittest.TestCase):
 
@@ -765,6 +948,104 @@ class ListFieldEmailFieldTests(unittest.TestCase):
         self.assertRaises(SerializerFieldValueError, field.validate)
 
 
+class ItemIntegerField(IntegerField):
+    pass
+
+
+class ItemFloatField(FloatField):
+    pass
+
+
+class ItemBooleanField(BooleanField):
+    pass
+
+
+class ItemStringField(StringField):
+    pass
+
+
+class ListFieldPrimitiveTests(unittest.TestCase):
+    """
+    The lists of the primitive item field classes convert the values without item fields, the subclasses of the item
+    field classes use the item fields.
+    """
+    CASES = (
+        (IntegerField, ItemIntegerField, [1, 2, '3', 4.5, None, True, 10 ** 20]),
+        (FloatField, ItemFloatField, [1.5, 2, '3.5', None, float('inf')]),
+        (BooleanField, ItemBooleanField, [True, False, 'false', '0', 1, None, '']),
+        (StringField, ItemStringField, [u'one', 'two', u'', 'null', None, 3]),
+    )
+
+    def assert_same_results(self, field, item_field):
+        for method_name in ('validate', 'to_native', 'to_python'):
+            try:
+                expected = getattr(item_field, method_name)()
+            except SerializerFieldValueError as e:
+                with self.assertRaises(SerializerFieldValueError) as context:
+                    getattr(field, method_name)()
+                self.assertEqual(context.exception.errors, e.errors)
+            else:
+                result = getattr(field, method_name)()
+                self.assertEqual(result, expected)
+                if result is not None:
+                    self.assertEqual([type(value) for value in result], [type(value) for value in expected])
+
+    def test_same_results_as_item_fields(self):
+        for field_cls, item_field_cls, values in self.CASES:
+            field = ListField(field_cls, required=True)
+            item_field = ListField(item_field_cls, required=True)
+            field.set_value(values)
+            item_field.set_value(values)
+            self.assertIsNone(field._items)
+            self.assertEqual(len(field), len(values))
+            self.assert_same_results(field, item_field)
+
+    def test_validate_raises(self):
+        values = [1, 'a', 2, 'b', {}]
+        field = ListField(IntegerField, required=True)
+        item_field = ListField(ItemIntegerField, required=True)
+        field.set_value(values)
+        item_field.set_value(values)
+        self.assertEqual(sorted(field._item_fields), [1, 3, 4])
+        self.assertRaises(SerializerFieldValueError, field.validate)
+        self.assert_same_results(field, item_field)
+
+        field.set_value([])
+        self.assertRaises(SerializerFieldValueError, field.validate)
+
+    def test_items(self):
+        field = ListField(FloatField)
+        field.set_value([1, 'x', 2.5])
+        invalid_field = field._item_fields[1]
+        items = field.items
+        self.assertEqual([type(item) for item in items], [FloatField] * 3)
+        self.assertIs(items[1], invalid_field)
+        self.assertEqual(items[0].value, 1)
+        self.assertIsNone(field._values)
+        field.set_value([1.0])
+        self.assertIsNone(field._items)
+        self.assertEqual(field.to_python(), [1.0])
+
+    def test_append_and_set_item(self):
+        field = ListField(IntegerField)
+        field.set_value([1, 2])
+        field.append(3)
+        self.assertEqual(len(field), 3)
+        self.assertIsNone(field._items)
+        self.assertRaises(SerializerFieldValueError, field.append, 'x')
+        field[3] = 4
+        self.assertEqual(len(field), 4)
+        self.assertEqual(field.to_python(), [1, 2, 3, 4])
+
+    def test_clone(self):
+        field = ListField(StringField)
+        field.set_value([u'a', 1])
+        field_clone = field.clone()
+        field_clone.set_value([u'b'])
+        self.assertEqual(field.to_python(), [u'a', u'1'])
+        self.assertEqual(field_clone.to_python(), [u'b'])
+
+
 class ListSerializerFieldTests(unittest.TestCase):
 
     class TestSerializer(Serializer):
@@ -816,6 +1097,27 @@ class ListSerializerFieldTests(unittest.TestCase):
         self.assertRaises(SerializerFieldValueError, field.validate)
 
 
+class FieldCloneTests(unittest.TestCase):
+
+    def test_clone_shares_definition(self):
+        field = IntegerField(required=True, max_value=10, default=5)
+        field_clone = field.clone()
+        self.assertIsNot(field, field_clone)
+        self.assertIs(field._validators, field_clone._validators)
+        self.assertIs(field._error_messages, field_clone._error_messages)
+        self.assertEqual(field_clone.to_python(), 5)
+        field_clone.set_value(7)
+        self.assertEqual(field_clone.to_python(), 7)
+        self.assertEqual(field.to_python(), 5)
+
+    def test_clone_list_field(self):
+        field = ListField(EmailField, required=True)
+        field_clone = field.clone()
+        field_clone.set_value(['foobar@test.de'])
+        self.assertEqual(len(field_clone), 1)
+        self.assertEqual(len(field), 0)
+
+
 class SerializerFieldValueErrorTests(unittest.TestCase):
 
     def test_required(self):
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from aserializer import Serializer, IntegerField, StringField, BooleanField
+from aserializer.fields import HIDE_FIELD
+from aserializer.utils import codegen
+from tests import serializer_tests
+
+
+def with_compiled_mode(test_case_cls):
+    """
+    Returns a subclass of a serializer test case which runs the tests with the compiled mode enabled.
+    """
+    def setUp(self):
+        codegen.set_compiled_default(True)
+        self.addCleanup(codegen.set_compiled_default, False)
+        test_case_cls.setUp(self)
+
+    return type('Compiled{}'.format(test_case_cls.__name__), (test_case_cls,), {'setUp': setUp})
+
+
+for _name, _obj in list(vars(serializer_tests).items()):
+    if isinstance(_obj, type) and issubclass(_obj, unittest.TestCase) and _obj.__module__ == serializer_tests.__name__:
+        globals()['Compiled{}'.format(_name)] = with_compiled_mode(_obj)
+del _name, _obj
+
+
+class CompiledSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True, map_field='full_name')
+    hidden = StringField(required=False, on_null=HIDE_FIELD)
+    active = BooleanField()
+    street = StringField(required=False)
+
+    def street_to_native(self, field):
+        return 'custom'
+
+    class Meta:
+        compiled = True
+
+
+class CompiledModeTests(unittest.TestCase):
+
+    def test_meta_option(self):
+        serializer = CompiledSerializer(dict(id='1', full_name='John', active='false'))
+        self.assertIsNotNone(serializer._compiled)
+        self.assertDictEqual(serializer.dump(), dict(id=1, name=u'John', active=False, street='custom'))
+        self.assertDictEqual(serializer.to_dict(), dict(id=1, full_name=u'John', active=False, hidden=None,
+                                                        street=u''))
+        self.assertIsNone(serializer_tests.MetaTestSerializer()._compiled)
+
+    def test_compiled_once_per_field_filter(self):
+        compiled = CompiledSerializer(dict(id=1))._compiled
+        self.assertIs(CompiledSerializer(dict(id=2))._compiled, compiled)
+        self.assertIsNot(CompiledSerializer(dict(id=2), fields=['name'])._compiled, compiled)
+        self.assertIn('street_to_native', compiled.source)
+        self.assertIn('int(value)', compiled.source)
+
+    def test_errors(self):
+        serializer = CompiledSerializer(dict(id='abc', full_name='John'))
+        self.assertRaises(serializer_tests.SerializerFieldValueError, serializer.dump)
+        self.assertIn('id', serializer.errors)
+        serializer = CompiledSerializer(dict(full_name='John'))
+        self.assertRaises(serializer_tests.SerializerFieldValueError, serializer.dump)
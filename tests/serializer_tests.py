@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime, date, time
 from collections import OrderedDict
 
-from aserializer.utils import py2to3
+from aserializer.utils import py2to3, identity_map
 from aserializer.fields import (IntegerField,
                                 UUIDField,
                                 StringField,
@@ -21,6 +21,8 @@ from aserializer.fields import (IntegerField,
                                 SerializerField,
                                 ListSerializerField,
                                 DecimalField,)
+from aserializer.utils.parsers import Parser
+from aserializer.utils.json_codecs import JSONBackend
 from aserializer.utils.registry import SerializerNotRegistered
 from aserializer import Serializer, SerializerFieldValueError
 
@@ -89,6 +91,25 @@ class SerializeTestCase(unittest.TestCase):
         self.assertIn('nest.name', names)
         self.assertEqual('nest.name', names['nest.name'])
 
+    def test_get_fieldnames_cache(self):
+        class FieldnamesSerializer(Serializer):
+            name = StringField()
+            nest = SerializerField(MySerializer.MyNestSerializer)
+
+        class ChildFieldnamesSerializer(FieldnamesSerializer):
+            number = IntegerField()
+
+        names = FieldnamesSerializer.get_fieldnames()
+        self.assertIs(names, FieldnamesSerializer.get_fieldnames())
+        self.assertEqual(FieldnamesSerializer.get_fieldname_set(), frozenset(['name', 'nest', 'nest.id', 'nest.name']))
+        self.assertIn('number', ChildFieldnamesSerializer.get_fieldname_set())
+        self.assertNotIn('number', FieldnamesSerializer.get_fieldname_set())
+
+        FieldnamesSerializer.name_to_native = lambda self, field: 'changed'
+        self.assertIsNot(names, FieldnamesSerializer.get_fieldnames())
+        self.assertEqual(FieldnamesSerializer._plan.fields['name'].to_native, 'name_to_native')
+        self.assertEqual(FieldnamesSerializer(dict(name='name')).dump()['name'], 'changed')
+
     def test_get_fields_and_exclude_for_nested(self):
         s = MySerializer(source=MyObject(), fields=['nest.id', 'nest.name'])
         only, exclude = s.get_fields_and_exclude_for_nested('nest')
@@ -103,6 +124,21 @@ class SerializeTestCase(unittest.TestCase):
         self.assertIn('name', exclude)
         self.assertNotIn('id', exclude)
 
+    def test_field_filter_cache(self):
+        field_filter = MySerializer.get_field_filter(fields=['name', 'nest.id'], exclude=['url'])
+        self.assertIs(field_filter, MySerializer.get_field_filter(fields=['name', 'nest.id'], exclude=['url']))
+        self.assertEqual(set(field_filter.names), set(['_type', 'id', 'name', 'nest']))
+        self.assertEqual(field_filter.nested['nest'], (['id'], None))
+        self.assertIn('name', field_filter.parser_fields)
+        self.assertIsNot(field_filter, TestFlatSerializer.get_field_filter(fields=['name', 'nest.id'], exclude=['url']))
+
+    def test_field_filter_without_filter(self):
+        field_filter = MySerializer.get_field_filter()
+        self.assertIsNone(field_filter.names)
+        self.assertIn('dt', field_filter.parser_fields)
+        self.assertIn('date_var', field_filter.parser_fields)
+        self.assertEqual(field_filter.nested['nest'], (None, None))
+
     def test_filter_only_fields(self):
         s = MySerializer(source=MyObject())
         only_fields = ['name', 'nest.id', 'nest.name']
@@ -214,6 +250,55 @@ class SerializerParserTests(unittest.TestCase):
         self.assertNotIn('amethod', names)
         self.assertNotIn('__init__', names)
 
+    def test_object_attribute_names_match_dir(self):
+        class Base(object):
+            base_value = 1
+
+            def base_method(self):
+                pass
+
+        class ObjSource(Base):
+            name = 'the name'
+            helper = staticmethod(lambda: None)
+
+            def __init__(self):
+                self.street = 'street 5'
+                self.callback = self.amethod
+                self._aproperty = 'A property'
+
+            def amethod(self):
+                pass
+
+            @classmethod
+            def aclassmethod(cls):
+                pass
+
+            @property
+            def aproperty(self):
+                return self._aproperty
+
+            @property
+            def missing(self):
+                raise AttributeError('missing')
+
+        class SlotSource(object):
+            __slots__ = ('name', 'street')
+
+            def __init__(self):
+                self.name = 'the name'
+
+        fields = ['name', 'street', 'aproperty', 'amethod', 'missing', 'unknown', '__init__']
+        for source in (ObjSource(), SlotSource()):
+            parser = Parser(fields=fields)
+            parser.initial(source)
+            names = [name for name in dir(source) if parser._attribute_name_predicate(name, with_filter=False)]
+            self.assertEqual(parser.get_attribute_names(with_filter=False), names)
+            names = [name for name in dir(source) if parser._attribute_name_predicate(name, with_filter=True)]
+            self.assertEqual(set(parser.get_attribute_names(with_filter=True)), set(names))
+        parser.initial(ObjSource())
+        self.assertEqual(set(parser.get_attribute_names(with_filter=True)),
+                         {'name', 'street', 'aproperty', 'amethod', 'missing'})
+
 
 class TestFlatSerializer(Serializer):
     _type = TypeField('test_object')
@@ -808,6 +893,10 @@ class SerializerWithListTestCase(unittest.TestCase):
         self.assertEqual(len(serializer.errors['objects']), 1)
 
 
+class NestKnownSerializer(Serializer):
+    street = StringField(required=True)
+
+
 class UnknownFieldError(unittest.TestCase):
 
     def test_known_field_dict(self):
@@ -863,6 +952,16 @@ class UnknownFieldError(unittest.TestCase):
         self.assertEqual(serializer.errors['address']['city'], 'Totally unknown.')
         self.assertNotIn('amethod', serializer.errors)
 
+    def test_map_field_and_nested_names(self):
+        class MapFieldSerializer(Serializer):
+            code = StringField(required=True, map_field='key')
+            address = SerializerField(NestKnownSerializer, required=False)
+
+        serializer = MapFieldSerializer(dict(key='HHH', other=1), unknown_error=True)
+        self.assertFalse(serializer.is_valid())
+        self.assertDictEqual(serializer.errors, {'other': 'Totally unknown.'})
+        self.assertEqual(serializer.parser.all_attributes.count('key'), 1)
+
     def test_fields_parameter(self):
         class FieldObject(object):
             def __init__(self):
@@ -1006,5 +1105,298 @@ class MetaOptionsSerializerTests(unittest.TestCase):
         self.assertDictEqual(serializer.to_dict(), to_dict)
 
 
+class SerializerInstanceFieldsTests(unittest.TestCase):
+
+    def test_instances_own_field_state(self):
+        first = MySerializer(dict(id=1, name='first', nest=dict(id=2, name='nest')))
+        second = MySerializer(dict(id=3, name='second'))
+        for name, field in MySerializer._base_fields.items():
+            self.assertIsNot(first.fields[name], field)
+            self.assertIsNot(first.fields[name], second.fields[name])
+            self.assertIs(first.fields[name]._error_messages, field._error_messages)
+        self.assertEqual(first.name, 'first')
+        self.assertEqual(second.name, 'second')
+        self.assertEqual(first.nest.name, 'nest')
+        self.assertIsNone(second.nest)
+        self.assertIsNone(MySerializer._base_fields['nest'].get_instance())
+
+
+class LazyChildSerializer(Serializer):
+    id = IntegerField(required=True, identity=True)
+    name = StringField(required=True)
+
+
+class LazyParentSerializer(Serializer):
+    name = StringField(required=True)
+    child = SerializerField(LazyChildSerializer)
+
+    class Meta:
+        lazy_nested = True
+
+
+class LazyCleanParentSerializer(LazyParentSerializer):
+
+    def child_clean_value(self, value):
+        return value
+
+
+class LazySource(object):
+
+    def __init__(self, name, child_name):
+        self.name = name
+        self.child_name = child_name
+        self.reads = 0
+
+    @property
+    def child(self):
+        self.reads += 1
+        return dict(id=1, name=self.child_name)
+
+
+class LazyNestedTests(unittest.TestCase):
+
+    def test_deferred_until_dump(self):
+        source = LazySource('parent', 'child')
+        serializer = LazyParentSerializer(source)
+        self.assertEqual(source.reads, 0)
+        self.assertEqual(serializer.name, 'parent')
+        self.assertEqual(source.reads, 0)
+        expected = dict(name='parent', child=dict(id=1, name='child'))
+        self.assertDictEqual(serializer.dump(), expected)
+        self.assertEqual(source.reads, 1)
+        self.assertTrue(serializer.is_valid())
+        self.assertDictEqual(serializer.to_dict(), expected)
+        self.assertEqual(source.reads, 1)
+
+    def test_deferred_until_validate_or_attribute(self):
+        source = LazySource('parent', 'child')
+        self.assertTrue(LazyParentSerializer(source).is_valid())
+        self.assertEqual(source.reads, 1)
+        serializer = LazyParentSerializer(source)
+        self.assertIsInstance(serializer.child, LazyChildSerializer)
+        self.assertEqual(serializer.child.name, 'child')
+        self.assertEqual(source.reads, 2)
+
+    def test_deferred_value_of_each_source(self):
+        sources = [LazySource('one', 'child one'), LazySource('two', 'child two')]
+        dumps = LazyParentSerializer.dump_many(sources)
+        self.assertEqual([dump['child']['name'] for dump in dumps], ['child one', 'child two'])
+        serializer = LazyParentSerializer(sources[0])
+        serializer.initial(dict(name='three'))
+        self.assertEqual(serializer.dump()['child']['name'], 'child one')
+
+    def test_not_deferred(self):
+        source = LazySource('parent', 'child')
+        LazyCleanParentSerializer(source)
+        self.assertEqual(source.reads, 1)
+        self.assertFalse(LazyCleanParentSerializer._plan.fields['child'].deferred)
+        self.assertTrue(LazyParentSerializer._plan.fields['child'].deferred)
+        self.assertFalse(MySerializer._plan.fields['nest'].deferred)
+
+
+class IdentityParentSerializer(Serializer):
+    name = StringField(required=True)
+    child = SerializerField(LazyChildSerializer)
+    other_child = SerializerField(LazyChildSerializer)
+    child_id = SerializerField(LazyChildSerializer, exclude=['name'])
+    children = ListSerializerField('IdentityParentSerializer', required=False)
+
+    class Meta:
+        identity_map = True
+
+
+class IdentityMapTests(unittest.TestCase):
+
+    def test_repeated_objects(self):
+        child = dict(id=1, name='child')
+        source = dict(name='parent', child=child, other_child=child, child_id=child,
+                      children=[dict(name='one', child=child), dict(name='two', child=dict(id=1, name='child'))])
+        dump = IdentityParentSerializer(source).dump()
+        self.assertIs(dump['child'], dump['other_child'])
+        self.assertIs(dump['child'], dump['children'][0]['child'])
+        self.assertIsNot(dump['child'], dump['children'][1]['child'])
+        self.assertDictEqual(dump['child_id'], dict(id=1))
+        self.assertDictEqual(dump['children'][1]['child'], dict(id=1, name='child'))
+        self.assertIsNone(identity_map.get_identities())
+
+    def test_same_output(self):
+        child = dict(id=1, name='child')
+        source = dict(name='parent', child=child, other_child=child, child_id=child, children=[dict(name='one')])
+        expected = dict(name='parent', child=dict(id=1, name='child'), other_child=dict(id=1, name='child'),
+                        child_id=dict(id=1), children=[dict(name='one', child=None, other_child=None,
+                                                            child_id=None, children=[])])
+        self.assertDictEqual(IdentityParentSerializer(source).dump(), expected)
+        self.assertDictEqual(json.loads(IdentityParentSerializer(source).to_json()), expected)
+
+
+class SerializerManyTests(unittest.TestCase):
+
+    def test_dump_many(self):
+        sources = [
+            dict(name='John', last_name='Doe', street='Street', city='Big Pie', country='Germany'),
+            MetaTestSerializer(dict(name='Jane', city='Small Pie')).to_dict(),
+            dict(name='Max'),
+        ]
+        self.assertListEqual(MetaTestSerializer.dump_many(sources),
+                             [MetaTestSerializer(source).dump() for source in sources])
+        self.assertListEqual(MetaTestSerializer.to_dict_many(sources),
+                             [MetaTestSerializer(source).to_dict() for source in sources])
+
+    def test_values_do_not_leak_between_sources(self):
+        dumps = MetaTestSerializer.dump_many([dict(name='John', city='Big Pie'), dict(name='Jane')])
+        self.assertEqual(dumps[0]['city'], 'Big Pie')
+        self.assertEqual(dumps[1]['city'], '')
+        self.assertIsNot(dumps[0], dumps[1])
+
+    def test_dump_many_fields_and_exclude(self):
+        sources = [MyObject(), MyObject()]
+        dumps = MySerializer.dump_many(sources, fields=['name', 'nest.name'], exclude=['_type'])
+        self.assertEqual(len(dumps), 2)
+        for dump in dumps:
+            self.assertDictEqual(dump, MySerializer(MyObject(), fields=['name', 'nest.name'], exclude=['_type']).dump())
+            self.assertNotIn('url', dump)
+            self.assertDictEqual(dump['nest'], {'id': 123, 'name': u'my nest object'})
+
+    def test_iter_json_many(self):
+        sources = [dict(name='John', city='Big Pie'), dict(name='Jane'), dict(name='Max', country='Germany')]
+        for indent in (None, 4):
+            self.assertEqual(''.join(MetaTestSerializer.iter_json_many(sources, indent=indent)),
+                             json.dumps(MetaTestSerializer.dump_many(sources), indent=indent))
+        self.assertEqual(''.join(MetaTestSerializer.iter_json_many([])), '[]')
+        serializer = MetaTestSerializer(sources[0])
+        self.assertEqual(''.join(serializer.iter_json(indent=2)), serializer.to_json(indent=2))
+
+    def test_reset(self):
+        serializer = MetaTestSerializer(dict(name='John', city='Big Pie'), fields=['name', 'city'])
+        serializer.reset(dict(name='Jane'))
+        self.assertDictEqual(serializer.dump(), dict(name='Jane', city=''))
+        self.assertEqual(serializer.name, 'Jane')
+
+    def test_build_many(self):
+        sources = [dict(name='John', city='Big Pie'), dict(name='Jane'), dict(city='Small Pie')]
+        serializers = MetaTestSerializer.build_many(sources, fields=['name', 'city'])
+        self.assertEqual(len(serializers), 3)
+        for serializer, source in zip(serializers, sources):
+            expected = MetaTestSerializer(source, fields=['name', 'city'])
+            self.assertDictEqual(serializer.dump(), expected.dump())
+            self.assertEqual(serializer.is_valid(), expected.is_valid())
+            self.assertEqual(list(serializer.fields), list(expected.fields))
+        self.assertIs(serializers[0]._field_filter, serializers[1]._field_filter)
+        self.assertIsNot(serializers[0].parser, serializers[1].parser)
+        self.assertIsNot(serializers[0].fields['name'], serializers[1].fields['name'])
+        self.assertIs(serializers[0].fields['name'], serializers[0]._data['name'])
+        self.assertEqual(MetaTestSerializer.build_many([]), [])
+
+    def test_build_many_own_init(self):
+        class InitSerializer(MetaTestSerializer):
+            def __init__(self, *args, **kwargs):
+                super(InitSerializer, self).__init__(*args, **kwargs)
+                self.created = True
+
+        serializers = InitSerializer.build_many([dict(name='John')])
+        self.assertTrue(serializers[0].created)
+        self.assertEqual(serializers[0].name, 'John')
+
+    def test_many_unknown_error(self):
+        def unknown_errors(sources):
+            return [not serializer.is_valid() and serializer.error_messages['unknown'] in serializer.errors.values()
+                    for serializer in MetaTestSerializer._iter_many(sources, unknown_error=True)]
+
+        sources = [dict(name='John'), dict(name='Jane', unknown='value'), dict(city='Big Pie')]
+        self.assertListEqual(unknown_errors(sources), [False, True, False])
+        self.assertListEqual(unknown_errors(sources[1:] + [dict(other='value')]), [True, False, True])
+        self.assertListEqual(MetaTestSerializer.dump_many(sources, unknown_error=True),
+                             [MetaTestSerializer(source, unknown_error=True).dump() for source in sources])
+
+    def test_many_own_init(self):
+        class TagSerializer(MetaTestSerializer):
+            def __init__(self, source=None, *args, **kwargs):
+                super(TagSerializer, self).__init__(source, *args, **kwargs)
+                if source is not None:
+                    self.name = source['tag']
+
+        sources = [dict(tag='A'), dict(tag='B'), dict(tag='C')]
+        self.assertListEqual([dump['name'] for dump in TagSerializer.dump_many(sources)], ['A', 'B', 'C'])
+        self.assertListEqual([item['name'] for item in TagSerializer.to_dict_many(sources)], ['A', 'B', 'C'])
+
+
+class SerializerPlanTests(unittest.TestCase):
+
+    def test_hooks(self):
+        plan = CustomValueMethods.TestSerializerTwo._plan
+        self.assertEqual(plan.fields['street'].to_native, 'street_to_native')
+        self.assertEqual(plan.fields['street'].to_python, 'street_to_python')
+        self.assertIsNone(plan.fields['street'].clean_value)
+        self.assertIsNone(plan.fields['_type'].to_native)
+        self.assertEqual(CustomValueMethods.TestSerializerOne._plan.clean_value_hooks,
+                         {'street': 'street_clean_value'})
+
+    def test_validate_hooks_with_map_field(self):
+        plan = CustomValidationSerializer._plan
+        self.assertEqual(plan.fields['code'].validate, ('code_validate',))
+        self.assertEqual(plan.fields['name'].validate, ('foo_validate',))
+        self.assertEqual(plan.fields['name'].python_name, 'foo')
+
+    def test_action_field(self):
+        plan = TestFlatSerializer._plan
+        self.assertTrue(plan.fields['action'].action_field)
+        self.assertFalse(plan.fields['name'].action_field)
+
+    def test_inherited_hooks(self):
+        class ChildSerializer(CustomValueMethods.TestSerializerTwo):
+            number = IntegerField(required=False)
+
+            def number_to_native(self, field):
+                return 42
+
+        plan = ChildSerializer._plan
+        self.assertEqual(plan.fields['street'].to_native, 'street_to_native')
+        self.assertEqual(plan.fields['number'].to_native, 'number_to_native')
+        self.assertEqual(ChildSerializer(dict(street='street', number=1)).dump()['number'], 42)
+
+
+class CountingJSONBackend(JSONBackend):
+    name = 'counting'
+
+    def __init__(self):
+        super(CountingJSONBackend, self).__init__()
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, s):
+        self.loads_calls += 1
+        return super(CountingJSONBackend, self).loads(s)
+
+    def dumps(self, obj, indent=None):
+        self.dumps_calls += 1
+        return super(CountingJSONBackend, self).dumps(obj, indent=indent)
+
+
+class SerializerJSONBackendTests(unittest.TestCase):
+
+    def test_bytes_source(self):
+        source = json.dumps(dict(name=u'J\xf6hn', city='Big Pie')).encode('utf-8')
+        serializer = MetaTestSerializer(source)
+        self.assertEqual(serializer.dump()['name'], u'J\xf6hn')
+        self.assertEqual(serializer.dump()['city'], 'Big Pie')
+
+    def test_meta_json_backend(self):
+        backend = CountingJSONBackend()
+
+        class BackendSerializer(Serializer):
+            name = StringField(required=True)
+            number = IntegerField(required=True)
+
+            class Meta:
+                json_backend = backend
+
+        serializer = BackendSerializer('{"name": "John"}')
+        self.assertEqual(backend.loads_calls, 1)
+        self.assertDictEqual(json.loads(serializer.to_json()), dict(name='John', number=None))
+        self.assertIn('number', json.loads(serializer.errors_to_json()))
+        self.assertEqual(backend.dumps_calls, 2)
+        self.assertIsNone(MetaTestSerializer._meta.json_backend)
+
+
 if __name__ == '__main__':
     unittest.main()
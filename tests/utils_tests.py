@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+
+from aserializer import Serializer, IntegerField, StringField
+from aserializer.fields import HIDE_FIELD, SerializerField
+from aserializer.utils import profiling
+from aserializer.utils.cache import LRUCache
+from aserializer.utils.json_codecs import (JSONBackend, get_backend, get_default_backend, set_default_backend,
+                                           register_backend, available_backends)
+
+
+class LRUCacheTests(unittest.TestCase):
+
+    def test_get_set(self):
+        cache = LRUCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('b', 2), 2)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_least_recently_used_is_dropped(self):
+        cache = LRUCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIn('a', cache)
+        self.assertIn('c', cache)
+        self.assertNotIn('b', cache)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.set('a', 1)
+        cache.get('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class UnavailableJSONBackend(JSONBackend):
+    name = 'unavailable'
+
+    def load_module(self):
+        raise ImportError('unavailable')
+
+
+class JSONBackendTests(unittest.TestCase):
+
+    def test_default_backend(self):
+        self.assertEqual(get_default_backend(), 'json')
+        backend = get_backend()
+        self.assertIsInstance(backend, JSONBackend)
+        self.assertIs(get_backend('json'), backend)
+        self.assertEqual(backend.loads(b'{"a": 1}'), {'a': 1})
+        self.assertEqual(backend.dumps({'a': 1}), json.dumps({'a': 1}))
+
+    def test_unknown_backend(self):
+        self.assertRaises(ValueError, get_backend, 'unknown')
+        self.assertRaises(ValueError, set_default_backend, 'unknown')
+
+    def test_unavailable_backend_falls_back_to_json(self):
+        register_backend(UnavailableJSONBackend)
+        self.assertNotIn('unavailable', available_backends())
+        self.assertIs(type(get_backend('unavailable')), JSONBackend)
+        self.assertIn(get_backend('auto').name, available_backends())
+
+    def test_backend_instance(self):
+        backend = JSONBackend()
+        self.assertIs(get_backend(backend), backend)
+
+    def test_available_backends_round_trip(self):
+        data = {'name': 'the name', 'items': [1, 2.5, None, True], 'nest': {'a': u'\xe4'}}
+        for name in available_backends():
+            backend = get_backend(name)
+            self.assertEqual(backend.loads(backend.dumps(data)), data)
+            self.assertEqual(json.loads(backend.dumps(data, indent=4)), data)
+            self.assertEqual(backend.loads(json.dumps(data).encode('utf-8')), data)
+            self.assertRaises(ValueError, backend.loads, '{invalid')
+
+
+class ProfiledSerializer(Serializer):
+    number = IntegerField(required=True, max_value=10)
+    name = StringField(required=False, on_null=HIDE_FIELD)
+
+
+class ProfiledParentSerializer(Serializer):
+    child = SerializerField(ProfiledSerializer)
+
+    class Meta:
+        lazy_nested = True
+
+
+class ProfilingTests(unittest.TestCase):
+
+    def setUp(self):
+        profiling.reset()
+        profiling.enable()
+        self.addCleanup(profiling.reset)
+        self.addCleanup(profiling.disable)
+
+    def test_snapshot(self):
+        serializer = ProfiledSerializer(dict(number=12))
+        self.assertFalse(serializer.is_valid())
+        serializer.dump()
+        serializer.to_dict()
+        serializer.reset(dict(number=5, name='the name'))
+        serializer.dump()
+        stats = profiling.snapshot()[profiling.get_serializer_key(ProfiledSerializer)]
+        self.assertEqual(stats['number']['set_value']['calls'], 2)
+        self.assertEqual(stats['number']['validate']['calls'], 1)
+        self.assertEqual(stats['number']['validate']['SerializerFieldValueError'], 1)
+        self.assertEqual(stats['number']['to_native']['calls'], 2)
+        self.assertEqual(stats['number']['to_python']['calls'], 1)
+        self.assertEqual(stats['name']['to_native']['calls'], 2)
+        self.assertEqual(stats['name']['to_native']['IgnoreField'], 1)
+        self.assertEqual(stats['name']['set_value']['calls'], 1)
+        self.assertGreaterEqual(stats['number']['to_native']['time'], 0.0)
+
+    def test_deferred_nested_serializers(self):
+        for _ in range(3):
+            ProfiledParentSerializer(dict(child=dict(number=1)))
+        ProfiledParentSerializer(dict(child=dict(number=1))).dump()
+        stats = profiling.snapshot()[profiling.get_serializer_key(ProfiledParentSerializer)]['child']
+        self.assertEqual(stats['defer_value']['calls'], 4)
+        self.assertEqual(stats['resolve_value']['calls'], 1)
+        self.assertEqual(stats['set_value']['calls'], 1)
+        self.assertNotIn('defer_value', profiling.snapshot()[profiling.get_serializer_key(ProfiledSerializer)])
+
+    def test_disabled(self):
+        profiling.disable()
+        serializer = ProfiledSerializer(dict(number=5))
+        serializer.dump()
+        self.assertEqual(profiling.snapshot(), {})
+        self.assertNotIn('to_native', serializer.fields['number'].__dict__)
+
+    def test_reset(self):
+        ProfiledSerializer(dict(number=5)).dump()
+        self.assertTrue(profiling.snapshot())
+        profiling.reset()
+        self.assertEqual(profiling.snapshot(), {})